@@ -10,5 +10,8 @@ This package contains specialized data loaders for different geospatial data for
 from .modis_loader import ModisDataLoader
 from .merra_loader import MerraDataLoader
 from .alos_loader import AlosDataLoader
+from .cache import FileResultCache
+from .vegetation_index import VegetationIndexEngine
+from .catalog import DataCatalog
 
-__all__ = ['ModisDataLoader', 'MerraDataLoader', 'AlosDataLoader']
+__all__ = ['ModisDataLoader', 'MerraDataLoader', 'AlosDataLoader', 'FileResultCache', 'VegetationIndexEngine', 'DataCatalog']
@@ -10,7 +10,7 @@ import json
 import logging
 import zipfile
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import rasterio
 from rasterio.crs import CRS
 import geopandas as gpd
@@ -18,8 +18,20 @@ from shapely.geometry import box
 import xml.etree.ElementTree as ET
 from PIL import Image
 
+from .cache import FileResultCache
+from .raster_stats import compute_band_statistics, compute_approximate_band_statistics, STATS_MODES
+
 logger = logging.getLogger(__name__)
 
+# Response key, sub-directory, pattern and label of each ALOS file kind
+FILE_KINDS = {
+    "tif": ("tif_files", "tif", "*.tif", "TIF"),
+    "kmz": ("kmz_files", "kmz", "*.kmz", "KMZ"),
+    "xml": ("xml_files", "xml", "*.xml", "XML"),
+    "image": ("image_files", "image", "*.jpg", "image"),
+    "geo": ("geo_files", "geo", "*.wld", "GEO")
+}
+
 class AlosDataLoader:
     """
     Data loader for ALOS PALSAR terrain data files.
@@ -28,52 +40,149 @@ class AlosDataLoader:
     including TIF, KMZ, XML, JPG, and WLD files to extract geospatial information.
     """
     
-    def __init__(self, data_path: str = "Data/ALOS PALSAR High Resolution Radiometric Terrain"):
+    def __init__(self, data_path: str = "Data/ALOS PALSAR High Resolution Radiometric Terrain",
+                 cache_dir: Optional[str] = "cache/loaders", stats_workers: int = 2,
+                 stats_mode: str = "exact"):
         """
         Initialize the ALOS PALSAR data loader.
         
         Args:
             data_path (str): Path to the ALOS PALSAR data directory
+            cache_dir (str): Directory for cached per-file results, or None for memory only
+            stats_workers (int): Threads used to stream raster blocks when computing band statistics
+            stats_mode (str): Default band statistics mode ('exact' or 'approximate')
         """
         self.data_path = Path(data_path)
         self.description_file = self.data_path / "description.json"
+        self.cache = FileResultCache("alos", cache_dir)
+        self.stats_workers = stats_workers
+        self.stats_mode = stats_mode
         
-    def load_data(self) -> Dict[str, Any]:
+    def load_data(self, stats_mode: Optional[str] = None) -> Dict[str, Any]:
         """
         Load and process all ALOS PALSAR files in the data directory.
         
+        Args:
+            stats_mode (str): Band statistics mode, 'exact' (full-resolution pass) or
+                'approximate' (overviews/decimated read); defaults to the loader's mode
+        
         Returns:
             Dict containing processed ALOS PALSAR data with geospatial information
         """
+        stats_mode = stats_mode or self.stats_mode
+        if stats_mode not in STATS_MODES:
+            raise ValueError(f"Invalid stats mode '{stats_mode}'. Must be one of: {', '.join(STATS_MODES)}")
+        
         try:
-            logger.info(f"Loading ALOS PALSAR data from {self.data_path}")
-            
-            # Load description
-            description = self._load_description()
+            logger.info(f"Loading ALOS PALSAR data from {self.data_path} ({stats_mode} statistics)")
             
             # Process different file types
-            processed_data = {
-                "tif_files": self._process_tif_files(),
-                "kmz_files": self._process_kmz_files(),
-                "xml_files": self._process_xml_files(),
-                "image_files": self._process_image_files(),
-                "geo_files": self._process_geo_files()
-            }
+            files = self.list_files(stats_mode)
+            outcomes = self.cache.get_or_compute_many(files, self.process_files)
             
-            # Calculate summary statistics
-            total_files = sum(len(files) for files in processed_data.values())
+            entries = []
+            for (kind, file_path, _), outcome in zip(files, outcomes):
+                if isinstance(outcome, Exception):
+                    outcome = self.failure_result(kind, file_path, str(outcome))
+                entries.append((kind, outcome))
             
-            return {
-                "description": description,
-                "file_types": processed_data,
-                "total_files": total_files,
-                "data_type": "ALOS PALSAR High Resolution Radiometric Terrain"
-            }
+            return self.build_response(entries, stats_mode)
             
         except Exception as e:
             logger.error(f"Error loading ALOS PALSAR data: {str(e)}")
             raise
     
+    def list_files(self, stats_mode: Optional[str] = None) -> List[Tuple[str, Path, str]]:
+        """
+        List the source files handled by this loader.
+        
+        Args:
+            stats_mode (str): Band statistics mode; it is the variant of TIF files
+            
+        Returns:
+            List of (kind, path, variant) tuples
+        """
+        stats_mode = stats_mode or self.stats_mode
+        files = []
+        for kind, (_, directory, pattern, label) in FILE_KINDS.items():
+            kind_dir = self.data_path / directory
+            if not kind_dir.exists():
+                logger.warning(f"{label} directory not found")
+                continue
+            variant = stats_mode if kind == "tif" else ""
+            files.extend((kind, file_path, variant) for file_path in sorted(kind_dir.glob(pattern)))
+        return files
+    
+    def process_files(self, files: List[Tuple[str, Path, str]]) -> List[Any]:
+        """
+        Process a batch of files of any kind.
+        
+        Args:
+            files: (kind, path, variant) tuples from list_files()
+            
+        Returns:
+            List with, per file, its result dict or the exception raised for it
+        """
+        processors = {
+            "tif": self._process_tif_file,
+            "kmz": lambda path, _: self._process_kmz_file(path),
+            "xml": lambda path, _: self._process_xml_file(path),
+            "image": lambda path, _: self._process_image_file(path),
+            "geo": lambda path, _: self._process_geo_file(path)
+        }
+        
+        results = []
+        for kind, file_path, variant in files:
+            try:
+                results.append(processors[kind](file_path, variant))
+                logger.info(f"Successfully processed {FILE_KINDS[kind][3]} file: {file_path.name}")
+            except Exception as e:
+                logger.error(f"Error processing {FILE_KINDS[kind][3]} file {file_path.name}: {str(e)}")
+                results.append(e)
+        return results
+    
+    def failure_result(self, kind: str, file_path: Path, error_msg: str) -> Optional[Dict[str, Any]]:
+        """
+        Describe a file that could not be processed; unreadable files are left out.
+        
+        Args:
+            kind (str): File kind from list_files()
+            file_path (Path): Path to the file
+            error_msg (str): Error message explaining why processing failed
+            
+        Returns:
+            None, so the file is skipped
+        """
+        return None
+    
+    def build_response(self, entries: List[Tuple[str, Optional[Dict[str, Any]]]],
+                       stats_mode: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Assemble the load_data() response from per-file results.
+        
+        Args:
+            entries: (kind, result) pairs in file order; None results are skipped
+            stats_mode (str): Band statistics mode the TIF results were computed with
+            
+        Returns:
+            Dict containing processed ALOS PALSAR data with geospatial information
+        """
+        processed_data = {response_key: [] for response_key, _, _, _ in FILE_KINDS.values()}
+        for kind, result in entries:
+            if result:
+                processed_data[FILE_KINDS[kind][0]].append(result)
+        
+        # Calculate summary statistics
+        total_files = sum(len(files) for files in processed_data.values())
+        
+        return {
+            "description": self._load_description(),
+            "file_types": processed_data,
+            "total_files": total_files,
+            "statistics_mode": stats_mode or self.stats_mode,
+            "data_type": "ALOS PALSAR High Resolution Radiometric Terrain"
+        }
+    
     def _load_description(self) -> Dict[str, Any]:
         """
         Load the description.json file for ALOS PALSAR data.
@@ -91,247 +200,194 @@ class AlosDataLoader:
             logger.warning(f"Could not load description file: {str(e)}")
             return {"description": "ALOS PALSAR High Resolution Radiometric Terrain data"}
     
-    def _process_tif_files(self) -> List[Dict[str, Any]]:
+    def _process_tif_file(self, tif_file: Path, stats_mode: str = "exact") -> Dict[str, Any]:
         """
-        Process TIF files to extract geospatial information.
+        Extract geospatial information and band statistics from a single TIF file.
         
+        Args:
+            tif_file (Path): Path to the TIF file
+            stats_mode (str): Band statistics mode ('exact' or 'approximate')
+            
         Returns:
-            List of processed TIF file information
+            Dict containing TIF file information
         """
-        tif_files = []
-        tif_dir = self.data_path / "tif"
+        with rasterio.open(tif_file) as src:
+            # Extract geospatial information
+            file_info = {
+                "filename": tif_file.name,
+                "file_size": tif_file.stat().st_size,
+                "driver": src.driver,
+                "width": src.width,
+                "height": src.height,
+                "count": src.count,
+                "dtype": str(src.dtypes[0]),
+                "crs": str(src.crs) if src.crs else None,
+                "transform": src.transform.to_gdal(),
+                "bounds": src.bounds,
+                "nodata": src.nodata,
+                "attributes": dict(src.tags())
+            }
+            
+            # Calculate bounding box
+            bounds = src.bounds
+            bbox = {
+                "minx": bounds.left,
+                "miny": bounds.bottom,
+                "maxx": bounds.right,
+                "maxy": bounds.top
+            }
+            file_info["bounding_box"] = bbox
+            
+            band_shape = (src.height, src.width)
+            band_dtypes = src.dtypes
         
-        if not tif_dir.exists():
-            logger.warning("TIF directory not found")
-            return tif_files
+        if stats_mode == "approximate":
+            # Reduced-resolution read from overviews (or decimation) for previews
+            band_stats, resolution = compute_approximate_band_statistics(tif_file)
+        else:
+            # Extract band information in one streaming pass over block windows
+            band_stats = compute_band_statistics(tif_file, max_workers=self.stats_workers)
+            resolution = {
+                "statistics_mode": "exact",
+                "source": "full_resolution",
+                "resolution": list(band_shape)
+            }
+        file_info["statistics"] = resolution
         
-        for tif_file in tif_dir.glob("*.tif"):
-            try:
-                with rasterio.open(tif_file) as src:
-                    # Extract geospatial information
-                    file_info = {
-                        "filename": tif_file.name,
-                        "file_size": tif_file.stat().st_size,
-                        "driver": src.driver,
-                        "width": src.width,
-                        "height": src.height,
-                        "count": src.count,
-                        "dtype": str(src.dtypes[0]),
-                        "crs": str(src.crs) if src.crs else None,
-                        "transform": src.transform.to_gdal(),
-                        "bounds": src.bounds,
-                        "nodata": src.nodata,
-                        "attributes": dict(src.tags())
-                    }
-                    
-                    # Calculate bounding box
-                    bounds = src.bounds
-                    bbox = {
-                        "minx": bounds.left,
-                        "miny": bounds.bottom,
-                        "maxx": bounds.right,
-                        "maxy": bounds.top
-                    }
-                    file_info["bounding_box"] = bbox
-                    
-                    # Extract band information
-                    bands_info = []
-                    for i in range(1, src.count + 1):
-                        band = src.read(i)
-                        bands_info.append({
-                            "band": i,
-                            "shape": band.shape,
-                            "dtype": str(band.dtype),
-                            "min_value": float(band.min()),
-                            "max_value": float(band.max()),
-                            "mean_value": float(band.mean()),
-                            "std_value": float(band.std())
-                        })
-                    file_info["bands"] = bands_info
-                    
-                    tif_files.append(file_info)
-                    logger.info(f"Successfully processed TIF file: {tif_file.name}")
-                    
-            except Exception as e:
-                logger.error(f"Error processing TIF file {tif_file.name}: {str(e)}")
-                continue
+        bands_info = []
+        for i, stats in band_stats.items():
+            bands_info.append({
+                "band": i,
+                "shape": band_shape,
+                "dtype": str(band_dtypes[i - 1]),
+                **stats.to_dict()
+            })
+        file_info["bands"] = bands_info
         
-        return tif_files
+        return file_info
     
-    def _process_kmz_files(self) -> List[Dict[str, Any]]:
+    def _process_kmz_file(self, kmz_file: Path) -> Dict[str, Any]:
         """
-        Process KMZ files to extract geospatial information.
+        Extract the contents listing and KML preview from a single KMZ file.
         
+        Args:
+            kmz_file (Path): Path to the KMZ file
+            
         Returns:
-            List of processed KMZ file information
+            Dict containing KMZ file information
         """
-        kmz_files = []
-        kmz_dir = self.data_path / "kmz"
-        
-        if not kmz_dir.exists():
-            logger.warning("KMZ directory not found")
-            return kmz_files
+        file_info = {
+            "filename": kmz_file.name,
+            "file_size": kmz_file.stat().st_size,
+            "file_type": "KMZ"
+        }
         
-        for kmz_file in kmz_dir.glob("*.kmz"):
-            try:
-                file_info = {
-                    "filename": kmz_file.name,
-                    "file_size": kmz_file.stat().st_size,
-                    "file_type": "KMZ"
-                }
-                
-                # Extract KMZ contents
-                with zipfile.ZipFile(kmz_file, 'r') as kmz:
-                    file_list = kmz.namelist()
-                    file_info["contents"] = file_list
-                    
-                    # Look for KML files
-                    kml_files = [f for f in file_list if f.endswith('.kml')]
-                    if kml_files:
-                        # Read the first KML file
-                        kml_content = kmz.read(kml_files[0]).decode('utf-8')
-                        file_info["kml_content"] = kml_content[:1000]  # First 1000 chars
-                    
-                    # Look for image files
-                    image_files = [f for f in file_list if f.lower().endswith(('.jpg', '.jpeg', '.png'))]
-                    file_info["image_files"] = image_files
-                
-                kmz_files.append(file_info)
-                logger.info(f"Successfully processed KMZ file: {kmz_file.name}")
-                
-            except Exception as e:
-                logger.error(f"Error processing KMZ file {kmz_file.name}: {str(e)}")
-                continue
+        # Extract KMZ contents
+        with zipfile.ZipFile(kmz_file, 'r') as kmz:
+            file_list = kmz.namelist()
+            file_info["contents"] = file_list
+            
+            # Look for KML files
+            kml_files = [f for f in file_list if f.endswith('.kml')]
+            if kml_files:
+                # Read the first KML file
+                kml_content = kmz.read(kml_files[0]).decode('utf-8')
+                file_info["kml_content"] = kml_content[:1000]  # First 1000 chars
+            
+            # Look for image files
+            image_files = [f for f in file_list if f.lower().endswith(('.jpg', '.jpeg', '.png'))]
+            file_info["image_files"] = image_files
         
-        return kmz_files
+        return file_info
     
-    def _process_xml_files(self) -> List[Dict[str, Any]]:
+    def _process_xml_file(self, xml_file: Path) -> Dict[str, Any]:
         """
-        Process XML files to extract metadata.
+        Extract the element structure and text metadata from a single XML file.
         
+        Args:
+            xml_file (Path): Path to the XML file
+            
         Returns:
-            List of processed XML file information
+            Dict containing XML file information
         """
-        xml_files = []
-        xml_dir = self.data_path / "xml"
+        file_info = {
+            "filename": xml_file.name,
+            "file_size": xml_file.stat().st_size,
+            "file_type": "XML"
+        }
         
-        if not xml_dir.exists():
-            logger.warning("XML directory not found")
-            return xml_files
+        # Parse XML content
+        tree = ET.parse(xml_file)
+        root = tree.getroot()
         
-        for xml_file in xml_dir.glob("*.xml"):
-            try:
-                file_info = {
-                    "filename": xml_file.name,
-                    "file_size": xml_file.stat().st_size,
-                    "file_type": "XML"
-                }
-                
-                # Parse XML content
-                tree = ET.parse(xml_file)
-                root = tree.getroot()
-                
-                # Extract basic XML structure
-                file_info["root_tag"] = root.tag
-                file_info["root_attributes"] = dict(root.attrib)
-                file_info["child_elements"] = [child.tag for child in root]
-                
-                # Extract specific metadata if available
-                metadata = {}
-                for elem in root.iter():
-                    if elem.text and elem.text.strip():
-                        metadata[elem.tag] = elem.text.strip()
-                
-                file_info["metadata"] = metadata
-                xml_files.append(file_info)
-                logger.info(f"Successfully processed XML file: {xml_file.name}")
-                
-            except Exception as e:
-                logger.error(f"Error processing XML file {xml_file.name}: {str(e)}")
-                continue
+        # Extract basic XML structure
+        file_info["root_tag"] = root.tag
+        file_info["root_attributes"] = dict(root.attrib)
+        file_info["child_elements"] = [child.tag for child in root]
         
-        return xml_files
+        # Extract specific metadata if available
+        metadata = {}
+        for elem in root.iter():
+            if elem.text and elem.text.strip():
+                metadata[elem.tag] = elem.text.strip()
+        
+        file_info["metadata"] = metadata
+        return file_info
     
-    def _process_image_files(self) -> List[Dict[str, Any]]:
+    def _process_image_file(self, image_file: Path) -> Dict[str, Any]:
         """
-        Process image files (JPG) to extract basic information.
+        Extract basic image properties from a single JPG file.
         
+        Args:
+            image_file (Path): Path to the image file
+            
         Returns:
-            List of processed image file information
+            Dict containing image file information
         """
-        image_files = []
-        image_dir = self.data_path / "image"
-        
-        if not image_dir.exists():
-            logger.warning("Image directory not found")
-            return image_files
-        
-        for image_file in image_dir.glob("*.jpg"):
-            try:
-                with Image.open(image_file) as img:
-                    file_info = {
-                        "filename": image_file.name,
-                        "file_size": image_file.stat().st_size,
-                        "file_type": "JPG",
-                        "width": img.width,
-                        "height": img.height,
-                        "mode": img.mode,
-                        "format": img.format,
-                        "has_transparency": img.mode in ('RGBA', 'LA') or 'transparency' in img.info
-                    }
-                    
-                    # Extract EXIF data if available
-                    if hasattr(img, '_getexif') and img._getexif():
-                        file_info["exif_data"] = "Available"
-                    
-                    image_files.append(file_info)
-                    logger.info(f"Successfully processed image file: {image_file.name}")
-                    
-            except Exception as e:
-                logger.error(f"Error processing image file {image_file.name}: {str(e)}")
-                continue
-        
-        return image_files
+        with Image.open(image_file) as img:
+            file_info = {
+                "filename": image_file.name,
+                "file_size": image_file.stat().st_size,
+                "file_type": "JPG",
+                "width": img.width,
+                "height": img.height,
+                "mode": img.mode,
+                "format": img.format,
+                "has_transparency": img.mode in ('RGBA', 'LA') or 'transparency' in img.info
+            }
+            
+            # Extract EXIF data if available
+            if hasattr(img, '_getexif') and img._getexif():
+                file_info["exif_data"] = "Available"
+            
+            return file_info
     
-    def _process_geo_files(self) -> List[Dict[str, Any]]:
+    def _process_geo_file(self, geo_file: Path) -> Dict[str, Any]:
         """
-        Process GEO files (world files) to extract geospatial information.
+        Parse the affine parameters from a single world file.
         
+        Args:
+            geo_file (Path): Path to the world file
+            
         Returns:
-            List of processed GEO file information
+            Dict containing world file information
         """
-        geo_files = []
-        geo_dir = self.data_path / "geo"
-        
-        if not geo_dir.exists():
-            logger.warning("GEO directory not found")
-            return geo_files
+        file_info = {
+            "filename": geo_file.name,
+            "file_size": geo_file.stat().st_size,
+            "file_type": "WLD"
+        }
         
-        for geo_file in geo_dir.glob("*.wld"):
-            try:
-                file_info = {
-                    "filename": geo_file.name,
-                    "file_size": geo_file.stat().st_size,
-                    "file_type": "WLD"
-                }
-                
-                # Read world file content
-                with open(geo_file, 'r') as f:
-                    lines = f.readlines()
-                    if len(lines) >= 6:
-                        # World file format: pixel size, rotation, rotation, pixel size, x-coordinate, y-coordinate
-                        file_info["pixel_size_x"] = float(lines[0].strip())
-                        file_info["rotation_y"] = float(lines[1].strip())
-                        file_info["rotation_x"] = float(lines[2].strip())
-                        file_info["pixel_size_y"] = float(lines[3].strip())
-                        file_info["x_coordinate"] = float(lines[4].strip())
-                        file_info["y_coordinate"] = float(lines[5].strip())
-                
-                geo_files.append(file_info)
-                logger.info(f"Successfully processed GEO file: {geo_file.name}")
-                
-            except Exception as e:
-                logger.error(f"Error processing GEO file {geo_file.name}: {str(e)}")
-                continue
+        # Read world file content
+        with open(geo_file, 'r') as f:
+            lines = f.readlines()
+            if len(lines) >= 6:
+                # World file format: pixel size, rotation, rotation, pixel size, x-coordinate, y-coordinate
+                file_info["pixel_size_x"] = float(lines[0].strip())
+                file_info["rotation_y"] = float(lines[1].strip())
+                file_info["rotation_x"] = float(lines[2].strip())
+                file_info["pixel_size_y"] = float(lines[3].strip())
+                file_info["x_coordinate"] = float(lines[4].strip())
+                file_info["y_coordinate"] = float(lines[5].strip())
         
-        return geo_files
+        return file_info
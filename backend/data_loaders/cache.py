@@ -0,0 +1,268 @@
+"""
+Per-file result cache for the BloomTracker data loaders.
+
+This module stores the summary produced for each source file both in memory
+and on disk, keyed on the file path, modification time and size, so that
+unchanged NetCDF/TIF/KMZ/XML files are never opened twice.
+"""
+
+import os
+import json
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Callable, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Key set on a per-file result that is missing parts because reading them failed;
+# such results are returned but not cached, so the file is processed again next time
+INCOMPLETE_KEY = "incomplete"
+
+
+def _json_default(obj: Any) -> Any:
+    """
+    Convert values that the json module cannot serialize natively.
+
+    Args:
+        obj: Object that json.dumps could not handle
+
+    Returns:
+        JSON-compatible representation of the object
+    """
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, Path):
+        return str(obj)
+    return str(obj)
+
+
+class FileResultCache:
+    """
+    Invalidation-aware cache of per-file loader results.
+
+    Each entry is keyed on the resolved file path plus an optional variant
+    (e.g. a statistics mode) and is only served while the file's mtime and
+    size still match the signature recorded when the entry was computed.
+    """
+
+    def __init__(self, namespace: str, cache_dir: Optional[str] = "cache/loaders"):
+        """
+        Initialize the file result cache.
+
+        Args:
+            namespace (str): Sub-directory used to separate loaders (modis, merra, alos)
+            cache_dir (str): Root directory for on-disk entries, or None for memory only
+        """
+        self.namespace = namespace
+        self.cache_dir = Path(cache_dir) / namespace if cache_dir else None
+        self._memory: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        if self.cache_dir is not None:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                logger.warning(f"Could not create cache directory {self.cache_dir}: {str(e)}")
+                self.cache_dir = None
+
+    @staticmethod
+    def file_signature(file_path: Path) -> Dict[str, Any]:
+        """
+        Build the invalidation signature for a file.
+
+        Args:
+            file_path (Path): Path to the source file
+
+        Returns:
+            Dict containing the resolved path, mtime (ns) and size
+        """
+        stat = file_path.stat()
+        return {
+            "path": str(file_path.resolve()),
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size
+        }
+
+    def _cache_key(self, signature: Dict[str, Any], variant: str) -> str:
+        """Derive the entry key from the file path and variant."""
+        raw = f"{signature['path']}|{variant}".encode("utf-8")
+        return hashlib.sha1(raw).hexdigest()
+
+    def _entry_path(self, key: str) -> Optional[Path]:
+        """Get the on-disk location of an entry."""
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"{key}.json"
+
+    def _read_disk_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        """Read an entry from disk, ignoring missing or corrupt files."""
+        entry_path = self._entry_path(key)
+        if entry_path is None or not entry_path.exists():
+            return None
+        try:
+            with open(entry_path, 'r') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache entry {entry_path.name}: {str(e)}")
+            return None
+
+    def _write_disk_entry(self, key: str, entry: Dict[str, Any]):
+        """Atomically write an entry to disk."""
+        entry_path = self._entry_path(key)
+        if entry_path is None:
+            return
+        tmp_path = entry_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(entry, f, default=_json_default)
+            os.replace(tmp_path, entry_path)
+        except Exception as e:
+            logger.warning(f"Could not write cache entry {entry_path.name}: {str(e)}")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
+    def get(self, file_path: Path, variant: str = "") -> Optional[Dict[str, Any]]:
+        """
+        Return the cached result for a file if it is still valid.
+
+        Args:
+            file_path (Path): Path to the source file
+            variant (str): Extra key component for alternative results of the same file
+
+        Returns:
+            The cached per-file result, or None on a miss
+        """
+        signature = self.file_signature(file_path)
+        key = self._cache_key(signature, variant)
+
+        with self._lock:
+            entry = self._memory.get(key)
+        if entry is not None and entry["signature"] == signature:
+            self.hits += 1
+            return entry["result"]
+
+        entry = self._read_disk_entry(key)
+        if entry is not None and entry.get("signature") == signature:
+            with self._lock:
+                self._memory[key] = entry
+            self.disk_hits += 1
+            return entry["result"]
+
+        self.misses += 1
+        return None
+
+    def put(self, file_path: Path, result: Dict[str, Any], variant: str = "") -> Dict[str, Any]:
+        """
+        Store a freshly computed result for a file.
+
+        Args:
+            file_path (Path): Path to the source file
+            result (Dict): Per-file result
+            variant (str): Extra key component for alternative results of the same file
+
+        Returns:
+            The stored result, normalized through JSON
+        """
+        signature = self.file_signature(file_path)
+        key = self._cache_key(signature, variant)
+
+        # Normalize through JSON so memory and disk hits return identical payloads
+        result = json.loads(json.dumps(result, default=_json_default))
+        entry = {"signature": signature, "variant": variant, "result": result}
+        with self._lock:
+            self._memory[key] = entry
+        self._write_disk_entry(key, entry)
+        return result
+
+    def get_or_compute(self, file_path: Path, compute: Callable[[Path], Optional[Dict[str, Any]]],
+                       variant: str = "") -> Optional[Dict[str, Any]]:
+        """
+        Return the cached result for a file, computing it if the file changed.
+
+        Args:
+            file_path (Path): Path to the source file
+            compute (Callable): Function producing the per-file result from the path
+            variant (str): Extra key component for alternative results of the same file
+
+        Returns:
+            The per-file result, or None if compute returned None (None and incomplete results are not cached)
+        """
+        result = self.get(file_path, variant)
+        if result is not None:
+            return result
+
+        result = compute(file_path)
+        if result is None or result.get(INCOMPLETE_KEY):
+            return result
+        return self.put(file_path, result, variant)
+
+    def get_or_compute_many(self, files: List[Tuple[str, Path, str]],
+                            compute_many: Callable[[List[Tuple[str, Path, str]]], List[Any]]) -> List[Any]:
+        """
+        Resolve many files at once, computing all misses in a single batch.
+
+        Args:
+            files: (kind, path, variant) tuples as returned by a loader's list_files()
+            compute_many (Callable): Function producing one result or Exception per missed file
+
+        Returns:
+            List aligned with files holding each result, or the Exception raised for it
+            (exceptions and incomplete results are not cached)
+        """
+        results: List[Any] = [None] * len(files)
+        missed = []
+        for position, (kind, file_path, variant) in enumerate(files):
+            cached = self.get(file_path, variant)
+            if cached is not None:
+                results[position] = cached
+            else:
+                missed.append(position)
+
+        if missed:
+            computed = compute_many([files[position] for position in missed])
+            for position, outcome in zip(missed, computed):
+                if isinstance(outcome, Exception) or outcome is None or outcome.get(INCOMPLETE_KEY):
+                    results[position] = outcome
+                else:
+                    results[position] = self.put(files[position][1], outcome, files[position][2])
+        return results
+
+    def clear(self):
+        """Drop all in-memory and on-disk entries for this namespace."""
+        with self._lock:
+            self._memory.clear()
+        if self.cache_dir is not None:
+            for entry_path in self.cache_dir.glob("*.json"):
+                try:
+                    entry_path.unlink()
+                except OSError as e:
+                    logger.warning(f"Could not remove cache entry {entry_path.name}: {str(e)}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache usage statistics.
+
+        Returns:
+            Dict containing entry count and hit/miss counters
+        """
+        with self._lock:
+            entries = len(self._memory)
+        return {
+            "namespace": self.namespace,
+            "memory_entries": entries,
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "cache_dir": str(self.cache_dir) if self.cache_dir else None
+        }
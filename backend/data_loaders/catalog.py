@@ -0,0 +1,394 @@
+"""
+On-disk catalog of the files behind every BloomTracker data source.
+
+This module keeps one SQLite row per source file with its signature,
+checksum, CRS, bounds, dimensions, time range, statistics and the loader's
+full per-file result. Refreshing a source only stats the files on disk and
+reprocesses the ones that were added or changed (and, after a retry interval,
+the ones that failed or were only partly read), so /data/* responses are
+assembled from the index without reopening unchanged files.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+from .cache import _json_default, INCOMPLETE_KEY
+
+logger = logging.getLogger(__name__)
+
+CATALOG_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    source TEXT NOT NULL,
+    path TEXT NOT NULL,
+    variant TEXT NOT NULL DEFAULT '',
+    kind TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    checksum TEXT,
+    status TEXT NOT NULL,
+    error TEXT,
+    crs TEXT,
+    bounds TEXT,
+    dims TEXT,
+    time_start TEXT,
+    time_end TEXT,
+    statistics TEXT,
+    summary TEXT,
+    indexed_at REAL NOT NULL,
+    PRIMARY KEY (source, path, variant)
+);
+CREATE INDEX IF NOT EXISTS files_by_source ON files (source, variant);
+"""
+
+CHECKSUM_BLOCK_SIZE = 1 << 20
+
+
+def file_checksum(file_path: Path) -> str:
+    """
+    Compute the SHA-256 checksum of a file, streaming it in 1 MiB blocks.
+
+    Args:
+        file_path (Path): Path to the file
+
+    Returns:
+        str: Hex digest
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(CHECKSUM_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _stat_summary(stats: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the summary statistics of a band/layer/variable entry."""
+    return {key: stats.get(key) for key in ("min_value", "max_value", "mean_value", "std_value")
+            if key in stats}
+
+
+def describe_file(source: str, kind: str, result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Extract the catalog metadata columns from a loader's per-file result.
+
+    Args:
+        source (str): Data source name (modis, merra, alos)
+        kind (str): File kind reported by the loader
+        result (Dict): The loader's per-file result
+
+    Returns:
+        Dict with crs, bounds, dims, time_start, time_end and statistics (any may be None)
+    """
+    metadata = {"crs": None, "bounds": None, "dims": None, "time_start": None, "time_end": None,
+                "statistics": None}
+
+    if source == "modis":
+        file_info = result.get("file_info", {})
+        layers = result.get("vegetation_indices", {})
+        metadata["time_start"] = metadata["time_end"] = file_info.get("date")
+        if layers:
+            metadata["dims"] = next(iter(layers.values())).get("shape")
+            metadata["statistics"] = {name: _stat_summary(layer) for name, layer in layers.items()}
+
+    elif source == "merra":
+        file_info = result.get("file_info", {})
+        spatial = result.get("spatial_info", {})
+        lat = spatial.get("lat") or spatial.get("latitude")
+        lon = spatial.get("lon") or spatial.get("longitude")
+        if lat and lon:
+            metadata["bounds"] = {"minx": lon.get("min_value"), "miny": lat.get("min_value"),
+                                  "maxx": lon.get("max_value"), "maxy": lat.get("max_value")}
+            metadata["crs"] = "EPSG:4326"
+        metadata["dims"] = file_info.get("dimensions")
+        for time_info in result.get("temporal_info", {}).values():
+            metadata["time_start"] = time_info.get("min_value")
+            metadata["time_end"] = time_info.get("max_value")
+            break
+        metadata["statistics"] = {
+            name: _stat_summary(variable) for name, variable in result.get("climate_variables", {}).items()
+        }
+
+    elif source == "alos" and kind == "tif":
+        metadata["crs"] = result.get("crs")
+        metadata["bounds"] = result.get("bounding_box")
+        metadata["dims"] = [result.get("height"), result.get("width"), result.get("count")]
+        metadata["statistics"] = {
+            str(band["band"]): _stat_summary(band) for band in result.get("bands", [])
+        }
+
+    elif source == "alos" and kind == "image":
+        metadata["dims"] = [result.get("height"), result.get("width")]
+
+    return metadata
+
+
+class DataCatalog:
+    """
+    Incrementally refreshed SQLite index of per-file loader results.
+
+    Loaders plug in through four methods: list_files(**options) returning
+    (kind, path, variant) tuples, process_files(files) returning a result or
+    exception per file, failure_result(kind, path, error) and
+    build_response(entries, **options).
+    """
+
+    def __init__(self, loaders: Dict[str, Any], db_path: str = "cache/catalog.sqlite",
+                 min_refresh_interval: float = 5.0, checksums: bool = True, retry_interval: float = 30.0):
+        """
+        Initialize the data catalog.
+
+        Args:
+            loaders (Dict[str, Any]): Data source name to loader instance
+            db_path (str): Location of the SQLite index
+            min_refresh_interval (float): Seconds during which a refreshed source is served
+                straight from the index without re-statting its files
+            checksums (bool): Record a SHA-256 checksum for every new or changed file
+            retry_interval (float): Seconds before an unchanged file that failed or was only
+                partly read is processed again
+        """
+        self.loaders = loaders
+        self.db_path = Path(db_path)
+        self.min_refresh_interval = min_refresh_interval
+        self.checksums = checksums
+        self.retry_interval = retry_interval
+        self._source_locks = {source: threading.Lock() for source in loaders}
+        # (source, options) -> (refresh time, listed (kind, path, variant) keys)
+        self._listings: Dict[Tuple[str, str], Tuple[float, List[Tuple[str, str, str]]]] = {}
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(CATALOG_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection; WAL lets request threads read while a refresh writes."""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @staticmethod
+    def _options_key(options: Dict[str, Any]) -> str:
+        """Serialize loader options into a stable key."""
+        return json.dumps(options, sort_keys=True, default=str)
+
+    def refresh(self, source: str, force: bool = False, **options) -> Dict[str, int]:
+        """
+        Bring the index for a source up to date with the files on disk.
+
+        Args:
+            source (str): Data source name
+            force (bool): Reprocess every file, not only new or changed ones
+            **options: Loader options forwarded to list_files (e.g. stats_mode)
+
+        Unchanged files whose last attempt failed or was incomplete are retried
+        once retry_interval has passed. Rows are removed when their file is no
+        longer listed, or when their variant (e.g. an old QA configuration) is
+        not listed under these or any other options refreshed in this process.
+
+        Returns:
+            Dict counting added, updated, removed and unchanged files
+        """
+        loader = self.loaders[source]
+        with self._source_locks[source]:
+            files = loader.list_files(**options)
+            listed = [(kind, str(file_path.resolve()), variant) for kind, file_path, variant in files]
+
+            with self._connect() as conn:
+                indexed_rows = conn.execute("SELECT path, variant, size, mtime_ns, status, indexed_at FROM files "
+                                            "WHERE source = ?", (source,)).fetchall()
+            indexed = {(path, variant): (size, mtime_ns) for path, variant, size, mtime_ns, _, _ in indexed_rows}
+            # Failures are never final (they may be transient or a missing reader): retry them after a while
+            now = time.time()
+            retry = {(path, variant) for path, variant, _, _, status, indexed_at in indexed_rows
+                     if status in ("error", "partial") and now - indexed_at >= self.retry_interval}
+
+            changed = []
+            signatures = {}
+            for (kind, file_path, variant), (_, path, _) in zip(files, listed):
+                stat = file_path.stat()
+                signatures[(path, variant)] = (stat.st_size, stat.st_mtime_ns)
+                if (force or (path, variant) in retry
+                        or indexed.get((path, variant)) != signatures[(path, variant)]):
+                    changed.append((kind, file_path, variant))
+
+            options_key = self._options_key(options)
+            live = {(path, variant) for _, path, variant in listed}
+            for (listed_source, listed_options), (_, other) in self._listings.items():
+                if listed_source == source and listed_options != options_key:
+                    live.update((path, variant) for _, path, variant in other)
+            removed = [key for key in indexed if key not in live]
+
+            rows = []
+            if changed:
+                logger.info(f"Catalog: indexing {len(changed)} new or changed {source} file(s)")
+                outcomes = loader.cache.get_or_compute_many(changed, loader.process_files)
+                for (kind, file_path, variant), outcome in zip(changed, outcomes):
+                    rows.append(self._build_row(source, kind, file_path, variant, outcome,
+                                                signatures[(str(file_path.resolve()), variant)]))
+
+            with self._connect() as conn:
+                if removed:
+                    conn.executemany("DELETE FROM files WHERE source = ? AND path = ? AND variant = ?",
+                                     [(source, path, variant) for path, variant in removed])
+                if rows:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO files (source, path, variant, kind, size, mtime_ns, checksum, "
+                        "status, error, crs, bounds, dims, time_start, time_end, statistics, summary, indexed_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        rows
+                    )
+
+            self._listings[(source, options_key)] = (time.monotonic(), listed)
+
+            added = sum(1 for _, file_path, variant in changed
+                        if (str(file_path.resolve()), variant) not in indexed)
+            return {
+                "added": added,
+                "updated": len(changed) - added,
+                "removed": len(removed),
+                "unchanged": len(files) - len(changed)
+            }
+
+    def _build_row(self, source: str, kind: str, file_path: Path, variant: str, outcome: Any,
+                   signature: Tuple[int, int]) -> Tuple:
+        """Turn a processed file into a row of the files table."""
+        def encode(value: Any) -> Optional[str]:
+            return json.dumps(value, default=_json_default) if value is not None else None
+
+        if isinstance(outcome, Exception) or outcome is None:
+            status, error, summary = "error", str(outcome) if outcome is not None else "No result", None
+            metadata = describe_file(source, kind, {})
+        else:
+            status, error, summary = "partial" if outcome.get(INCOMPLETE_KEY) else "ok", None, outcome
+            metadata = describe_file(source, kind, outcome)
+
+        checksum = None
+        if self.checksums:
+            try:
+                checksum = file_checksum(file_path)
+            except OSError as e:
+                logger.warning(f"Could not checksum {file_path.name}: {str(e)}")
+
+        size, mtime_ns = signature
+        return (
+            source, str(file_path.resolve()), variant, kind, size, mtime_ns, checksum, status, error,
+            metadata["crs"], encode(metadata["bounds"]), encode(metadata["dims"]),
+            metadata["time_start"], metadata["time_end"], encode(metadata["statistics"]),
+            encode(summary), time.time()
+        )
+
+    def load(self, source: str, **options) -> Dict[str, Any]:
+        """
+        Build a source's load_data() response from the index.
+
+        The source is refreshed first unless it was refreshed with the same
+        options less than min_refresh_interval seconds ago.
+
+        Args:
+            source (str): Data source name
+            **options: Loader options (e.g. stats_mode) forwarded to list_files and build_response
+
+        Returns:
+            Dict in the same shape as the loader's load_data()
+        """
+        loader = self.loaders[source]
+        key = (source, self._options_key(options))
+        listing = self._listings.get(key)
+        if listing is None or time.monotonic() - listing[0] >= self.min_refresh_interval:
+            self.refresh(source, **options)
+            listing = self._listings[key]
+        listed = listing[1]
+
+        with self._connect() as conn:
+            indexed = {
+                (path, variant): (status, error, summary)
+                for path, variant, status, error, summary in conn.execute(
+                    "SELECT path, variant, status, error, summary FROM files WHERE source = ?", (source,))
+            }
+
+        entries = []
+        for kind, path, variant in listed:
+            row = indexed.get((path, variant))
+            if row is None:
+                continue
+            status, error, summary = row
+            if status in ("ok", "partial"):
+                entries.append((kind, json.loads(summary)))
+            else:
+                entries.append((kind, loader.failure_result(kind, Path(path), error)))
+
+        return loader.build_response(entries, **options)
+
+    def refresh_all(self) -> Dict[str, Dict[str, int]]:
+        """
+        Refresh every source with its default options, e.g. at startup.
+
+        Returns:
+            Dict mapping source to its refresh counts, or to an error message
+        """
+        summary = {}
+        for source in self.loaders:
+            try:
+                summary[source] = self.refresh(source)
+            except Exception as e:
+                logger.error(f"Catalog refresh of {source} failed: {str(e)}")
+                summary[source] = {"error": str(e)}
+        return summary
+
+    def list_entries(self, source: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        List the indexed files with their metadata columns (without full results).
+
+        Args:
+            source (str): Restrict to one data source, or None for all
+
+        Returns:
+            List of per-file metadata dicts
+        """
+        query = ("SELECT source, path, variant, kind, size, mtime_ns, checksum, status, error, crs, bounds, "
+                 "dims, time_start, time_end, statistics, indexed_at FROM files")
+        params: Tuple = ()
+        if source is not None:
+            query += " WHERE source = ?"
+            params = (source,)
+        query += " ORDER BY source, path, variant"
+
+        with self._connect() as conn:
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute(query, params).fetchall()
+
+        entries = []
+        for row in rows:
+            entry = dict(row)
+            for column in ("bounds", "dims", "statistics"):
+                entry[column] = json.loads(entry[column]) if entry[column] else None
+            entry["filename"] = os.path.basename(entry["path"])
+            entries.append(entry)
+        return entries
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get per-source file counts from the index.
+
+        Returns:
+            Dict containing the index location and counts by source and status
+        """
+        with self._connect() as conn:
+            counts = conn.execute(
+                "SELECT source, status, COUNT(*), SUM(size) FROM files GROUP BY source, status").fetchall()
+        sources: Dict[str, Dict[str, Any]] = {}
+        for source, status, count, size in counts:
+            stats = sources.setdefault(source, {"files": 0, "errors": 0, "partial": 0, "bytes": 0})
+            stats["files"] += count
+            stats["bytes"] += size or 0
+            if status == "error":
+                stats["errors"] += count
+            elif status == "partial":
+                stats["partial"] += count
+        return {"db_path": str(self.db_path), "sources": sources}
@@ -0,0 +1,277 @@
+"""
+HDF4-EOS reader for MODIS MOD13Q1 vegetation index tiles.
+
+This module reads the scientific data sets (SDS) of a MOD13Q1 granule in row
+strips, using pyhdf when it is installed and GDAL's HDF4 driver through
+rasterio otherwise, so that callers never hold more than one strip in memory.
+"""
+
+import logging
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+import numpy as np
+
+# pyhdf reads SDS directly; rasterio needs a GDAL build with the HDF4 driver
+try:
+    from pyhdf.SD import SD, SDC
+    PYHDF_AVAILABLE = True
+except ImportError:
+    PYHDF_AVAILABLE = False
+
+try:
+    import rasterio
+    from rasterio.windows import Window
+    RASTERIO_AVAILABLE = True
+except ImportError:
+    RASTERIO_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+MOD13Q1_GRID = "MODIS_Grid_16DAY_250m_500m_VI"
+
+# Product-defined encoding of the MOD13Q1 layers (MOD13 C6.1 user guide)
+MOD13Q1_LAYERS: Dict[str, Dict[str, Any]] = {
+    "NDVI": {
+        "sds": "250m 16 days NDVI",
+        "long_name": "Normalized Difference Vegetation Index",
+        "units": "dimensionless",
+        "scale_factor": 0.0001,
+        "fill_value": -3000,
+        "valid_range": [-2000, 10000]
+    },
+    "EVI": {
+        "sds": "250m 16 days EVI",
+        "long_name": "Enhanced Vegetation Index",
+        "units": "dimensionless",
+        "scale_factor": 0.0001,
+        "fill_value": -3000,
+        "valid_range": [-2000, 10000]
+    },
+    "VI_Quality": {
+        "sds": "250m 16 days VI Quality",
+        "long_name": "VI Quality",
+        "units": "bit field",
+        "scale_factor": 1,
+        "fill_value": 65535,
+        "valid_range": [0, 65534]
+    },
+    "pixel_reliability": {
+        "sds": "250m 16 days pixel reliability",
+        "long_name": "Quality reliability of VI pixel",
+        "units": "rank",
+        "scale_factor": 1,
+        "fill_value": -1,
+        "valid_range": [0, 3]
+    },
+    "Red": {
+        "sds": "250m 16 days red reflectance",
+        "long_name": "Red Reflectance",
+        "units": "reflectance",
+        "scale_factor": 0.0001,
+        "fill_value": -1000,
+        "valid_range": [0, 10000]
+    },
+    "NIR": {
+        "sds": "250m 16 days NIR reflectance",
+        "long_name": "Near Infrared Reflectance",
+        "units": "reflectance",
+        "scale_factor": 0.0001,
+        "fill_value": -1000,
+        "valid_range": [0, 10000]
+    }
+}
+
+
+def encoding_mismatches(layer: str, attributes: Dict[str, Any]) -> List[str]:
+    """
+    Compare a layer's stored scale_factor and _FillValue with MOD13Q1_LAYERS.
+
+    MODIS files store the divisor (10000 for NDVI) as scale_factor, so either
+    the product scale or its reciprocal is accepted. Attributes the file does
+    not carry are not checked.
+
+    Args:
+        layer (str): Layer key
+        attributes (Dict): SDS attributes as returned by Hdf4TileReader.attributes()
+
+    Returns:
+        List of human-readable mismatches (empty if the encoding matches)
+    """
+    spec = MOD13Q1_LAYERS[layer]
+    mismatches = []
+
+    if "scale_factor" in attributes:
+        try:
+            stored = float(np.ravel(attributes["scale_factor"])[0])
+        except (TypeError, ValueError, IndexError):
+            stored = None
+        expected = float(spec["scale_factor"])
+        if stored is None or not (np.isclose(stored, expected) or (stored != 0 and np.isclose(1.0 / stored, expected))):
+            mismatches.append(f"{layer} scale_factor {attributes['scale_factor']!r} (expected {spec['scale_factor']})")
+
+    if "_FillValue" in attributes:
+        try:
+            stored = float(np.ravel(attributes["_FillValue"])[0])
+        except (TypeError, ValueError, IndexError):
+            stored = None
+        if stored != spec["fill_value"]:
+            mismatches.append(f"{layer} _FillValue {attributes['_FillValue']!r} (expected {spec['fill_value']})")
+
+    return mismatches
+
+
+def hdf4_backend() -> Optional[str]:
+    """
+    Detect which HDF4 reading backend is usable.
+
+    Returns:
+        'pyhdf', 'gdal', or None if HDF4 files cannot be read
+    """
+    if PYHDF_AVAILABLE:
+        return "pyhdf"
+    if RASTERIO_AVAILABLE:
+        try:
+            with rasterio.Env() as env:
+                if "HDF4" in env.drivers():
+                    return "gdal"
+        except Exception as e:
+            logger.debug(f"Could not query GDAL drivers: {str(e)}")
+    return None
+
+
+class Hdf4TileReader:
+    """
+    Strip-wise reader for the SDS layers of a single MOD13Q1 HDF4 file.
+
+    Use as a context manager; read_rows() returns the raw (unscaled) values
+    for a band of rows so tiles can be processed without loading full layers.
+    """
+
+    def __init__(self, hdf_file: Path):
+        """
+        Initialize the reader.
+
+        Args:
+            hdf_file (Path): Path to the MOD13Q1 HDF4 file
+        """
+        self.hdf_file = Path(hdf_file)
+        self.backend = hdf4_backend()
+        self._sd = None
+        self._subdatasets: Dict[str, str] = {}
+        self._handles: Dict[str, Any] = {}
+
+    def __enter__(self) -> "Hdf4TileReader":
+        if self.backend is None:
+            raise RuntimeError("No HDF4 reader available (install pyhdf or a GDAL build with the HDF4 driver)")
+
+        if self.backend == "pyhdf":
+            self._sd = SD(str(self.hdf_file), SDC.READ)
+        else:
+            with rasterio.open(self.hdf_file) as src:
+                for subdataset in src.subdatasets:
+                    # e.g. HDF4_EOS:EOS_GRID:"file.hdf":MODIS_Grid_16DAY_250m_500m_VI:"250m 16 days NDVI"
+                    sds_name = subdataset.rsplit(":", 1)[-1].strip('"')
+                    self._subdatasets[sds_name] = subdataset
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        for handle in self._handles.values():
+            try:
+                if self.backend == "pyhdf":
+                    handle.endaccess()
+                else:
+                    handle.close()
+            except Exception:
+                pass
+        self._handles.clear()
+        if self._sd is not None:
+            self._sd.end()
+            self._sd = None
+
+    def available_layers(self) -> List[str]:
+        """
+        List the known MOD13Q1 layers present in the file.
+
+        Returns:
+            List of layer keys from MOD13Q1_LAYERS
+        """
+        if self.backend == "pyhdf":
+            names = set(self._sd.datasets().keys())
+        else:
+            names = set(self._subdatasets.keys())
+        return [layer for layer, spec in MOD13Q1_LAYERS.items() if spec["sds"] in names]
+
+    def _handle(self, layer: str) -> Any:
+        """Open (once) and return the backend handle for a layer."""
+        if layer not in self._handles:
+            sds_name = MOD13Q1_LAYERS[layer]["sds"]
+            if self.backend == "pyhdf":
+                self._handles[layer] = self._sd.select(sds_name)
+            else:
+                self._handles[layer] = rasterio.open(self._subdatasets[sds_name])
+        return self._handles[layer]
+
+    def shape(self, layer: str) -> List[int]:
+        """
+        Get the (rows, cols) shape of a layer.
+
+        Args:
+            layer (str): Layer key
+
+        Returns:
+            [rows, cols]
+        """
+        handle = self._handle(layer)
+        if self.backend == "pyhdf":
+            return list(handle.info()[2])
+        return [handle.height, handle.width]
+
+    def attributes(self, layer: str) -> Dict[str, Any]:
+        """
+        Get the SDS attributes stored in the file for a layer.
+
+        Args:
+            layer (str): Layer key
+
+        Returns:
+            Dict of attribute names to values
+        """
+        handle = self._handle(layer)
+        try:
+            if self.backend == "pyhdf":
+                return dict(handle.attributes())
+            return dict(handle.tags())
+        except Exception as e:
+            logger.debug(f"Could not read attributes of {layer}: {str(e)}")
+            return {}
+
+    def check_encoding(self, layer: str) -> List[str]:
+        """
+        Check a layer's stored scale_factor and _FillValue against MOD13Q1_LAYERS.
+
+        Args:
+            layer (str): Layer key
+
+        Returns:
+            List of mismatches (empty if the file uses the product encoding)
+        """
+        return encoding_mismatches(layer, self.attributes(layer))
+
+    def read_rows(self, layer: str, row_start: int, row_stop: int) -> np.ndarray:
+        """
+        Read a strip of raw values from a layer.
+
+        Args:
+            layer (str): Layer key
+            row_start (int): First row (inclusive)
+            row_stop (int): Last row (exclusive)
+
+        Returns:
+            np.ndarray of shape (row_stop - row_start, cols) with raw stored values
+        """
+        handle = self._handle(layer)
+        if self.backend == "pyhdf":
+            return np.asarray(handle[row_start:row_stop, :])
+        window = Window(0, row_start, handle.width, row_stop - row_start)
+        return handle.read(1, window=window)
@@ -6,14 +6,26 @@ stored in NetCDF format, extracting temporal and spatial variables.
 """
 
 import os
+import re
 import json
 import logging
+import threading
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Union, Tuple
 import xarray as xr
 import numpy as np
 import pandas as pd
 
+# dask enables chunked, lazy reductions; without it datasets are read eagerly
+try:
+    import dask
+    DASK_AVAILABLE = True
+except ImportError:
+    DASK_AVAILABLE = False
+
+from .cache import FileResultCache, INCOMPLETE_KEY
+from .raster_stats import RunningStats
+
 logger = logging.getLogger(__name__)
 
 class MerraDataLoader:
@@ -24,15 +36,23 @@ class MerraDataLoader:
     climate variables, temporal data, and spatial information.
     """
     
-    def __init__(self, data_path: str = "Data/MERRA-2 const_2d_lnd_Nx"):
+    def __init__(self, data_path: str = "Data/MERRA-2 const_2d_lnd_Nx",
+                 cache_dir: Optional[str] = "cache/loaders",
+                 chunks: Optional[Union[str, Dict[str, int]]] = "auto"):
         """
         Initialize the MERRA-2 data loader.
         
         Args:
             data_path (str): Path to the MERRA-2 data directory
+            cache_dir (str): Directory for cached per-file results, or None for memory only
+            chunks: dask chunk specification used when opening datasets, or None to read eagerly
         """
         self.data_path = Path(data_path)
         self.description_file = self.data_path / "description.json"
+        self.cache = FileResultCache("merra", cache_dir)
+        self.chunks = chunks if DASK_AVAILABLE else None
+        self._series_cache: Optional[Tuple[Tuple, pd.DataFrame]] = None
+        self._series_lock = threading.Lock()
         
     def load_data(self) -> Dict[str, Any]:
         """
@@ -44,33 +64,231 @@ class MerraDataLoader:
         try:
             logger.info(f"Loading MERRA-2 data from {self.data_path}")
             
-            # Load description
-            description = self._load_description()
-            
             # Find and process NetCDF files
-            nc_files = list(self.data_path.glob("*.nc"))
-            processed_files = []
+            files = self.list_files()
+            outcomes = self.cache.get_or_compute_many(files, self.process_files)
             
-            for nc_file in nc_files:
-                try:
-                    file_data = self._process_netcdf_file(nc_file)
-                    processed_files.append(file_data)
-                    logger.info(f"Successfully processed {nc_file.name}")
-                except Exception as e:
-                    logger.error(f"Error processing {nc_file.name}: {str(e)}")
-                    continue
+            entries = []
+            for (kind, nc_file, _), outcome in zip(files, outcomes):
+                if isinstance(outcome, Exception):
+                    outcome = self.failure_result(kind, nc_file, str(outcome))
+                entries.append((kind, outcome))
             
-            return {
-                "description": description,
-                "files": processed_files,
-                "total_files": len(processed_files),
-                "data_type": "MERRA-2 const_2d_lnd_Nx"
-            }
+            return self.build_response(entries)
             
         except Exception as e:
             logger.error(f"Error loading MERRA-2 data: {str(e)}")
             raise
     
+    def list_files(self) -> List[Tuple[str, Path, str]]:
+        """
+        List the source files handled by this loader.
+        
+        Returns:
+            List of (kind, path, variant) tuples
+        """
+        return [("nc", nc_file, "") for nc_file in sorted(self.data_path.glob("*.nc"))]
+    
+    def process_files(self, files: List[Tuple[str, Path, str]]) -> List[Any]:
+        """
+        Process a batch of NetCDF files.
+        
+        Args:
+            files: (kind, path, variant) tuples from list_files()
+            
+        Returns:
+            List with, per file, its result dict or the exception raised for it
+        """
+        results = []
+        for _, nc_file, _ in files:
+            try:
+                results.append(self._process_netcdf_file(nc_file))
+                logger.info(f"Successfully processed {nc_file.name}")
+            except Exception as e:
+                logger.error(f"Error processing {nc_file.name}: {str(e)}")
+                results.append(e)
+        return results
+    
+    def failure_result(self, kind: str, nc_file: Path, error_msg: str) -> Optional[Dict[str, Any]]:
+        """
+        Describe a file that could not be processed; unreadable NetCDF files are left out.
+        
+        Args:
+            kind (str): File kind from list_files()
+            nc_file (Path): Path to the NetCDF file
+            error_msg (str): Error message explaining why processing failed
+            
+        Returns:
+            None, so the file is skipped
+        """
+        return None
+    
+    def build_response(self, entries: List[Tuple[str, Optional[Dict[str, Any]]]]) -> Dict[str, Any]:
+        """
+        Assemble the load_data() response from per-file results.
+        
+        Args:
+            entries: (kind, result) pairs in file order; None results are skipped
+            
+        Returns:
+            Dict containing processed MERRA-2 data with climate variables and metadata
+        """
+        processed_files = [result for _, result in entries if result]
+        
+        return {
+            "description": self._load_description(),
+            "files": processed_files,
+            "total_files": len(processed_files),
+            "aggregate_statistics": self._aggregate_statistics(processed_files),
+            "data_type": "MERRA-2 const_2d_lnd_Nx"
+        }
+    
+    def get_area_mean_series(self, variables: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Get the area-mean time series of every variable across all files.
+        
+        The result is cached in memory until any NetCDF file is added,
+        removed or modified.
+        
+        Args:
+            variables (List[str]): Variables to include, or None for all numeric variables
+            
+        Returns:
+            pd.DataFrame indexed by date with one column per variable
+        """
+        nc_files = sorted(self.data_path.glob("*.nc"))
+        signature = tuple(
+            (sig["path"], sig["mtime_ns"], sig["size"])
+            for sig in (FileResultCache.file_signature(f) for f in nc_files)
+        )
+        
+        with self._series_lock:
+            if self._series_cache is not None and self._series_cache[0] == signature:
+                series = self._series_cache[1]
+            else:
+                series = self._compute_area_mean_series(nc_files)
+                self._series_cache = (signature, series)
+        
+        if variables is not None:
+            return series[[v for v in variables if v in series.columns]]
+        return series
+    
+    def _compute_area_mean_series(self, nc_files: List[Path]) -> pd.DataFrame:
+        """
+        Reduce the time-series cube to per-variable area means.
+        
+        Args:
+            nc_files (List[Path]): NetCDF files forming the cube
+            
+        Returns:
+            pd.DataFrame indexed by date with one column per variable
+        """
+        if not nc_files:
+            return pd.DataFrame()
+        
+        cube = self.open_time_series_cube(nc_files)
+        try:
+            means = {}
+            for var_name, var_data in cube.data_vars.items():
+                if var_data.dtype.kind not in "biuf" or "time" not in var_data.dims:
+                    continue
+                spatial_dims = [dim for dim in var_data.dims if dim != "time"]
+                means[var_name] = var_data.mean(dim=spatial_dims, skipna=True)
+            
+            if not means:
+                return pd.DataFrame()
+            
+            if self.chunks is not None:
+                (means,) = dask.compute(means)
+            
+            series = pd.DataFrame(
+                {var_name: mean.values for var_name, mean in means.items()},
+                index=pd.DatetimeIndex(cube["time"].values, name="date")
+            )
+            return series.sort_index()
+        finally:
+            cube.close()
+    
+    def open_time_series_cube(self, nc_files: Optional[List[Path]] = None) -> xr.Dataset:
+        """
+        Open all NetCDF files as a single dataset concatenated along time.
+        
+        Files without a time dimension are stamped with the date parsed from
+        their filename (e.g. ..._20111001.nc).
+        
+        Args:
+            nc_files (List[Path]): Files to combine, or None for every .nc file in the directory
+            
+        Returns:
+            xarray Dataset with a sorted 'time' dimension (lazy when dask is available)
+        """
+        if nc_files is None:
+            nc_files = sorted(self.data_path.glob("*.nc"))
+        
+        if self.chunks is not None:
+            cube = xr.open_mfdataset(
+                [str(f) for f in nc_files],
+                preprocess=self._add_time_dimension,
+                combine="nested",
+                concat_dim="time",
+                chunks=self.chunks,
+                data_vars="minimal",
+                coords="minimal",
+                compat="override"
+            )
+        else:
+            datasets = []
+            for nc_file in nc_files:
+                with xr.open_dataset(nc_file) as ds:
+                    datasets.append(self._add_time_dimension(ds.load()))
+            cube = xr.concat(datasets, dim="time", data_vars="minimal", coords="minimal", compat="override")
+        
+        return cube.sortby("time")
+    
+    def _add_time_dimension(self, dataset: xr.Dataset) -> xr.Dataset:
+        """
+        Ensure a dataset has a 'time' dimension, using the filename date if needed.
+        
+        Args:
+            dataset: xarray Dataset opened from a single file
+            
+        Returns:
+            xarray Dataset with a 'time' dimension
+        """
+        for time_coord in ('Time', 'TIME'):
+            if time_coord in dataset.dims and 'time' not in dataset.dims:
+                dataset = dataset.rename({time_coord: 'time'})
+        
+        if 'time' in dataset.dims:
+            return dataset
+        
+        source = dataset.encoding.get("source", "")
+        file_date = self._parse_file_date(Path(source).name) if source else None
+        if file_date is None:
+            raise ValueError(f"Cannot determine a date for {source or 'dataset'}")
+        if 'time' in dataset.coords:
+            dataset = dataset.drop_vars('time')
+        return dataset.expand_dims(time=[file_date])
+    
+    @staticmethod
+    def _parse_file_date(filename: str) -> Optional[pd.Timestamp]:
+        """
+        Parse the acquisition date from a MERRA-2/LPRM filename.
+        
+        Args:
+            filename (str): File name containing a YYYYMMDD date
+            
+        Returns:
+            pd.Timestamp or None if no date is found
+        """
+        match = re.search(r'(?<!\d)(\d{8})(?!\d)', filename)
+        if not match:
+            return None
+        try:
+            return pd.Timestamp(match.group(1))
+        except ValueError:
+            return None
+    
     def _load_description(self) -> Dict[str, Any]:
         """
         Load the description.json file for MERRA-2 data.
@@ -88,6 +306,20 @@ class MerraDataLoader:
             logger.warning(f"Could not load description file: {str(e)}")
             return {"description": "MERRA-2 const_2d_lnd_Nx data"}
     
+    def _open_dataset(self, nc_file: Path) -> xr.Dataset:
+        """
+        Open a NetCDF file, chunked with dask when available.
+        
+        Args:
+            nc_file (Path): Path to the NetCDF file
+            
+        Returns:
+            xarray Dataset backed by lazy dask arrays (or numpy arrays without dask)
+        """
+        if self.chunks is not None:
+            return xr.open_dataset(nc_file, chunks=self.chunks)
+        return xr.open_dataset(nc_file)
+    
     def _process_netcdf_file(self, nc_file: Path) -> Dict[str, Any]:
         """
         Process a single NetCDF file to extract climate variables and metadata.
@@ -99,7 +331,7 @@ class MerraDataLoader:
             Dict containing processed data from the NetCDF file
         """
         try:
-            with xr.open_dataset(nc_file) as ds:
+            with self._open_dataset(nc_file) as ds:
                 # Extract file metadata
                 file_info = {
                     "filename": nc_file.name,
@@ -111,7 +343,7 @@ class MerraDataLoader:
                 }
                 
                 # Process climate variables
-                climate_data = self._extract_climate_variables(ds)
+                climate_data, reduction_errors = self._extract_climate_variables(ds)
                 
                 # Process temporal information
                 temporal_data = self._extract_temporal_info(ds)
@@ -119,18 +351,22 @@ class MerraDataLoader:
                 # Process spatial information
                 spatial_data = self._extract_spatial_info(ds)
                 
-                return {
+                result = {
                     "file_info": file_info,
                     "climate_variables": climate_data,
                     "temporal_info": temporal_data,
                     "spatial_info": spatial_data
                 }
+                if reduction_errors:
+                    # Not cached, so the failed variables are read again on the next load
+                    result.update({INCOMPLETE_KEY: True, "variable_errors": reduction_errors})
+                return result
                 
         except Exception as e:
             logger.error(f"Error processing NetCDF file {nc_file.name}: {str(e)}")
             raise
     
-    def _extract_climate_variables(self, dataset: xr.Dataset) -> Dict[str, Any]:
+    def _extract_climate_variables(self, dataset: xr.Dataset) -> Tuple[Dict[str, Any], Dict[str, str]]:
         """
         Extract climate variables from the NetCDF dataset.
         
@@ -138,29 +374,61 @@ class MerraDataLoader:
             dataset: xarray Dataset object
             
         Returns:
-            Dict containing climate variable statistics
+            Tuple of (climate variable statistics, errors of the variables that could not be reduced)
         """
         climate_data = {}
+        errors = {}
         
+        # Build nan-aware reductions for every numeric variable first, so that
+        # with dask they evaluate as one graph, one chunk at a time
+        reductions = {}
         for var_name, var_data in dataset.data_vars.items():
+            if var_data.dtype.kind not in "biuf":
+                continue
             try:
-                # Get data array
-                data = var_data.values
-                
-                # Calculate statistics (excluding NaN values)
-                valid_data = data[~np.isnan(data)]
+                # Evaluated here already when the dataset is not chunked
+                reductions[var_name] = {
+                    "min": var_data.min(skipna=True),
+                    "max": var_data.max(skipna=True),
+                    "mean": var_data.mean(skipna=True),
+                    "std": var_data.std(skipna=True),
+                    "valid": var_data.notnull().sum()
+                }
+            except Exception as e:
+                logger.warning(f"Error processing variable {var_name}: {str(e)}")
+                errors[var_name] = str(e)
+        
+        if self.chunks is not None:
+            try:
+                (reductions,) = dask.compute(reductions)
+            except Exception as e:
+                # One unreadable variable or chunk fails the shared graph; reduce the variables one by one
+                logger.warning(f"Error computing climate variable statistics, retrying per variable: {str(e)}")
+                computed = {}
+                for var_name, var_reductions in reductions.items():
+                    try:
+                        (computed[var_name],) = dask.compute(var_reductions)
+                    except Exception as var_error:
+                        logger.warning(f"Error processing variable {var_name}: {str(var_error)}")
+                        errors[var_name] = str(var_error)
+                reductions = computed
+        
+        for var_name, stats in reductions.items():
+            var_data = dataset[var_name]
+            try:
+                valid_count = int(stats["valid"].values)
                 
-                if len(valid_data) > 0:
+                if valid_count > 0:
                     climate_data[var_name] = {
                         "shape": var_data.shape,
                         "dtype": str(var_data.dtype),
                         "dimensions": list(var_data.dims),
-                        "min_value": float(np.min(valid_data)),
-                        "max_value": float(np.max(valid_data)),
-                        "mean_value": float(np.mean(valid_data)),
-                        "std_value": float(np.std(valid_data)),
-                        "valid_values": len(valid_data),
-                        "total_values": data.size,
+                        "min_value": float(stats["min"].values),
+                        "max_value": float(stats["max"].values),
+                        "mean_value": float(stats["mean"].values),
+                        "std_value": float(stats["std"].values),
+                        "valid_values": valid_count,
+                        "total_values": var_data.size,
                         "attributes": dict(var_data.attrs),
                         "units": var_data.attrs.get('units', 'unknown')
                     }
@@ -176,9 +444,56 @@ class MerraDataLoader:
                         
             except Exception as e:
                 logger.warning(f"Error processing variable {var_name}: {str(e)}")
+                errors[var_name] = str(e)
                 continue
         
-        return climate_data
+        return climate_data, errors
+    
+    def _aggregate_statistics(self, processed_files: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Combine per-file variable statistics into statistics across all files.
+        
+        The per-file count/mean/std/min/max summaries are merged with the
+        parallel variance formula, which gives the same result as a single
+        reduction over every file without reopening any of them.
+        
+        Args:
+            processed_files: Per-file results from _process_netcdf_file
+            
+        Returns:
+            Dict mapping variable name to its combined statistics
+        """
+        totals: Dict[str, RunningStats] = {}
+        units: Dict[str, str] = {}
+        
+        for file_data in processed_files:
+            for var_name, var_stats in file_data.get("climate_variables", {}).items():
+                count = var_stats.get("valid_values", 0)
+                if not count:
+                    continue
+                partial = RunningStats()
+                partial.count = count
+                partial.mean = var_stats["mean_value"]
+                partial.m2 = var_stats["std_value"] ** 2 * count
+                partial.min = var_stats["min_value"]
+                partial.max = var_stats["max_value"]
+                totals.setdefault(var_name, RunningStats()).merge(partial)
+                units.setdefault(var_name, var_stats.get("units", "unknown"))
+        
+        aggregate = {}
+        for var_name, stats in totals.items():
+            summary = stats.to_dict()
+            aggregate[var_name] = {
+                "min_value": summary["min_value"],
+                "max_value": summary["max_value"],
+                "mean_value": summary["mean_value"],
+                "std_value": summary["std_value"],
+                "valid_values": summary["valid_pixels"],
+                "files": sum(1 for f in processed_files if var_name in f.get("climate_variables", {})),
+                "units": units[var_name]
+            }
+        
+        return aggregate
     
     def _extract_temporal_info(self, dataset: xr.Dataset) -> Dict[str, Any]:
         """
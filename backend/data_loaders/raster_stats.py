@@ -0,0 +1,266 @@
+"""
+Streaming raster statistics for BloomTracker data loaders.
+
+This module computes per-band min/max/mean/std over block windows in a single
+pass, merging partial results with the parallel variance formula so that peak
+memory is bounded by the block size rather than the scene size.
+"""
+
+import math
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Iterator, Tuple
+
+import numpy as np
+import rasterio
+from rasterio.windows import Window
+
+logger = logging.getLogger(__name__)
+
+# Strip-organised TIFs have one-row blocks; coalesce them into windows of about this many pixels
+DEFAULT_WINDOW_PIXELS = 1 << 20
+
+# Longest side, in pixels, targeted by approximate statistics
+DEFAULT_PREVIEW_DIMENSION = 1024
+
+STATS_MODES = ("exact", "approximate")
+
+
+class RunningStats:
+    """
+    Single-pass accumulator for count, min, max, mean and variance.
+
+    Partial results from different windows or threads are combined with
+    Chan et al.'s parallel update of Welford's algorithm.
+    """
+
+    def __init__(self):
+        """Initialize an empty accumulator."""
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def _combine(self, count: int, mean: float, m2: float, min_value: float, max_value: float):
+        """Merge a partial (count, mean, M2, min, max) summary into this one."""
+        if count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self.m2 = count, mean, m2
+            self.min, self.max = min_value, max_value
+            return
+
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+        self.min = min(self.min, min_value)
+        self.max = max(self.max, max_value)
+
+    def update(self, values: np.ndarray):
+        """
+        Add a block of valid values.
+
+        Args:
+            values (np.ndarray): Values to accumulate (nodata already removed)
+        """
+        if values.size == 0:
+            return
+        values = values.astype(np.float64, copy=False)
+        block_mean = float(values.mean())
+        block_m2 = float(np.square(values - block_mean).sum())
+        self._combine(values.size, block_mean, block_m2, float(values.min()), float(values.max()))
+
+    def merge(self, other: "RunningStats") -> "RunningStats":
+        """
+        Merge another accumulator into this one.
+
+        Args:
+            other (RunningStats): Accumulator to merge
+
+        Returns:
+            RunningStats: self, for chaining
+        """
+        self._combine(other.count, other.mean, other.m2, other.min, other.max)
+        return self
+
+    @property
+    def variance(self) -> float:
+        """Population variance (ddof=0), matching numpy's default."""
+        return self.m2 / self.count if self.count else float("nan")
+
+    @property
+    def std(self) -> float:
+        """Population standard deviation."""
+        return float(np.sqrt(self.variance)) if self.count else float("nan")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Export the statistics using the loaders' response keys.
+
+        Returns:
+            Dict containing min/max/mean/std values and the valid pixel count
+        """
+        if self.count == 0:
+            return {
+                "min_value": None,
+                "max_value": None,
+                "mean_value": None,
+                "std_value": None,
+                "valid_pixels": 0
+            }
+        return {
+            "min_value": float(self.min),
+            "max_value": float(self.max),
+            "mean_value": float(self.mean),
+            "std_value": self.std,
+            "valid_pixels": int(self.count)
+        }
+
+
+def iter_windows(src: rasterio.io.DatasetReader, window_pixels: int = DEFAULT_WINDOW_PIXELS) -> List[Window]:
+    """
+    List the read windows for a dataset, following its internal block layout.
+
+    Tiled files use their block windows directly; strip files have their
+    full-width strips coalesced into windows of roughly window_pixels.
+
+    Args:
+        src: Open rasterio dataset
+        window_pixels (int): Target pixel count for coalesced strip windows
+
+    Returns:
+        List of windows covering the raster
+    """
+    block_height, block_width = src.block_shapes[0]
+    if block_width < src.width:
+        return [window for _, window in src.block_windows(1)]
+
+    rows = max(block_height, (window_pixels // max(src.width, 1)) // block_height * block_height)
+    return [
+        Window(0, row, src.width, min(rows, src.height - row))
+        for row in range(0, src.height, rows)
+    ]
+
+
+def _valid_values(block: np.ma.MaskedArray) -> np.ndarray:
+    """Drop nodata-masked and non-finite values from a block."""
+    values = block.compressed()
+    if values.dtype.kind == "f":
+        values = values[np.isfinite(values)]
+    return values
+
+
+def _accumulate_windows(file_path: Path, bands: List[int], windows: List[Window]) -> Dict[int, RunningStats]:
+    """Accumulate statistics for a subset of windows using a private dataset handle."""
+    stats = {band: RunningStats() for band in bands}
+    # GDAL dataset handles are not thread-safe, so every worker opens its own
+    with rasterio.open(file_path) as src:
+        for window in windows:
+            for band in bands:
+                block = src.read(band, window=window, masked=True)
+                stats[band].update(_valid_values(block))
+    return stats
+
+
+def _chunk(items: List[Any], parts: int) -> Iterator[List[Any]]:
+    """Split a list into at most `parts` contiguous chunks."""
+    size = max(1, -(-len(items) // parts))
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def compute_band_statistics(file_path: Path, bands: Optional[List[int]] = None, max_workers: int = 1,
+                            window_pixels: int = DEFAULT_WINDOW_PIXELS) -> Dict[int, RunningStats]:
+    """
+    Compute exact per-band statistics by streaming over block windows.
+
+    Nodata values (from the band's nodata value or internal mask) and
+    non-finite values are excluded. With max_workers > 1 the windows are
+    spread across threads and the partial results merged.
+
+    Args:
+        file_path (Path): Path to the raster file
+        bands (List[int]): 1-based band indexes, or None for all bands
+        max_workers (int): Number of threads reading windows concurrently
+        window_pixels (int): Target pixel count for coalesced strip windows
+
+    Returns:
+        Dict mapping band index to its RunningStats
+    """
+    with rasterio.open(file_path) as src:
+        if bands is None:
+            bands = list(range(1, src.count + 1))
+        windows = iter_windows(src, window_pixels)
+
+    if max_workers <= 1 or len(windows) <= 1:
+        return _accumulate_windows(file_path, bands, windows)
+
+    totals = {band: RunningStats() for band in bands}
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="raster-stats") as pool:
+        partials = pool.map(lambda chunk: _accumulate_windows(file_path, bands, chunk),
+                            _chunk(windows, max_workers))
+        for partial in partials:
+            for band, band_stats in partial.items():
+                totals[band].merge(band_stats)
+    return totals
+
+
+def compute_approximate_band_statistics(file_path: Path, bands: Optional[List[int]] = None,
+                                        max_dimension: int = DEFAULT_PREVIEW_DIMENSION
+                                        ) -> Tuple[Dict[int, RunningStats], Dict[str, Any]]:
+    """
+    Compute approximate per-band statistics from a reduced-resolution read.
+
+    The smallest decimation factor that brings the longest side down to
+    max_dimension is chosen. When the file has internal overviews, the
+    nearest overview at or below that resolution is used; otherwise GDAL
+    performs a decimated read via out_shape.
+
+    Args:
+        file_path (Path): Path to the raster file
+        bands (List[int]): 1-based band indexes, or None for all bands
+        max_dimension (int): Target length of the longest side in pixels
+
+    Returns:
+        Tuple of (band index -> RunningStats, description of the resolution used)
+    """
+    with rasterio.open(file_path) as src:
+        if bands is None:
+            bands = list(range(1, src.count + 1))
+
+        target_factor = max(1, math.ceil(max(src.width, src.height) / max_dimension))
+        overviews = src.overviews(bands[0]) if bands else []
+        overview_level = None
+
+        if target_factor == 1:
+            factor, source = 1, "full_resolution"
+        elif overviews:
+            # Prefer the finest overview that is at least as coarse as the target
+            candidates = [f for f in overviews if f >= target_factor]
+            factor = min(candidates) if candidates else max(overviews)
+            overview_level = overviews.index(factor)
+            source = "overview"
+        else:
+            factor, source = target_factor, "decimated_read"
+
+        out_shape = (max(1, src.height // factor), max(1, src.width // factor))
+        stats = {band: RunningStats() for band in bands}
+        for band in bands:
+            block = src.read(band, out_shape=out_shape, masked=True)
+            stats[band].update(_valid_values(block))
+
+        resolution = {
+            "statistics_mode": "approximate",
+            "source": source,
+            "overview_level": overview_level,
+            "available_overviews": overviews,
+            "decimation_factor": factor,
+            "resolution": list(out_shape),
+            "full_resolution": [src.height, src.width]
+        }
+
+    return stats, resolution
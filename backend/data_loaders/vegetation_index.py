@@ -0,0 +1,375 @@
+"""
+Vectorized vegetation index engine for MODIS MOD13Q1 tiles.
+
+This module decodes the VI_Quality and pixel-reliability layers into masks
+and reduces the int16 NDVI/EVI values of a tile to statistics, histograms and
+percentiles in a single pass. Because the stored values are small integers,
+each strip is reduced with one np.bincount over the raw values, which keeps
+the reductions exact while memory stays within a fixed per-strip budget.
+"""
+
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+import numpy as np
+
+from .hdf4_reader import Hdf4TileReader, MOD13Q1_LAYERS
+
+logger = logging.getLogger(__name__)
+
+INDEX_LAYERS = ("NDVI", "EVI")
+REFLECTANCE_LAYERS = ("Red", "NIR")
+
+# VI_Quality bit fields (MOD13 C6.1 user guide, table 5)
+MODLAND_QA_BITS = (0, 2)
+VI_USEFULNESS_BITS = (2, 4)
+MIXED_CLOUDS_BIT = 10
+SNOW_ICE_BIT = 14
+SHADOW_BIT = 15
+
+PIXEL_RELIABILITY_LABELS = {-1: "fill", 0: "good", 1: "marginal", 2: "snow_ice", 3: "cloudy"}
+
+
+def _bit_field(values: np.ndarray, field: Tuple[int, int]) -> np.ndarray:
+    """Extract an unsigned bit field given as (first bit, width)."""
+    first_bit, width = field
+    return (values >> first_bit) & ((1 << width) - 1)
+
+
+class VegetationIndexEngine:
+    """
+    QA-masked, single-pass statistics engine for MOD13Q1 layers.
+
+    For every strip, pixels are kept only if they are not fill, fall inside
+    the valid range, pass the VI_Quality filters and (when present) have an
+    acceptable pixel reliability. Kept raw values are counted with bincount;
+    min/max/mean/std, histograms and percentiles all derive from those counts.
+    """
+
+    def __init__(self, memory_budget_bytes: int = 64 * 1024 * 1024, max_modland_qa: int = 1,
+                 max_vi_usefulness: int = 12, max_pixel_reliability: int = 1,
+                 exclude_mixed_clouds: bool = True, exclude_snow_ice: bool = True,
+                 exclude_shadow: bool = True, histogram_bins: int = 60,
+                 percentiles: Tuple[float, ...] = (5, 25, 50, 75, 95)):
+        """
+        Initialize the engine.
+
+        Args:
+            memory_budget_bytes (int): Upper bound on the working memory used per strip
+            max_modland_qa (int): Highest accepted MODLAND QA value (0 good, 1 check other QA)
+            max_vi_usefulness (int): Highest accepted VI usefulness index (0 best .. 15 not useful)
+            max_pixel_reliability (int): Highest accepted pixel reliability (0 good, 1 marginal)
+            exclude_mixed_clouds (bool): Mask pixels flagged with mixed clouds
+            exclude_snow_ice (bool): Mask pixels flagged with possible snow/ice
+            exclude_shadow (bool): Mask pixels flagged with possible shadow
+            histogram_bins (int): Number of equal-width histogram bins over the valid range
+            percentiles (Tuple[float]): Percentiles to report
+        """
+        self.memory_budget_bytes = memory_budget_bytes
+        self.max_modland_qa = max_modland_qa
+        self.max_vi_usefulness = max_vi_usefulness
+        self.max_pixel_reliability = max_pixel_reliability
+        self.exclude_mixed_clouds = exclude_mixed_clouds
+        self.exclude_snow_ice = exclude_snow_ice
+        self.exclude_shadow = exclude_shadow
+        self.histogram_bins = histogram_bins
+        self.percentiles = tuple(percentiles)
+
+    def get_config(self) -> Dict[str, Any]:
+        """
+        Get the constructor arguments, e.g. to rebuild the engine in a worker process.
+
+        Returns:
+            Dict of engine settings
+        """
+        return {
+            "memory_budget_bytes": self.memory_budget_bytes,
+            "max_modland_qa": self.max_modland_qa,
+            "max_vi_usefulness": self.max_vi_usefulness,
+            "max_pixel_reliability": self.max_pixel_reliability,
+            "exclude_mixed_clouds": self.exclude_mixed_clouds,
+            "exclude_snow_ice": self.exclude_snow_ice,
+            "exclude_shadow": self.exclude_shadow,
+            "histogram_bins": self.histogram_bins,
+            "percentiles": list(self.percentiles)
+        }
+
+    def rows_per_strip(self, cols: int, n_layers: int) -> int:
+        """
+        Number of rows that fit in the memory budget.
+
+        Per pixel a strip holds the int16 raw value and a boolean mask for
+        each layer, plus the uint16 VI_Quality, int8 reliability and the
+        shared quality mask and its temporaries.
+
+        Args:
+            cols (int): Columns per row
+            n_layers (int): Value layers read per strip
+
+        Returns:
+            int: Rows per strip (at least 1)
+        """
+        bytes_per_pixel = n_layers * (2 + 1) + 2 + 1 + 8
+        return max(1, self.memory_budget_bytes // max(1, cols * bytes_per_pixel))
+
+    def quality_mask(self, vi_quality: Optional[np.ndarray], reliability: Optional[np.ndarray],
+                     rejected: Dict[str, int]) -> Optional[np.ndarray]:
+        """
+        Build the keep-mask for a strip from its QA layers.
+
+        Args:
+            vi_quality: Raw VI_Quality strip, or None if absent
+            reliability: Raw pixel reliability strip, or None if absent
+            rejected: Counters updated with the number of pixels rejected per reason
+
+        Returns:
+            Boolean mask of pixels passing QA, or None if no QA layer is available
+        """
+        mask = None
+
+        if vi_quality is not None:
+            qa = vi_quality.astype(np.uint16, copy=False)
+            mask = _bit_field(qa, MODLAND_QA_BITS) <= self.max_modland_qa
+            rejected["modland_qa"] += int(mask.size - np.count_nonzero(mask))
+
+            usable = _bit_field(qa, VI_USEFULNESS_BITS) <= self.max_vi_usefulness
+            flags = []
+            if self.exclude_mixed_clouds:
+                flags.append(MIXED_CLOUDS_BIT)
+            if self.exclude_snow_ice:
+                flags.append(SNOW_ICE_BIT)
+            if self.exclude_shadow:
+                flags.append(SHADOW_BIT)
+            if flags:
+                flag_mask = np.uint16(sum(1 << bit for bit in flags))
+                usable &= (qa & flag_mask) == 0
+            rejected["vi_usefulness_flags"] += int(np.count_nonzero(mask & ~usable))
+            mask &= usable
+
+        if reliability is not None:
+            reliable = (reliability >= 0) & (reliability <= self.max_pixel_reliability)
+            if mask is None:
+                rejected["pixel_reliability"] += int(reliable.size - np.count_nonzero(reliable))
+                mask = reliable
+            else:
+                rejected["pixel_reliability"] += int(np.count_nonzero(mask & ~reliable))
+                mask &= reliable
+
+        return mask
+
+    def summarize_counts(self, layer: str, counts: np.ndarray, total_pixels: int,
+                         shape: List[int], rejected: Dict[str, int]) -> Dict[str, Any]:
+        """
+        Turn per-raw-value counts into the layer summary.
+
+        Args:
+            layer (str): Layer key
+            counts (np.ndarray): Pixel counts indexed by raw value - valid_range[0]
+            total_pixels (int): Pixels in the tile
+            shape (List[int]): [rows, cols] of the layer
+            rejected (Dict[str, int]): Pixels removed per reason
+
+        Returns:
+            Dict containing statistics, histogram and percentiles of scaled values
+        """
+        spec = MOD13Q1_LAYERS[layer]
+        low, high = spec["valid_range"]
+        scale = spec["scale_factor"]
+        valid = int(counts.sum())
+
+        summary = {
+            "shape": shape,
+            "data_type": "int16",
+            "min_value": None,
+            "max_value": None,
+            "mean_value": None,
+            "std_value": None,
+            "valid_pixels": valid,
+            "total_pixels": total_pixels,
+            "masked_pixels": dict(rejected),
+            "fill_value": spec["fill_value"],
+            "scale_factor": scale,
+            "attributes": {
+                "long_name": spec["long_name"],
+                "units": spec["units"],
+                "valid_range": spec["valid_range"]
+            }
+        }
+        if valid == 0:
+            return summary
+
+        values = (np.arange(low, high + 1, dtype=np.float64)) * scale
+        present = np.nonzero(counts)[0]
+        mean = float(np.dot(values, counts) / valid)
+        variance = float(np.dot(np.square(values - mean), counts) / valid)
+
+        # Equal-width histogram over the valid range, built by summing raw-value counts
+        edges = np.linspace(low, high + 1, self.histogram_bins + 1)
+        bin_index = np.minimum(
+            ((np.arange(low, high + 1) - low) * self.histogram_bins) // (high + 1 - low),
+            self.histogram_bins - 1
+        )
+        histogram = np.bincount(bin_index, weights=counts, minlength=self.histogram_bins)
+
+        cumulative = np.cumsum(counts)
+        percentile_values = {}
+        for p in self.percentiles:
+            rank = min(valid - 1, int(np.floor(p / 100.0 * (valid - 1))))
+            percentile_values[f"p{p:g}"] = float(values[np.searchsorted(cumulative, rank, side="right")])
+
+        summary.update({
+            "min_value": float(values[present[0]]),
+            "max_value": float(values[present[-1]]),
+            "mean_value": mean,
+            "std_value": float(np.sqrt(variance)),
+            "percentiles": percentile_values,
+            "histogram": {
+                "bin_edges": (edges * scale).tolist(),
+                "counts": histogram.astype(np.int64).tolist()
+            }
+        })
+        return summary
+
+    def process_file(self, hdf_file: Path) -> Dict[str, Any]:
+        """
+        Compute QA-masked statistics for every MOD13Q1 layer of one tile.
+
+        Args:
+            hdf_file (Path): Path to the MOD13Q1 HDF4 file
+
+        Returns:
+            Dict containing vegetation_indices, reflectance_bands and quality_layers
+
+        Raises:
+            RuntimeError: If no HDF4 reader is available
+            ValueError: If the file has no vegetation index layers, or a layer's stored
+                scale_factor or _FillValue differs from the MOD13Q1 encoding
+        """
+        with Hdf4TileReader(hdf_file) as reader:
+            layers = reader.available_layers()
+            index_layers = [layer for layer in INDEX_LAYERS if layer in layers]
+            reflectance_layers = [layer for layer in REFLECTANCE_LAYERS if layer in layers]
+            if not index_layers:
+                raise ValueError("No MOD13Q1 vegetation index layers found")
+
+            rows, cols = reader.shape(index_layers[0])
+            value_layers = index_layers + reflectance_layers
+            has_quality = "VI_Quality" in layers
+            has_reliability = "pixel_reliability" in layers
+
+            # Values are decoded with the product encoding, so a file that declares another one is rejected
+            mismatches = [mismatch for layer in layers for mismatch in reader.check_encoding(layer)]
+            if mismatches:
+                raise ValueError(f"Unexpected MOD13Q1 layer encoding: {'; '.join(mismatches)}")
+            strip_rows = self.rows_per_strip(cols, len(value_layers))
+
+            counts = {}
+            rejected = {}
+            for layer in value_layers:
+                low, high = MOD13Q1_LAYERS[layer]["valid_range"]
+                counts[layer] = np.zeros(high - low + 1, dtype=np.int64)
+                rejected[layer] = {"fill": 0, "out_of_range": 0}
+            qa_rejected = {"modland_qa": 0, "vi_usefulness_flags": 0, "pixel_reliability": 0}
+            modland_counts = np.zeros(4, dtype=np.int64)
+            reliability_counts = np.zeros(5, dtype=np.int64)
+
+            for row_start in range(0, rows, strip_rows):
+                row_stop = min(rows, row_start + strip_rows)
+
+                vi_quality = reader.read_rows("VI_Quality", row_start, row_stop) if has_quality else None
+                reliability = reader.read_rows("pixel_reliability", row_start, row_stop) if has_reliability else None
+                if vi_quality is not None:
+                    modland_counts += np.bincount(
+                        _bit_field(vi_quality.astype(np.uint16, copy=False), MODLAND_QA_BITS).ravel(), minlength=4)
+                if reliability is not None:
+                    reliability_counts += np.bincount(
+                        np.clip(reliability.astype(np.int16) + 1, 0, 4).ravel(), minlength=5)
+                qa_mask = self.quality_mask(vi_quality, reliability, qa_rejected)
+
+                for layer in value_layers:
+                    spec = MOD13Q1_LAYERS[layer]
+                    low, high = spec["valid_range"]
+                    raw = reader.read_rows(layer, row_start, row_stop)
+
+                    is_fill = raw == spec["fill_value"]
+                    in_range = (raw >= low) & (raw <= high)
+                    rejected[layer]["fill"] += int(np.count_nonzero(is_fill))
+                    rejected[layer]["out_of_range"] += int(np.count_nonzero(~in_range & ~is_fill))
+
+                    keep = in_range
+                    if qa_mask is not None and layer in index_layers:
+                        keep &= qa_mask
+                    counts[layer] += np.bincount((raw[keep].astype(np.int32) - low), minlength=high - low + 1)
+
+            shape = [rows, cols]
+            summaries = {
+                layer: self.summarize_counts(
+                    layer, counts[layer], rows * cols, shape,
+                    {**rejected[layer], **(qa_rejected if layer in index_layers else {})}
+                )
+                for layer in value_layers
+            }
+
+            quality_data = {}
+            if has_quality:
+                quality_data["VI_Quality"] = {
+                    "shape": shape,
+                    "data_type": "uint16",
+                    "unique_values": [int(v) for v in np.nonzero(modland_counts)[0]],
+                    "value_counts": {int(v): int(c) for v, c in enumerate(modland_counts) if c},
+                    "attributes": {
+                        "long_name": "VI Quality",
+                        "description": "MODLAND QA bits 0-1: 0 good, 1 check other QA, 2 cloudy, 3 not produced"
+                    }
+                }
+            if has_reliability:
+                quality_data["pixel_reliability"] = {
+                    "shape": shape,
+                    "data_type": "int8",
+                    "value_counts": {
+                        PIXEL_RELIABILITY_LABELS[v - 1]: int(c) for v, c in enumerate(reliability_counts) if c
+                    },
+                    "attributes": {
+                        "long_name": "Quality reliability of VI pixel",
+                        "description": "-1 fill, 0 good, 1 marginal, 2 snow/ice, 3 cloudy"
+                    }
+                }
+
+            return {
+                "reader": reader.backend,
+                "strip_rows": strip_rows,
+                "vegetation_indices": {layer: summaries[layer] for layer in index_layers},
+                "reflectance_bands": {layer: summaries[layer] for layer in reflectance_layers},
+                "quality_layers": quality_data
+            }
+
+    def process_files(self, hdf_files: List[Path], max_workers: int = 1) -> List[Any]:
+        """
+        Process many tiles, spreading them across a process pool.
+
+        Args:
+            hdf_files (List[Path]): Tiles to process
+            max_workers (int): Worker processes; 1 processes tiles in this process
+
+        Returns:
+            List with, per tile, its result dict or the exception raised for it
+        """
+        if max_workers <= 1 or len(hdf_files) <= 1:
+            return [_process_tile(self.get_config(), path) for path in hdf_files]
+
+        config = self.get_config()
+        # spawn, like the shared CPU pool, so workers never inherit a forked TensorFlow/BLAS state
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(hdf_files)), mp_context=context) as pool:
+            return list(pool.map(_process_tile, [config] * len(hdf_files), hdf_files))
+
+
+def _process_tile(config: Dict[str, Any], hdf_file: Path) -> Any:
+    """Worker entry point: process one tile and return its result or the exception."""
+    try:
+        return VegetationIndexEngine(**config).process_file(hdf_file)
+    except Exception as e:
+        return e
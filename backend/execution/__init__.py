@@ -0,0 +1,12 @@
+"""
+Execution module for BloomTracker backend.
+
+This module provides the shared thread and process pools used to run blocking
+loader, model and HTTP work off the asyncio event loop, and the background
+job queue built on top of them.
+"""
+
+from .executor import ExecutionManager, ExecutorSaturatedError, execution_manager, worker_cpu_budget
+from .jobs import Job, JobManager, job_manager
+
+__all__ = ['ExecutionManager', 'ExecutorSaturatedError', 'execution_manager', 'worker_cpu_budget', 'Job', 'JobManager', 'job_manager']
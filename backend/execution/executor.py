@@ -0,0 +1,261 @@
+"""
+Shared execution layer for blocking work in BloomTracker endpoints.
+
+This module keeps synchronous raster/NetCDF reads, model fitting and outbound
+HTTP calls off the asyncio event loop, using a bounded thread pool for I/O
+and a process pool for CPU-bound fitting.
+"""
+
+import os
+import asyncio
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from functools import partial
+from typing import Dict, Any, Optional, Callable, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# CPUs available to each process-pool worker; None outside the pool
+_worker_cpu_budget: Optional[int] = None
+
+
+def _init_cpu_worker(cpu_budget: Optional[int] = None, initializers: Tuple[Tuple[Callable, tuple], ...] = ()):
+    """Configure logging, record the CPU budget and run registered initializers in a freshly spawned worker."""
+    global _worker_cpu_budget
+    _worker_cpu_budget = cpu_budget
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    for func, args in initializers:
+        # An initializer that raises would break the whole pool, so failures are only logged
+        try:
+            result = func(*args)
+            logger.info(f"Worker {os.getpid()} initializer {getattr(func, '__name__', func)}: {result}")
+        except Exception as e:
+            logger.error(f"Worker {os.getpid()} initializer {getattr(func, '__name__', func)} failed: {str(e)}")
+
+
+def worker_cpu_budget() -> Optional[int]:
+    """
+    Get the CPUs the current process may use for nested parallelism.
+
+    Returns:
+        int: The machine's CPUs divided among the process pool's workers when
+        called inside one, or None outside the pool
+    """
+    return _worker_cpu_budget
+
+
+class ExecutorSaturatedError(RuntimeError):
+    """Raised when a pool's queue is full and a job cannot be accepted."""
+
+
+class _PoolMetrics:
+    """Thread-safe counters describing the load on a single pool."""
+
+    def __init__(self, name: str, workers: int, max_queue: int):
+        self.name = name
+        self.workers = workers
+        self.max_queue = max_queue
+        self.in_flight = 0
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.peak_queue_depth = 0
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        """Reserve a slot for a new job, or record a rejection if the queue is full."""
+        with self._lock:
+            queued = max(0, self.in_flight - self.workers)
+            if self.max_queue and queued >= self.max_queue:
+                self.rejected += 1
+                return False
+            self.in_flight += 1
+            self.submitted += 1
+            self.peak_queue_depth = max(self.peak_queue_depth, max(0, self.in_flight - self.workers))
+            return True
+
+    def release(self, failed: bool):
+        """Release a job slot once it has finished."""
+        with self._lock:
+            self.in_flight -= 1
+            if failed:
+                self.failed += 1
+            else:
+                self.completed += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get a consistent copy of the counters."""
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "max_queue": self.max_queue,
+                "running": min(self.in_flight, self.workers),
+                "queue_depth": max(0, self.in_flight - self.workers),
+                "peak_queue_depth": self.peak_queue_depth,
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "failed": self.failed,
+                "rejected": self.rejected
+            }
+
+
+class ExecutionManager:
+    """
+    Runs blocking callables on shared worker pools from async endpoints.
+
+    I/O-bound work (file reads, HTTP calls) goes to a bounded thread pool and
+    CPU-bound work (model fitting) goes to a process pool, so a slow request
+    never freezes the uvicorn worker serving health checks and cheap endpoints.
+    """
+
+    def __init__(self, io_workers: Optional[int] = None, cpu_workers: Optional[int] = None,
+                 max_queue: Optional[int] = None, start_method: Optional[str] = None):
+        """
+        Initialize the execution manager.
+
+        Args:
+            io_workers (int): Thread pool size (IO_POOL_SIZE, default 8)
+            cpu_workers (int): Process pool size (CPU_POOL_SIZE, default CPU count);
+                0 runs CPU-bound work on the thread pool instead
+            max_queue (int): Maximum queued jobs per pool before rejecting (EXECUTOR_MAX_QUEUE, default 64; 0 = unbounded)
+            start_method (str): multiprocessing start method for the process pool (CPU_POOL_START_METHOD, default spawn)
+        """
+        self.io_workers = io_workers if io_workers is not None else int(os.getenv("IO_POOL_SIZE", "8"))
+        self.cpu_workers = cpu_workers if cpu_workers is not None else int(
+            os.getenv("CPU_POOL_SIZE", str(os.cpu_count() or 2)))
+        self.max_queue = max_queue if max_queue is not None else int(os.getenv("EXECUTOR_MAX_QUEUE", "64"))
+        # spawn avoids forking a parent that has already initialised TensorFlow/BLAS threads
+        self.start_method = start_method or os.getenv("CPU_POOL_START_METHOD", "spawn")
+
+        self.io_metrics = _PoolMetrics("io", self.io_workers, self.max_queue)
+        self.cpu_metrics = _PoolMetrics("cpu", self.cpu_workers or self.io_workers, self.max_queue)
+
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+        self._cpu_pool: Optional[ProcessPoolExecutor] = None
+        self._worker_initializers: List[Tuple[Callable, tuple]] = []
+        self._lock = threading.Lock()
+
+    def add_worker_initializer(self, func: Callable, *args):
+        """
+        Run a callable in every process-pool worker when it starts.
+
+        Workers are started on demand, so each one runs it exactly once
+        before its first job, whichever jobs it ends up taking. Must be
+        called before the process pool is first used.
+
+        Args:
+            func (Callable): Picklable module-level function
+            *args: Picklable arguments
+
+        Raises:
+            RuntimeError: If the process pool has already been created
+        """
+        with self._lock:
+            if self._cpu_pool is not None:
+                raise RuntimeError("Worker initializers must be added before the process pool starts")
+            self._worker_initializers.append((func, args))
+
+    @property
+    def io_pool(self) -> ThreadPoolExecutor:
+        """Thread pool for I/O-bound work, created on first use."""
+        with self._lock:
+            if self._io_pool is None:
+                self._io_pool = ThreadPoolExecutor(max_workers=self.io_workers, thread_name_prefix="bloomtrack-io")
+            return self._io_pool
+
+    @property
+    def cpu_pool(self) -> Executor:
+        """Process pool for CPU-bound work, created on first use."""
+        if self.cpu_workers <= 0:
+            return self.io_pool
+        with self._lock:
+            if self._cpu_pool is None:
+                context = multiprocessing.get_context(self.start_method)
+                self._cpu_pool = ProcessPoolExecutor(
+                    max_workers=self.cpu_workers,
+                    mp_context=context,
+                    initializer=_init_cpu_worker,
+                    initargs=(max(1, (os.cpu_count() or 1) // self.cpu_workers), tuple(self._worker_initializers))
+                )
+            return self._cpu_pool
+
+    async def _run(self, pool: Executor, metrics: _PoolMetrics, func: Callable, *args, **kwargs) -> Any:
+        """Submit a callable to a pool and await it while tracking metrics."""
+        if not metrics.try_acquire():
+            raise ExecutorSaturatedError(f"The {metrics.name} pool queue is full ({metrics.max_queue} jobs waiting)")
+
+        try:
+            future = pool.submit(partial(func, *args, **kwargs))
+        except Exception:
+            metrics.release(failed=True)
+            raise
+
+        # Release on completion of the job itself, not of the awaiting coroutine,
+        # so jobs abandoned by a timeout still count as running until they finish
+        future.add_done_callback(lambda f: metrics.release(failed=f.cancelled() or f.exception() is not None))
+        return await asyncio.wrap_future(future)
+
+    async def run_io(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run a blocking I/O-bound callable on the thread pool.
+
+        Args:
+            func (Callable): Function to run
+            *args, **kwargs: Arguments forwarded to the function
+
+        Returns:
+            The function's return value
+        """
+        return await self._run(self.io_pool, self.io_metrics, func, *args, **kwargs)
+
+    async def run_cpu(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run a CPU-bound callable on the process pool.
+
+        The callable and its arguments must be picklable, i.e. module-level
+        functions taking plain data.
+
+        Args:
+            func (Callable): Function to run
+            *args, **kwargs: Arguments forwarded to the function
+
+        Returns:
+            The function's return value
+        """
+        return await self._run(self.cpu_pool, self.cpu_metrics, func, *args, **kwargs)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pool sizes and queue-depth metrics.
+
+        Returns:
+            Dict containing metrics for the io and cpu pools
+        """
+        return {
+            "io": self.io_metrics.snapshot(),
+            "cpu": {
+                **self.cpu_metrics.snapshot(),
+                "mode": "process" if self.cpu_workers > 0 else "thread",
+                "start_method": self.start_method
+            }
+        }
+
+    def shutdown(self, wait: bool = True):
+        """Shut down both pools."""
+        with self._lock:
+            if self._io_pool is not None:
+                self._io_pool.shutdown(wait=wait)
+                self._io_pool = None
+            if self._cpu_pool is not None:
+                self._cpu_pool.shutdown(wait=wait)
+                self._cpu_pool = None
+
+
+# Global instance
+execution_manager = ExecutionManager()
@@ -0,0 +1,224 @@
+"""
+Background job queue for long-running BloomTracker work.
+
+This module runs batches of CPU-bound calls (e.g. model training) on the
+shared process pool in the background, so endpoints can return a job id at
+once. Identical in-flight jobs are de-duplicated and the number of items
+running at the same time is capped so training never starves predictions.
+"""
+
+import os
+import time
+import uuid
+import asyncio
+import logging
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Callable, Tuple
+
+from .executor import ExecutionManager, execution_manager
+
+logger = logging.getLogger(__name__)
+
+# 'partial': some items completed and some failed; 'failed': no item completed
+JOB_STATUSES = ("queued", "running", "completed", "partial", "failed")
+
+
+class Job:
+    """State of one background job made of one or more work items."""
+
+    def __init__(self, kind: str, key: Tuple, items: List[Tuple]):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.key = key
+        self.items = items
+        self.status = "queued"
+        self.created_at = datetime.now()
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self._started = None
+        self._finished = None
+        self.completed_items = 0
+        self.failed_items = 0
+        self.results: List[Dict[str, Any]] = []
+        self.done = asyncio.Event()
+        # The event loop only keeps a weak reference to tasks, so the job holds its own
+        self.task: Optional[asyncio.Task] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Export the job's status, progress, timing and results.
+
+        Returns:
+            Dict describing the job
+        """
+        total = len(self.items)
+        finished = self.completed_items + self.failed_items
+        if self._started is None:
+            elapsed = 0.0
+        else:
+            elapsed = (self._finished or time.monotonic()) - self._started
+
+        return {
+            "job_id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "progress": {
+                "completed": self.completed_items,
+                "failed": self.failed_items,
+                "total": total,
+                "fraction": round(finished / total, 3) if total else 1.0
+            },
+            "created_at": self.created_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "elapsed_seconds": round(elapsed, 3),
+            "results": self.results
+        }
+
+
+class JobManager:
+    """
+    Queues batches of picklable calls and runs them on the CPU pool.
+
+    Each job is a list of argument tuples for one function. Items of all jobs
+    share a semaphore of max_concurrent slots; a job submitted while an
+    identical one is queued or running returns the existing job instead.
+    """
+
+    def __init__(self, executor: Optional[ExecutionManager] = None, max_concurrent: Optional[int] = None,
+                 history_limit: Optional[int] = None):
+        """
+        Initialize the job manager.
+
+        Args:
+            executor (ExecutionManager): Pools used to run items (default: the shared execution_manager)
+            max_concurrent (int): Items running at once across all jobs (JOB_MAX_CONCURRENT, default 2)
+            history_limit (int): Finished jobs kept for status queries (JOB_HISTORY_LIMIT, default 100)
+        """
+        self.executor = executor or execution_manager
+        self.max_concurrent = max_concurrent if max_concurrent is not None else int(
+            os.getenv("JOB_MAX_CONCURRENT", "2"))
+        self.history_limit = history_limit if history_limit is not None else int(
+            os.getenv("JOB_HISTORY_LIMIT", "100"))
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._active: Dict[Tuple, str] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def submit(self, kind: str, func: Callable, items: List[Tuple]) -> Tuple[Job, bool]:
+        """
+        Start a job in the background, or join an identical in-flight job.
+
+        Must be called from the running event loop (e.g. an async endpoint).
+
+        Args:
+            kind (str): Job kind, e.g. 'train'
+            func (Callable): Module-level function run once per item in the process pool
+            items (List[Tuple]): Positional arguments for each call
+
+        Returns:
+            Tuple of (job, True if an existing job was returned)
+        """
+        key = (kind, getattr(func, "__qualname__", repr(func)), tuple(items))
+        existing = self._active.get(key)
+        if existing is not None and existing in self._jobs:
+            return self._jobs[existing], True
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+
+        job = Job(kind, key, list(items))
+        self._jobs[job.id] = job
+        self._active[key] = job.id
+        self._prune_history()
+        job.task = asyncio.get_running_loop().create_task(self._run_job(job, func))
+        logger.info(f"Queued {kind} job {job.id} with {len(items)} item(s)")
+        return job, False
+
+    async def _run_job(self, job: Job, func: Callable):
+        """Run every item of a job, bounded by the shared semaphore."""
+        async def run_item(args: Tuple):
+            async with self._semaphore:
+                if job.status == "queued":
+                    job.status = "running"
+                    job.started_at = datetime.now()
+                    job._started = time.monotonic()
+                item_started = time.monotonic()
+                try:
+                    result = await self.executor.run_cpu(func, *args)
+                    job.completed_items += 1
+                    job.results.append({"args": list(args), "status": "completed", "result": result,
+                                        "duration_seconds": round(time.monotonic() - item_started, 3)})
+                except Exception as e:
+                    logger.error(f"{job.kind} job {job.id} item {args} failed: {str(e)}")
+                    job.failed_items += 1
+                    job.results.append({"args": list(args), "status": "failed", "error": str(e),
+                                        "duration_seconds": round(time.monotonic() - item_started, 3)})
+
+        try:
+            await asyncio.gather(*(run_item(args) for args in job.items))
+        finally:
+            if not job.completed_items:
+                job.status = "failed"
+            else:
+                job.status = "partial" if job.failed_items else "completed"
+            job.finished_at = datetime.now()
+            job._finished = time.monotonic()
+            if job._started is None:
+                job._started = job._finished
+            self._active.pop(job.key, None)
+            job.done.set()
+            logger.info(f"{job.kind} job {job.id} {job.status}: "
+                        f"{job.completed_items} completed, {job.failed_items} failed")
+
+    async def shutdown(self):
+        """Cancel the jobs still queued or running and wait for them to finish, e.g. when the server stops."""
+        tasks = [job.task for job in self._jobs.values() if job.task is not None and not job.task.done()]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            logger.info(f"Cancelling {len(tasks)} unfinished job(s)")
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _prune_history(self):
+        """Forget the oldest finished jobs beyond the history limit."""
+        finished = [job_id for job_id, job in self._jobs.items() if job.done.is_set()]
+        for job_id in finished[:max(0, len(finished) - self.history_limit)]:
+            del self._jobs[job_id]
+
+    def get_job(self, job_id: str) -> Optional[Job]:
+        """
+        Look up a job by id.
+
+        Args:
+            job_id (str): Job id returned by submit()
+
+        Returns:
+            The job, or None if unknown or pruned
+        """
+        return self._jobs.get(job_id)
+
+    def list_jobs(self) -> List[Dict[str, Any]]:
+        """
+        List known jobs, newest first.
+
+        Returns:
+            List of job dicts
+        """
+        return [job.to_dict() for job in reversed(self._jobs.values())]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get job counts by status.
+
+        Returns:
+            Dict containing the concurrency limit and job counts
+        """
+        counts = {status: 0 for status in JOB_STATUSES}
+        for job in self._jobs.values():
+            counts[job.status] += 1
+        return {"max_concurrent": self.max_concurrent, "jobs": counts}
+
+
+# Global instance
+job_manager = JobManager()
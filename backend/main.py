@@ -11,10 +11,11 @@ Author: BloomTracker Team
 
 import os
 import json
+import asyncio
 import logging
 from pathlib import Path
 from typing import Dict, List, Any, Optional
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
@@ -27,9 +28,14 @@ load_dotenv()
 from data_loaders.modis_loader import ModisDataLoader
 from data_loaders.merra_loader import MerraDataLoader
 from data_loaders.alos_loader import AlosDataLoader
+from data_loaders.catalog import DataCatalog
+
+# Import shared execution layer
+from execution import execution_manager, ExecutorSaturatedError, job_manager
 
 # Import prediction router
-from prediction.router import router as prediction_router
+from prediction.router import router as prediction_router, forecast_cache
+from prediction.backends import warmup_backend_names, warm_up_backends
 
 # Import plant analysis router
 from plant_analysis.plant_router import router as plant_router
@@ -76,6 +82,21 @@ modis_loader = ModisDataLoader()
 merra_loader = MerraDataLoader()
 alos_loader = AlosDataLoader()
 
+# Per-file index shared by the /data/* endpoints
+data_catalog = DataCatalog(
+    {"modis": modis_loader, "merra": merra_loader, "alos": alos_loader},
+    db_path=os.getenv("CATALOG_PATH", "cache/catalog.sqlite"),
+    min_refresh_interval=float(os.getenv("CATALOG_REFRESH_INTERVAL", "5")),
+    retry_interval=float(os.getenv("CATALOG_RETRY_INTERVAL", "30"))
+)
+
+# Per-source load timeouts in seconds (DATA_SOURCE_TIMEOUT_<SOURCE> overrides the default)
+DEFAULT_SOURCE_TIMEOUT = float(os.getenv("DATA_SOURCE_TIMEOUT", "60"))
+SOURCE_TIMEOUTS = {
+    source: float(os.getenv(f"DATA_SOURCE_TIMEOUT_{source.upper()}", DEFAULT_SOURCE_TIMEOUT))
+    for source in ("modis", "merra", "alos")
+}
+
 # Include prediction router
 app.include_router(prediction_router)
 
@@ -83,6 +104,59 @@ app.include_router(prediction_router)
 app.include_router(plant_router)
 app.include_router(plant_ai_router)
 
+@app.on_event("startup")
+async def warm_catalog():
+    """Index new or changed data files in the background so the first requests are cheap."""
+    async def refresh():
+        try:
+            summary = await execution_manager.run_io(data_catalog.refresh_all)
+            logger.info(f"Catalog refreshed: {summary}")
+        except Exception as e:
+            logger.error(f"Catalog refresh failed: {str(e)}")
+    asyncio.create_task(refresh())
+
+@app.on_event("startup")
+async def warm_prediction_backends():
+    """Preload the ML libraries named in PREDICTION_WARMUP in every worker process, off the request path."""
+    names = warmup_backend_names()
+    if not names:
+        return
+    
+    if execution_manager.cpu_workers <= 0:
+        # Model fitting runs on the thread pool, so the libraries are loaded in this process
+        async def warm_up_here():
+            try:
+                results = await execution_manager.run_io(warm_up_backends, names)
+                logger.info(f"Prediction backends warmed up: {results}")
+            except Exception as e:
+                logger.error(f"Prediction backend warm-up failed: {str(e)}")
+        asyncio.create_task(warm_up_here())
+        return
+    
+    try:
+        # Runs in each worker as it starts, so no worker is left cold
+        execution_manager.add_worker_initializer(warm_up_backends, names)
+    except RuntimeError as e:
+        logger.error(f"Prediction backend warm-up not registered: {str(e)}")
+        return
+    
+    async def start_workers():
+        # Starting the workers now keeps their imports off the first requests; workers the
+        # pool starts later run the same initializer
+        workers = execution_manager.cpu_workers
+        try:
+            await asyncio.gather(*(execution_manager.run_cpu(os.getpid) for _ in range(workers)))
+            logger.info(f"Prediction backends warming up in worker processes: {', '.join(names)}")
+        except Exception as e:
+            logger.error(f"Prediction worker start-up failed: {str(e)}")
+    asyncio.create_task(start_workers())
+
+@app.on_event("shutdown")
+async def shutdown_executors():
+    """Cancel unfinished background jobs and shut down the shared worker pools when the server stops."""
+    await job_manager.shutdown()
+    execution_manager.shutdown(wait=False)
+
 # Pydantic models for API responses
 class DataResponse(BaseModel):
     """Base response model for data endpoints."""
@@ -112,7 +186,9 @@ async def root():
             "modis": "/data/modis",
             "merra": "/data/merra", 
             "alos": "/data/alos",
-            "health": "/health"
+            "catalog": "/data/catalog",
+            "health": "/health",
+            "metrics": "/metrics"
         }
     }
 
@@ -126,6 +202,17 @@ async def health_check():
     """
     return {"status": "healthy", "service": "BloomTracker API"}
 
+@app.get("/metrics")
+async def get_metrics():
+    """
+    Report worker pool sizes, queue depths, background job counts and forecast cache counters.
+    
+    Returns:
+        Dict containing execution layer and forecast cache metrics
+    """
+    return {"executor": execution_manager.get_stats(), "jobs": job_manager.get_stats(),
+            "forecast_cache": forecast_cache.get_stats()}
+
 @app.get("/data/modis", response_model=DataResponse)
 async def get_modis_data():
     """
@@ -139,7 +226,7 @@ async def get_modis_data():
     """
     try:
         logger.info("Processing MODIS data request")
-        data = modis_loader.load_data()
+        data = await execution_manager.run_io(data_catalog.load, "modis")
         
         return DataResponse(
             success=True,
@@ -151,6 +238,8 @@ async def get_modis_data():
             },
             message="MODIS data processed successfully"
         )
+    except ExecutorSaturatedError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         logger.error(f"Error processing MODIS data: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error processing MODIS data: {str(e)}")
@@ -168,7 +257,7 @@ async def get_merra_data():
     """
     try:
         logger.info("Processing MERRA-2 data request")
-        data = merra_loader.load_data()
+        data = await execution_manager.run_io(data_catalog.load, "merra")
         
         return DataResponse(
             success=True,
@@ -180,24 +269,35 @@ async def get_merra_data():
             },
             message="MERRA-2 data processed successfully"
         )
+    except ExecutorSaturatedError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         logger.error(f"Error processing MERRA-2 data: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error processing MERRA-2 data: {str(e)}")
 
 @app.get("/data/alos", response_model=DataResponse)
-async def get_alos_data():
+async def get_alos_data(
+    stats: str = Query("exact", description="Band statistics mode: exact, approximate")
+):
     """
     Retrieve and process ALOS PALSAR terrain data.
     
     Processes .tif, .kmz, .xml, .jpg, and .wld files from the ALOS PALSAR folder,
     extracting geospatial information and creating summaries.
     
+    Args:
+        stats: 'exact' for full-resolution band statistics, or 'approximate' to
+            compute them from internal overviews / a decimated read
+    
     Returns:
         DataResponse containing processed ALOS PALSAR data
     """
     try:
         logger.info("Processing ALOS PALSAR data request")
-        data = alos_loader.load_data()
+        if stats not in ("exact", "approximate"):
+            raise HTTPException(status_code=400, detail="Invalid stats mode. Must be: exact, approximate")
+        
+        data = await execution_manager.run_io(data_catalog.load, "alos", stats_mode=stats)
         
         return DataResponse(
             success=True,
@@ -205,14 +305,54 @@ async def get_alos_data():
             metadata={
                 "source": "ALOS PALSAR High Resolution Radiometric Terrain",
                 "file_types": ["TIF", "KMZ", "XML", "JPG", "WLD"],
+                "statistics_mode": stats,
                 "processed_files": len(data.get("files", []))
             },
             message="ALOS PALSAR data processed successfully"
         )
+    except HTTPException:
+        raise
+    except ExecutorSaturatedError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         logger.error(f"Error processing ALOS PALSAR data: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error processing ALOS PALSAR data: {str(e)}")
 
+@app.get("/data/catalog", response_model=DataResponse)
+async def get_data_catalog(
+    source: Optional[str] = Query(None, description="Restrict to one source: modis, merra, alos")
+):
+    """
+    List the indexed data files with their bounds, CRS, dimensions, time range,
+    statistics and checksum, straight from the catalog.
+    
+    Args:
+        source: Optional data source filter
+    
+    Returns:
+        DataResponse containing the catalog entries
+    """
+    try:
+        if source is not None and source not in data_catalog.loaders:
+            raise HTTPException(status_code=400, detail="Invalid source. Must be: modis, merra, alos")
+        
+        entries = await execution_manager.run_io(data_catalog.list_entries, source)
+        stats = await execution_manager.run_io(data_catalog.get_stats)
+        
+        return DataResponse(
+            success=True,
+            data=entries,
+            metadata=stats,
+            message=f"{len(entries)} catalog entries"
+        )
+    except HTTPException:
+        raise
+    except ExecutorSaturatedError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error reading data catalog: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error reading data catalog: {str(e)}")
+
 @app.get("/data/all", response_model=DataResponse)
 async def get_all_data():
     """
@@ -226,25 +366,64 @@ async def get_all_data():
     try:
         logger.info("Processing all data sources request")
         
-        all_data = {
-            "modis": modis_loader.load_data(),
-            "merra": merra_loader.load_data(),
-            "alos": alos_loader.load_data()
-        }
+        sources = list(data_catalog.loaders.keys())
+        results = await asyncio.gather(
+            *(_load_source(source) for source in sources),
+            return_exceptions=True
+        )
+        
+        # Keep whatever finished in time and report the sources that did not
+        all_data = {}
+        errors = {}
+        for source, result in zip(sources, results):
+            if isinstance(result, asyncio.TimeoutError):
+                logger.warning(f"Loading {source} data timed out after {SOURCE_TIMEOUTS[source]}s")
+                errors[source] = f"Timed out after {SOURCE_TIMEOUTS[source]}s"
+            elif isinstance(result, Exception):
+                logger.error(f"Error loading {source} data: {str(result)}")
+                errors[source] = str(result)
+            else:
+                all_data[source] = result
+        
+        if not all_data:
+            raise HTTPException(status_code=500, detail=f"Error processing all data: {errors}")
         
         return DataResponse(
             success=True,
             data=all_data,
             metadata={
                 "sources": ["MODIS", "MERRA-2", "ALOS PALSAR"],
+                "loaded_sources": list(all_data.keys()),
+                "failed_sources": errors,
                 "total_files": sum(len(data.get("files", [])) for data in all_data.values())
             },
-            message="All data sources processed successfully"
+            message="All data sources processed successfully" if not errors
+                    else f"Partial data returned; unavailable sources: {', '.join(errors.keys())}"
         )
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error processing all data: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error processing all data: {str(e)}")
 
+async def _load_source(source: str) -> Dict[str, Any]:
+    """
+    Load a single data source from the catalog with its configured timeout.
+    
+    Runs on the shared I/O pool; a timed-out load keeps running in its worker
+    thread, so the catalog is still updated for the next request.
+    
+    Args:
+        source: Data source name (modis, merra, alos)
+        
+    Returns:
+        Dict containing the loader's processed data
+    """
+    return await asyncio.wait_for(
+        execution_manager.run_io(data_catalog.load, source),
+        timeout=SOURCE_TIMEOUTS[source]
+    )
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
@@ -6,5 +6,6 @@ for time-series forecasting of geospatial data.
 """
 
 from .model_manager import ModelManager
+from .registry import ModelRegistry
 
-__all__ = ['ModelManager']
+__all__ = ['ModelManager', 'ModelRegistry']
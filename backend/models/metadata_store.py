@@ -0,0 +1,247 @@
+"""
+SQLite store for saved-model metadata.
+
+One row per (dataset, model_type) holds the latest version's information
+and its retained versions. Rows are read and written individually inside
+SQLite transactions (WAL mode), so several uvicorn workers and pool
+processes can save and list models concurrently without rewriting a shared
+JSON file or holding a stale copy of it. Every write bumps a store-wide
+revision, which readers can poll to detect changes cheaply.
+"""
+
+import json
+import sqlite3
+import logging
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Iterator
+
+logger = logging.getLogger(__name__)
+
+METADATA_SCHEMA = """
+CREATE TABLE IF NOT EXISTS models (
+    dataset TEXT NOT NULL,
+    model_type TEXT NOT NULL,
+    version INTEGER,
+    next_version INTEGER NOT NULL DEFAULT 1,
+    last_updated TEXT,
+    total_size INTEGER NOT NULL DEFAULT 0,
+    info TEXT NOT NULL,
+    PRIMARY KEY (dataset, model_type)
+);
+CREATE TABLE IF NOT EXISTS store_state (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO store_state (name, value) VALUES ('revision', 0);
+"""
+
+
+def _total_size(info: Dict[str, Any]) -> int:
+    """Bytes used by every retained version of a model."""
+    if info.get('versions'):
+        return sum(v.get('file_size', 0) for v in info['versions'])
+    return info.get('file_size', 0)
+
+
+class ModelMetadataStore:
+    """
+    Per-key, transactional metadata storage for the ModelManager.
+
+    Version numbers are reserved with reserve_version() in their own
+    transaction, so concurrent saves of the same model never reuse a version.
+    """
+
+    def __init__(self, db_path: Path):
+        """
+        Initialize the store, creating the schema if needed.
+
+        Args:
+            db_path (Path): Location of the SQLite database
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._connect().executescript(METADATA_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Get this thread's connection, opening it on first use.
+
+        Connections are in autocommit mode, so every read sees the latest
+        committed state; WAL lets readers proceed while another process writes.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _write(self) -> Iterator[sqlite3.Connection]:
+        """Run a write transaction that takes the write lock up front and bumps the revision."""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+            conn.execute("UPDATE store_state SET value = value + 1 WHERE name = 'revision'")
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def revision(self) -> int:
+        """
+        Get the store-wide revision, incremented by every write.
+
+        Returns:
+            int: Current revision
+        """
+        return self._connect().execute("SELECT value FROM store_state WHERE name = 'revision'").fetchone()[0]
+
+    def get(self, dataset: str, model_type: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the metadata of one model.
+
+        Args:
+            dataset (str): Dataset name
+            model_type (str): Model type
+
+        Returns:
+            Dict with the model's metadata, or None if it is unknown
+        """
+        row = self._connect().execute("SELECT info FROM models WHERE dataset = ? AND model_type = ?",
+                                      (dataset, model_type)).fetchone()
+        return json.loads(row[0]) if row and row[0] != "{}" else None
+
+    def all(self) -> List[Dict[str, Any]]:
+        """
+        Get the metadata of every model.
+
+        Returns:
+            List of metadata dicts (each including 'dataset' and 'model_type')
+        """
+        rows = self._connect().execute("SELECT dataset, model_type, info FROM models "
+                                       "WHERE info != '{}' ORDER BY dataset, model_type").fetchall()
+        return [{'dataset': dataset, 'model_type': model_type, **json.loads(info)}
+                for dataset, model_type, info in rows]
+
+    def reserve_version(self, dataset: str, model_type: str) -> int:
+        """
+        Reserve the next version number of a model.
+
+        Args:
+            dataset (str): Dataset name
+            model_type (str): Model type
+
+        Returns:
+            int: Version number no other caller will receive
+        """
+        with self._write() as conn:
+            row = conn.execute("SELECT next_version, version FROM models WHERE dataset = ? AND model_type = ?",
+                               (dataset, model_type)).fetchone()
+            if row is None:
+                version = 1
+                conn.execute("INSERT INTO models (dataset, model_type, next_version, info) VALUES (?, ?, ?, '{}')",
+                             (dataset, model_type, 2))
+            else:
+                version = max(row[0], (row[1] or 0) + 1)
+                conn.execute("UPDATE models SET next_version = ? WHERE dataset = ? AND model_type = ?",
+                             (version + 1, dataset, model_type))
+            return version
+
+    def add_version(self, dataset: str, model_type: str, version_info: Dict[str, Any],
+                    max_versions: int) -> List[Dict[str, Any]]:
+        """
+        Record a saved version as the latest and prune the oldest beyond max_versions.
+
+        Args:
+            dataset (str): Dataset name
+            model_type (str): Model type
+            version_info (Dict): Version, last_updated, training_samples, file_size, format and metadata
+            max_versions (int): Versions retained
+
+        Returns:
+            List of pruned version entries, whose files the caller deletes
+        """
+        with self._write() as conn:
+            row = conn.execute("SELECT info FROM models WHERE dataset = ? AND model_type = ?",
+                               (dataset, model_type)).fetchone()
+            previous = json.loads(row[0]) if row else {}
+            versions = sorted(previous.get('versions', []) + [version_info], key=lambda v: v['version'])
+            pruned, versions = versions[:-max_versions], versions[-max_versions:]
+            latest = versions[-1]
+            info = {'dataset': dataset, 'model_type': model_type, **latest, 'versions': versions}
+            conn.execute(
+                "INSERT INTO models (dataset, model_type, version, next_version, last_updated, total_size, info) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (dataset, model_type) DO UPDATE SET version = excluded.version, "
+                "last_updated = excluded.last_updated, total_size = excluded.total_size, info = excluded.info, "
+                "next_version = MAX(models.next_version, excluded.next_version)",
+                (dataset, model_type, latest['version'], latest['version'] + 1, latest.get('last_updated'),
+                 _total_size(info), json.dumps(info, default=str))
+            )
+            return pruned
+
+    def put(self, dataset: str, model_type: str, info: Dict[str, Any]):
+        """
+        Replace the metadata of one model (used to import legacy metadata).
+
+        Args:
+            dataset (str): Dataset name
+            model_type (str): Model type
+            info (Dict): Model metadata
+        """
+        with self._write() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO models (dataset, model_type, version, next_version, last_updated, total_size, info) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (dataset, model_type, info.get('version'), (info.get('version') or 0) + 1, info.get('last_updated'),
+                 _total_size(info), json.dumps({'dataset': dataset, 'model_type': model_type, **info}, default=str))
+            )
+
+    def delete(self, dataset: str, model_type: str) -> Optional[Dict[str, Any]]:
+        """
+        Remove a model's metadata.
+
+        The row is kept as a tombstone holding next_version, so a model saved
+        after the delete never reuses a deleted version number (registries and
+        forecast caches key loaded models on the version).
+
+        Args:
+            dataset (str): Dataset name
+            model_type (str): Model type
+
+        Returns:
+            The removed metadata, or None if the model was unknown
+        """
+        with self._write() as conn:
+            row = conn.execute("SELECT info FROM models WHERE dataset = ? AND model_type = ?",
+                               (dataset, model_type)).fetchone()
+            conn.execute("UPDATE models SET version = NULL, last_updated = NULL, total_size = 0, info = '{}' "
+                         "WHERE dataset = ? AND model_type = ?", (dataset, model_type))
+        return json.loads(row[0]) if row and row[0] != "{}" else None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Aggregate counts and sizes without reading every model's metadata.
+
+        Returns:
+            Dict with total models, total bytes and models per dataset and model type
+        """
+        conn = self._connect()
+        total_models, total_size = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(total_size), 0) FROM models WHERE info != '{}'").fetchone()
+        by_dataset = dict(conn.execute(
+            "SELECT dataset, COUNT(*) FROM models WHERE info != '{}' GROUP BY dataset").fetchall())
+        model_types = [row[0] for row in conn.execute(
+            "SELECT DISTINCT model_type FROM models WHERE info != '{}'").fetchall()]
+        return {
+            'total_models': total_models,
+            'total_size_bytes': total_size,
+            'models_by_dataset': by_dataset,
+            'model_types': model_types
+        }
@@ -2,12 +2,16 @@
 Model management module for persistent storage and loading of trained models.
 
 This module handles saving, loading, and managing trained machine learning models
-for time-series forecasting in the BloomTracker system.
+for time-series forecasting in the BloomTracker system. Model versions are saved
+as compact artifact directories (see serializers); models without a serializer
+and versions saved by older releases use whole-object pickle files. Metadata
+lives in a SQLite store shared by all processes (see metadata_store).
 """
 
 import os
 import json
 import pickle
+import shutil
 import logging
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -15,6 +19,9 @@ from typing import Dict, Any, Optional, Tuple
 import pandas as pd
 import numpy as np
 
+from .metadata_store import ModelMetadataStore
+from .serializers import supports_artifact, save_artifact, load_artifact, load_training_data as load_artifact_training_data
+
 logger = logging.getLogger(__name__)
 
 class ModelManager:
@@ -25,55 +32,89 @@ class ModelManager:
     and managing model metadata for the BloomTracker prediction system.
     """
     
-    def __init__(self, models_dir: str = "models/saved_models"):
+    def __init__(self, models_dir: str = "models/saved_models", max_versions: int = 3):
         """
         Initialize the model manager.
         
         Args:
             models_dir (str): Directory to store saved models
+            max_versions (int): Versions kept per (dataset, model_type); older ones are deleted
         """
         self.models_dir = Path(models_dir)
+        self.max_versions = max_versions
         self.models_dir.mkdir(parents=True, exist_ok=True)
-        self.metadata_file = self.models_dir / "model_metadata.json"
-        self.metadata = self._load_metadata()
-        
-    def _load_metadata(self) -> Dict[str, Any]:
+        self.store = ModelMetadataStore(self.models_dir / "model_metadata.sqlite")
+        self._import_legacy_metadata()
+    
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Snapshot of every model's metadata, keyed by '{dataset}_{model_type}'."""
+        return {f"{info['dataset']}_{info['model_type']}": info for info in self.store.all()}
+    
+    def _import_legacy_metadata(self):
+        """Import model_metadata.json written by older releases into the store, once."""
+        legacy_file = self.models_dir / "model_metadata.json"
+        if not legacy_file.exists():
+            return
+        try:
+            with open(legacy_file, 'r') as f:
+                legacy = json.load(f)
+            for model_key, model_info in legacy.items():
+                dataset = model_info.get('dataset') or model_key.split('_', 1)[0]
+                model_type = model_info.get('model_type') or model_key.split('_', 1)[1]
+                if self.store.get(dataset, model_type) is None:
+                    self.store.put(dataset, model_type, model_info)
+            os.replace(legacy_file, legacy_file.with_suffix(".json.imported"))
+            logger.info(f"Imported {len(legacy)} model metadata entries from {legacy_file}")
+        except Exception as e:
+            logger.warning(f"Could not import legacy model metadata: {str(e)}")
+    
+    def get_revision(self) -> int:
         """
-        Load model metadata from disk.
+        Get the metadata revision, which changes whenever any process saves or deletes a model.
         
         Returns:
-            Dict containing model metadata
+            int: Current revision
         """
-        try:
-            if self.metadata_file.exists():
-                with open(self.metadata_file, 'r') as f:
-                    return json.load(f)
-            else:
-                return {}
-        except Exception as e:
-            logger.warning(f"Could not load model metadata: {str(e)}")
-            return {}
+        return self.store.revision()
     
-    def _save_metadata(self):
-        """Save model metadata to disk."""
-        try:
-            with open(self.metadata_file, 'w') as f:
-                json.dump(self.metadata, f, indent=2, default=str)
-        except Exception as e:
-            logger.error(f"Error saving model metadata: {str(e)}")
-    
-    def get_model_path(self, dataset: str, model_type: str) -> Path:
+    def get_model_path(self, dataset: str, model_type: str, version: Optional[int] = None) -> Path:
         """
         Get the file path for a specific model.
         
         Args:
             dataset (str): Dataset name (modis, merra, alos)
             model_type (str): Model type (arima, prophet, lstm)
+            version (int): Model version, or None for the latest
             
         Returns:
-            Path: File path for the model
+            Path: Artifact directory, or pickle file for pickled versions
         """
-        return self.models_dir / f"{dataset}_{model_type}.pkl"
+        if version is None:
+            model_info = self.get_model_info(dataset, model_type)
+            version = model_info.get('version') if model_info else None
+        if version is None:
+            # Models saved before versioning have no version suffix
+            return self.models_dir / f"{dataset}_{model_type}.pkl"
+        artifact_path = self.models_dir / f"{dataset}_{model_type}_v{version}"
+        if artifact_path.is_dir():
+            return artifact_path
+        return self.models_dir / f"{dataset}_{model_type}_v{version}.pkl"
+    
+    @staticmethod
+    def _path_size(path: Path) -> int:
+        """Size in bytes of a pickle file or an artifact directory."""
+        if path.is_dir():
+            return sum(f.stat().st_size for f in path.iterdir() if f.is_file())
+        return path.stat().st_size
+    
+    @staticmethod
+    def _remove_path(path: Path):
+        """Delete a pickle file or an artifact directory."""
+        if path.is_dir():
+            shutil.rmtree(path, ignore_errors=True)
+        elif path.exists():
+            path.unlink()
     
     def model_exists(self, dataset: str, model_type: str) -> bool:
         """
@@ -100,8 +141,7 @@ class ModelManager:
         Returns:
             Dict containing model information or None if not found
         """
-        model_key = f"{dataset}_{model_type}"
-        return self.metadata.get(model_key)
+        return self.store.get(dataset, model_type)
     
     def is_model_fresh(self, dataset: str, model_type: str, max_age_days: int = 7) -> bool:
         """
@@ -129,7 +169,11 @@ class ModelManager:
     def save_model(self, dataset: str, model_type: str, model: Any, 
                    training_data: pd.DataFrame, metadata: Dict[str, Any]) -> bool:
         """
-        Save a trained model to disk.
+        Save a trained model to disk as a new version.
+        
+        Trained PredictiveModels are written as artifact directories (manifest,
+        native estimator state and a columnar training-data sidecar); other
+        objects are pickled. Only the newest max_versions versions are kept.
         
         Args:
             dataset (str): Dataset name
@@ -142,34 +186,49 @@ class ModelManager:
             bool: True if saved successfully
         """
         try:
-            model_path = self.get_model_path(dataset, model_type)
-            
-            # Prepare model data for saving
+            version = self.store.reserve_version(dataset, model_type)
             model_data = {
-                'model': model,
-                'training_data': training_data,
                 'metadata': metadata,
                 'dataset': dataset,
                 'model_type': model_type,
+                'version': version,
                 'saved_at': datetime.now().isoformat()
             }
             
-            # Save model
-            with open(model_path, 'wb') as f:
-                pickle.dump(model_data, f)
+            # Write then rename, so concurrent readers never see a partial model
+            if supports_artifact(model):
+                model_path = self.models_dir / f"{dataset}_{model_type}_v{version}"
+                tmp_path = self.models_dir / f"{model_path.name}.{os.getpid()}.tmp"
+                self._remove_path(tmp_path)
+                tmp_path.mkdir()
+                try:
+                    save_artifact(tmp_path, model, training_data, model_data)
+                except Exception:
+                    shutil.rmtree(tmp_path, ignore_errors=True)
+                    raise
+                self._remove_path(model_path)
+                os.replace(tmp_path, model_path)
+            else:
+                logger.info(f"No artifact serializer for {dataset}_{model_type}, saving it as pickle")
+                model_path = self.models_dir / f"{dataset}_{model_type}_v{version}.pkl"
+                tmp_path = model_path.with_suffix(f".{os.getpid()}.tmp")
+                with open(tmp_path, 'wb') as f:
+                    pickle.dump({**model_data, 'model': model, 'training_data': training_data}, f)
+                os.replace(tmp_path, model_path)
             
-            # Update metadata
-            model_key = f"{dataset}_{model_type}"
-            self.metadata[model_key] = {
-                'dataset': dataset,
-                'model_type': model_type,
+            version_info = {
+                'version': version,
                 'last_updated': datetime.now().isoformat(),
                 'training_samples': len(training_data),
-                'file_size': model_path.stat().st_size,
+                'file_size': self._path_size(model_path),
+                'format': 'artifact' if model_path.is_dir() else 'pickle',
                 'metadata': metadata
             }
             
-            self._save_metadata()
+            # Drop the oldest versions beyond the retention limit
+            for old in self.store.add_version(dataset, model_type, version_info, self.max_versions):
+                self._remove_path(self.get_model_path(dataset, model_type, old['version']))
+            
             logger.info(f"Model saved: {model_path}")
             return True
             
@@ -177,62 +236,100 @@ class ModelManager:
             logger.error(f"Error saving model {dataset}_{model_type}: {str(e)}")
             return False
     
-    def load_model(self, dataset: str, model_type: str) -> Optional[Tuple[Any, pd.DataFrame, Dict[str, Any]]]:
+    def load_model(self, dataset: str, model_type: str, version: Optional[int] = None,
+                   include_training_data: bool = False) -> Optional[Tuple[Any, Optional[pd.DataFrame], Dict[str, Any]]]:
         """
         Load a saved model from disk.
         
         Args:
             dataset (str): Dataset name
             model_type (str): Model type
+            version (int): Model version, or None for the latest
+            include_training_data (bool): Also read the training data (otherwise None is returned in its place)
             
         Returns:
             Tuple of (model, training_data, metadata) or None if not found
         """
         try:
-            model_path = self.get_model_path(dataset, model_type)
+            model_path = self.get_model_path(dataset, model_type, version)
             
             if not model_path.exists():
                 logger.warning(f"Model not found: {model_path}")
                 return None
             
-            with open(model_path, 'rb') as f:
-                model_data = pickle.load(f)
+            if model_path.is_dir():
+                model, manifest = load_artifact(model_path)
+                training_data = load_artifact_training_data(model_path) if include_training_data else None
+                metadata = manifest['metadata']
+            else:
+                with open(model_path, 'rb') as f:
+                    model_data = pickle.load(f)
+                model = model_data['model']
+                training_data = model_data['training_data'] if include_training_data else None
+                metadata = model_data['metadata']
             
             logger.info(f"Model loaded: {model_path}")
-            return (
-                model_data['model'],
-                model_data['training_data'],
-                model_data['metadata']
-            )
+            return model, training_data, metadata
             
         except Exception as e:
             logger.error(f"Error loading model {dataset}_{model_type}: {str(e)}")
             return None
     
-    def delete_model(self, dataset: str, model_type: str) -> bool:
+    def load_training_data(self, dataset: str, model_type: str, version: Optional[int] = None,
+                           metric: Optional[str] = None, tail: Optional[int] = None) -> Optional[pd.DataFrame]:
         """
-        Delete a saved model.
+        Load only the training data of a saved model.
+        
+        Artifact versions keep their training data memory-mapped per metric,
+        so reading one metric's last points only touches those pages.
         
         Args:
             dataset (str): Dataset name
             model_type (str): Model type
+            version (int): Model version, or None for the latest
+            metric (str): Only this metric's rows
+            tail (int): Only the last rows (e.g. an LSTM's input window)
             
         Returns:
-            bool: True if deleted successfully
+            pd.DataFrame or None if not found
         """
         try:
-            model_path = self.get_model_path(dataset, model_type)
-            
+            model_path = self.get_model_path(dataset, model_type, version)
+            if model_path.is_dir():
+                return load_artifact_training_data(model_path, metric, tail)
             if model_path.exists():
-                model_path.unlink()
+                with open(model_path, 'rb') as f:
+                    training_data = pickle.load(f)['training_data']
+                if metric is not None and 'metric' in training_data.columns:
+                    training_data = training_data[training_data['metric'] == metric]
+                return training_data.tail(tail) if tail is not None else training_data
+            return None
+        except Exception as e:
+            logger.error(f"Error loading training data of {dataset}_{model_type}: {str(e)}")
+            return None
+    
+    def delete_model(self, dataset: str, model_type: str) -> bool:
+        """
+        Delete every saved version of a model.
+        
+        Args:
+            dataset (str): Dataset name
+            model_type (str): Model type
             
-            # Remove from metadata
+        Returns:
+            bool: True if deleted successfully
+        """
+        try:
             model_key = f"{dataset}_{model_type}"
-            if model_key in self.metadata:
-                del self.metadata[model_key]
-                self._save_metadata()
+            model_info = self.store.delete(dataset, model_type) or {}
             
-            logger.info(f"Model deleted: {model_path}")
+            model_paths = [self.models_dir / f"{model_key}.pkl"] + [
+                self.get_model_path(dataset, model_type, v['version']) for v in model_info.get('versions', [])
+            ]
+            for model_path in model_paths:
+                self._remove_path(model_path)
+            
+            logger.info(f"Model deleted: {model_key}")
             return True
             
         except Exception as e:
@@ -248,8 +345,8 @@ class ModelManager:
         """
         models_info = {}
         
-        for model_key, model_info in self.metadata.items():
-            dataset, model_type = model_key.split('_', 1)
+        for model_info in self.store.all():
+            dataset, model_type = model_info['dataset'], model_info['model_type']
             
             if dataset not in models_info:
                 models_info[dataset] = {}
@@ -258,7 +355,11 @@ class ModelManager:
                 'last_updated': model_info.get('last_updated'),
                 'training_samples': model_info.get('training_samples', 0),
                 'file_size': model_info.get('file_size', 0),
-                'exists': self.model_exists(dataset, model_type)
+                'version': model_info.get('version'),
+                'format': model_info.get('format', 'pickle'),
+                'available_versions': [v['version'] for v in model_info.get('versions', [])],
+                'evaluation': model_info.get('metadata', {}).get('training_result', {}).get('evaluation'),
+                'exists': self.get_model_path(dataset, model_type, model_info.get('version')).exists()
             }
         
         return models_info
@@ -276,13 +377,12 @@ class ModelManager:
         cleaned_count = 0
         
         try:
-            for model_key, model_info in list(self.metadata.items()):
+            for model_info in self.store.all():
                 last_updated = datetime.fromisoformat(model_info.get('last_updated', ''))
                 age = datetime.now() - last_updated
                 
                 if age.days > max_age_days:
-                    dataset, model_type = model_key.split('_', 1)
-                    if self.delete_model(dataset, model_type):
+                    if self.delete_model(model_info['dataset'], model_info['model_type']):
                         cleaned_count += 1
             
             logger.info(f"Cleaned up {cleaned_count} old models")
@@ -299,25 +399,13 @@ class ModelManager:
         Returns:
             Dict containing model statistics
         """
-        total_models = len(self.metadata)
-        total_size = sum(info.get('file_size', 0) for info in self.metadata.values())
-        
-        datasets = set()
-        model_types = set()
-        
-        for model_key in self.metadata.keys():
-            dataset, model_type = model_key.split('_', 1)
-            datasets.add(dataset)
-            model_types.add(model_type)
-        
+        stats = self.store.stats()
         return {
-            'total_models': total_models,
-            'total_size_bytes': total_size,
-            'total_size_mb': round(total_size / (1024 * 1024), 2),
-            'datasets': list(datasets),
-            'model_types': list(model_types),
-            'models_by_dataset': {
-                dataset: len([k for k in self.metadata.keys() if k.startswith(f"{dataset}_")])
-                for dataset in datasets
-            }
+            'total_models': stats['total_models'],
+            'total_size_bytes': stats['total_size_bytes'],
+            'total_size_mb': round(stats['total_size_bytes'] / (1024 * 1024), 2),
+            'datasets': list(stats['models_by_dataset']),
+            'model_types': stats['model_types'],
+            'models_by_dataset': stats['models_by_dataset'],
+            'revision': self.store.revision()
         }
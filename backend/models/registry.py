@@ -0,0 +1,286 @@
+"""
+In-process registry of loaded models on top of the ModelManager.
+
+Loaded model versions stay resident in a least-recently-used cache bounded
+by an approximate byte budget, so hot models are not re-read from disk on
+every request while a handful of large LSTMs cannot exhaust a worker's
+memory. Concurrent requests for a model that is not resident share a single
+load. Versions deleted or pruned by any process are dropped once the
+metadata store's revision shows a change.
+"""
+
+import os
+import sys
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple, Hashable
+
+import numpy as np
+import pandas as pd
+
+from .model_manager import ModelManager
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REGISTRY_MAX_MB = 512
+
+
+def approximate_size(obj: Any, max_depth: int = 6) -> int:
+    """
+    Approximate the memory held by a model object.
+
+    Walks containers and object attributes, counting NumPy arrays and pandas
+    objects by their buffers and Keras models by their parameter count
+    (weights plus Adam slots). Shared objects are counted once and
+    memory-mapped series not at all.
+
+    Args:
+        obj: Object to measure
+        max_depth (int): Maximum attribute depth followed
+
+    Returns:
+        int: Approximate size in bytes
+    """
+    seen = set()
+
+    def measure(value: Any, depth: int) -> int:
+        if id(value) in seen or depth > max_depth:
+            return 0
+        seen.add(id(value))
+        if isinstance(value, np.memmap) or (isinstance(value, pd.Series) and isinstance(value.values, np.memmap)):
+            return 0  # Memory-mapped training series live in the shared page cache
+        if isinstance(value, np.ndarray):
+            return value.nbytes
+        if isinstance(value, (pd.DataFrame, pd.Series, pd.Index)):
+            usage = value.memory_usage(index=True)
+            return int(usage.sum()) if isinstance(usage, pd.Series) else int(usage)
+        if hasattr(value, "count_params") and hasattr(value, "layers"):
+            return int(value.count_params()) * 4 * 3
+        if isinstance(value, dict):
+            return sys.getsizeof(value) + sum(measure(item, depth + 1) for item in value.values())
+        if isinstance(value, (list, tuple, set)):
+            return sys.getsizeof(value) + sum(measure(item, depth + 1) for item in value)
+        if hasattr(value, "__dict__") and not isinstance(value, type):
+            return sys.getsizeof(value) + measure(vars(value), depth + 1)
+        return sys.getsizeof(value)
+
+    return measure(obj, 0)
+
+
+class _Flight:
+    """A load in progress that concurrent callers wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[Tuple[Any, Dict[str, Any]]] = None
+
+
+class ModelRegistry:
+    """
+    LRU cache of loaded models keyed by (dataset, model_type, version).
+
+    get() serves the latest (or a given) version from memory, loading it
+    through the ModelManager on a miss; put() registers a model that was just
+    trained or updated. Registering a version drops the other resident
+    versions of the same dataset and model type.
+    """
+
+    def __init__(self, model_manager: Optional[ModelManager] = None, max_bytes: Optional[int] = None):
+        """
+        Initialize the registry.
+
+        Args:
+            model_manager (ModelManager): Persistent model store, or None for the default directory
+            max_bytes (int): Memory budget in bytes (default: MODEL_REGISTRY_MAX_MB, 512 MB)
+        """
+        self.model_manager = model_manager or ModelManager()
+        self.max_bytes = max_bytes if max_bytes is not None else int(
+            float(os.getenv("MODEL_REGISTRY_MAX_MB", str(DEFAULT_REGISTRY_MAX_MB))) * 1024 * 1024)
+        # key -> (model, metadata, size in bytes), least recently used first
+        self._entries: "OrderedDict[Tuple[str, str, Hashable], Tuple[Any, Dict[str, Any], int]]" = OrderedDict()
+        self._flights: Dict[Tuple[str, str, Hashable], _Flight] = {}
+        self._bytes = 0
+        self._revision: Optional[int] = None
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "loads": 0, "load_failures": 0,
+                      "coalesced": 0, "evictions": 0, "rejected": 0}
+
+    def get(self, dataset: str, model_type: str,
+            version: Optional[int] = None) -> Optional[Tuple[Any, Dict[str, Any], bool]]:
+        """
+        Get a model version, loading it from disk if it is not resident.
+
+        Args:
+            dataset (str): Dataset name
+            model_type (str): Model type
+            version (int): Model version, or None for the latest
+
+        Returns:
+            Tuple of (model, metadata, served from memory) or None if not found
+        """
+        self.sync()
+        on_disk = True
+        if version is None:
+            model_info = self.model_manager.get_model_info(dataset, model_type)
+            version = model_info.get('version') if model_info else None
+            on_disk = model_info is not None
+        key = (dataset, model_type, version)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return entry[0], entry[1], True
+            self.stats["misses"] += 1
+            if not on_disk:
+                # Only a model that could not be persisted can be registered without metadata
+                return None
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            else:
+                self.stats["coalesced"] += 1
+
+        if not leader:
+            flight.done.wait()
+            return (*flight.result, False) if flight.result is not None else None
+
+        try:
+            loaded = self.model_manager.load_model(dataset, model_type, version)
+            if loaded is not None:
+                flight.result = (loaded[0], loaded[2])
+                self._insert(key, loaded[0], loaded[2])
+        finally:
+            with self._lock:
+                self.stats["loads" if flight.result is not None else "load_failures"] += 1
+                del self._flights[key]
+            flight.done.set()
+        return (*flight.result, False) if flight.result is not None else None
+
+    def get_cached(self, dataset: str, model_type: str, version: Hashable) -> Optional[Tuple[Any, Dict[str, Any]]]:
+        """
+        Get a resident entry without falling back to disk.
+
+        Args:
+            dataset (str): Dataset name
+            model_type (str): Model type
+            version: Version or other tag the entry was registered under
+
+        Returns:
+            Tuple of (model, metadata) or None if not resident
+        """
+        key = (dataset, model_type, version)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return entry[0], entry[1]
+
+    def put(self, dataset: str, model_type: str, version: Hashable, model: Any, metadata: Dict[str, Any]):
+        """
+        Register a model that was trained or updated in this process.
+
+        Args:
+            dataset (str): Dataset name
+            model_type (str): Model type
+            version: Saved version, or another tag for models that are not persisted
+            model: Model object
+            metadata (Dict): Model metadata
+        """
+        # Catch up with the save that preceded this call, so the next get() does not treat it as a change
+        self.sync()
+        with self._lock:
+            for stale_key in [k for k in self._entries if k[:2] == (dataset, model_type) and k[2] != version]:
+                self._drop(stale_key)
+        self._insert((dataset, model_type, version), model, metadata)
+
+    def invalidate(self, dataset: str, model_type: str):
+        """
+        Drop every resident version of a model (e.g. after it was deleted).
+
+        Args:
+            dataset (str): Dataset name
+            model_type (str): Model type
+        """
+        with self._lock:
+            for key in [k for k in self._entries if k[:2] == (dataset, model_type)]:
+                self._drop(key)
+
+    def sync(self):
+        """
+        Drop resident versions that were deleted or pruned, if the metadata store changed since the last check.
+
+        Entries registered under other tags (e.g. data fingerprints) are left alone.
+        """
+        try:
+            revision = self.model_manager.get_revision()
+        except Exception as e:
+            logger.debug(f"Could not read the model store revision: {str(e)}")
+            return
+        if revision == self._revision:
+            return
+        self._revision = revision
+
+        with self._lock:
+            models = {key[:2] for key in self._entries if key[2] is None or isinstance(key[2], int)}
+        for dataset, model_type in models:
+            model_info = self.model_manager.get_model_info(dataset, model_type)
+            if model_info is None:
+                self.invalidate(dataset, model_type)
+                continue
+            retained = {v['version'] for v in model_info.get('versions', [])} | {model_info.get('version')}
+            with self._lock:
+                for key in [k for k in self._entries if k[:2] == (dataset, model_type)
+                            and (k[2] is None or isinstance(k[2], int)) and k[2] not in retained]:
+                    self._drop(key)
+
+    def _insert(self, key: Tuple[str, str, Hashable], model: Any, metadata: Dict[str, Any]):
+        """Add an entry and evict least recently used entries beyond the budget."""
+        size = approximate_size(model)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            if size > self.max_bytes:
+                self.stats["rejected"] += 1
+                logger.info(f"Model {key} ({size} bytes) exceeds the registry budget; not kept in memory")
+                return
+            self._entries[key] = (model, metadata, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                evicted_key = next(iter(self._entries))
+                self._drop(evicted_key)
+                self.stats["evictions"] += 1
+                logger.info(f"Evicted model {evicted_key} from the registry")
+
+    def _drop(self, key: Tuple[str, str, Hashable]):
+        """Remove an entry; the caller holds the lock."""
+        _, _, size = self._entries.pop(key)
+        self._bytes -= size
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get registry occupancy and counters.
+
+        Returns:
+            Dict with entry count, bytes used, budget, hit rate and counters
+        """
+        with self._lock:
+            lookups = self.stats["hits"] + self.stats["misses"]
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hit_rate": round(self.stats["hits"] / lookups, 3) if lookups else None,
+                **self.stats,
+                "resident": [
+                    {"dataset": key[0], "model_type": key[1], "version": key[2] if isinstance(key[2], int) else None,
+                     "bytes": entry[2]}
+                    for key, entry in self._entries.items()
+                ]
+            }
@@ -0,0 +1,249 @@
+"""
+Per-model-type artifact serializers for saved forecasting models.
+
+A saved model version is a directory holding a JSON manifest, the fitted
+estimator in its library's own compact format (ARIMA order and parameters,
+Keras architecture and weights, Prophet JSON, or the state of a NumPy
+forecaster), the model's training series and an archive of the full training
+data split by metric, both memory-mapped on load (see series_archive). Nothing
+is unpickled on load; the statsmodels state is rebuilt by filtering the stored
+series with the stored parameters.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .series_archive import write_series, read_series, write_frame, read_frame
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_FORMAT_VERSION = 2
+MANIFEST_FILE = "manifest.json"
+SERIES_PREFIX = "series"
+TRAINING_DATA_DIR = "training_data"
+
+
+def _encode(value: Any) -> Any:
+    """Make NumPy values in a state dict JSON-serializable."""
+    if isinstance(value, np.ndarray):
+        return {"__ndarray__": value.tolist(), "dtype": str(value.dtype)}
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, dict):
+        return {key: _encode(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode(item) for item in value]
+    return value
+
+
+def _decode(value: Any) -> Any:
+    """Inverse of _encode."""
+    if isinstance(value, dict):
+        if "__ndarray__" in value:
+            return np.asarray(value["__ndarray__"], dtype=value["dtype"])
+        return {key: _decode(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    return value
+
+
+class ArimaSerializer:
+    """statsmodels ARIMA results stored as order, trend and fitted parameters."""
+
+    kind = "arima"
+
+    def save(self, estimator: Any, directory: Path) -> Dict[str, Any]:
+        model = estimator.model
+        return {
+            "order": list(model.order),
+            "trend": model.trend,
+            "params": np.asarray(estimator.params, dtype=float).tolist(),
+            # Models fitted on repeated dates use a positional index
+            "positional_index": not getattr(model, "_index_dates", False)
+        }
+
+    def load(self, entry: Dict[str, Any], directory: Path, series: pd.Series) -> Any:
+        from prediction.backends import backend_registry
+        ARIMA = backend_registry.load("arima").ARIMA
+        endog = pd.Series(series.to_numpy(), name=series.name) if entry["positional_index"] else series
+        # Filtering with fixed parameters rebuilds the state without re-estimating
+        return ARIMA(endog, order=tuple(entry["order"]), trend=entry["trend"]).filter(np.asarray(entry["params"]))
+
+
+class LstmSerializer:
+    """Keras models stored as JSON architecture plus a weights file."""
+
+    kind = "lstm"
+    weights_file = "lstm.weights.h5"
+
+    def save(self, estimator: Any, directory: Path) -> Dict[str, Any]:
+        estimator.save_weights(str(directory / self.weights_file))
+        return {"architecture": estimator.to_json(), "weights_file": self.weights_file}
+
+    def load(self, entry: Dict[str, Any], directory: Path, series: pd.Series) -> Any:
+        from prediction.backends import backend_registry
+        keras = backend_registry.load("lstm")
+        model = keras.tf.keras.models.model_from_json(entry["architecture"])
+        model.load_weights(str(directory / entry["weights_file"]))
+        # Compiled so update() can fine-tune it
+        model.compile(optimizer=keras.Adam(learning_rate=0.001), loss='mse')
+        return model
+
+
+class ProphetSerializer:
+    """Prophet models stored with Prophet's own JSON serializer."""
+
+    kind = "prophet"
+    model_file = "prophet.json"
+
+    def save(self, estimator: Any, directory: Path) -> Dict[str, Any]:
+        from prophet.serialize import model_to_json
+        (directory / self.model_file).write_text(model_to_json(estimator))
+        return {"model_file": self.model_file}
+
+    def load(self, entry: Dict[str, Any], directory: Path, series: pd.Series) -> Any:
+        from prophet.serialize import model_from_json
+        return model_from_json((directory / entry["model_file"]).read_text())
+
+
+class StatisticalSerializer:
+    """NumPy forecasters stored as their (small) attribute state."""
+
+    kind = "statistical"
+
+    def save(self, estimator: Any, directory: Path) -> Dict[str, Any]:
+        return {"class": type(estimator).__name__, "state": _encode(vars(estimator))}
+
+    def load(self, entry: Dict[str, Any], directory: Path, series: pd.Series) -> Any:
+        from prediction import statistical
+        allowed = {cls.__name__: cls for cls in (statistical.HoltWintersForecaster,
+                                                  statistical.SeasonalNaiveForecaster,
+                                                  statistical.LinearTrendForecaster)}
+        if entry["class"] not in allowed:
+            raise ValueError(f"Unknown forecaster class: {entry['class']}")
+        forecaster = allowed[entry["class"]].__new__(allowed[entry["class"]])
+        forecaster.__dict__.update(_decode(entry["state"]))
+        return forecaster
+
+
+SERIALIZERS = {
+    "arima": ArimaSerializer(),
+    "lstm": LstmSerializer(),
+    "prophet": ProphetSerializer(),
+    "fast": StatisticalSerializer(),
+    "holt_winters": StatisticalSerializer(),
+    "seasonal_naive": StatisticalSerializer(),
+    "linear_trend": StatisticalSerializer(),
+}
+
+
+def supports_artifact(model: Any) -> bool:
+    """
+    Check whether a model can be saved in the artifact format.
+
+    Args:
+        model: Model object passed to ModelManager.save_model
+
+    Returns:
+        bool: True for trained PredictiveModel-like objects of a known type
+    """
+    return (getattr(model, "is_trained", False) and getattr(model, "model_type", None) in SERIALIZERS
+            and isinstance(getattr(model, "training_data", None), pd.Series))
+
+
+def save_artifact(directory: Path, model: Any, training_data: pd.DataFrame, manifest: Dict[str, Any]):
+    """
+    Write a trained model as an artifact directory.
+
+    Args:
+        directory (Path): Empty directory to write into
+        model: Trained PredictiveModel
+        training_data (pd.DataFrame): Training frame, written to the per-metric archive
+        manifest (Dict): Manifest fields (dataset, model_type, version, metadata, ...)
+    """
+    serializer = SERIALIZERS[model.model_type]
+    scaler = getattr(model, "scaler", None)
+    manifest = {
+        **_encode(manifest),
+        "format_version": ARTIFACT_FORMAT_VERSION,
+        "predictor": {
+            "model_type": model.model_type,
+            "metadata": _encode(model.metadata),
+            "search_workers": getattr(model, "search_workers", None)
+        },
+        "estimator": {"kind": serializer.kind, **serializer.save(model.model, directory)},
+        "scaler": _encode({key: value for key, value in vars(scaler).items()}) if scaler is not None else None,
+        "series": write_series(directory, SERIES_PREFIX, model.training_data),
+        "training_data": write_frame(directory / TRAINING_DATA_DIR, training_data)
+    }
+    with open(directory / MANIFEST_FILE, 'w') as f:
+        json.dump(manifest, f, indent=2, default=str)
+
+
+def read_manifest(directory: Path) -> Dict[str, Any]:
+    """Read an artifact's manifest."""
+    with open(directory / MANIFEST_FILE, 'r') as f:
+        return json.load(f)
+
+
+def load_artifact(directory: Path) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Rebuild a trained PredictiveModel from an artifact directory.
+
+    The model's training series is memory-mapped rather than read; the
+    training-data archive is not opened (use load_training_data()).
+
+    Args:
+        directory (Path): Artifact directory
+
+    Returns:
+        Tuple of (model, manifest)
+    """
+    # Imported here because the prediction package imports this one
+    from prediction.predictor import PredictiveModel
+
+    manifest = read_manifest(directory)
+    if manifest.get("format_version") != ARTIFACT_FORMAT_VERSION:
+        raise ValueError(f"Unsupported artifact format: {manifest.get('format_version')}")
+
+    predictor_state = manifest["predictor"]
+    series = read_series(directory, manifest["series"])
+
+    model = PredictiveModel(model_type=predictor_state["model_type"],
+                            search_workers=predictor_state.get("search_workers"))
+    model.metadata = _decode(predictor_state["metadata"])
+    model.training_data = series
+    model.model = SERIALIZERS[predictor_state["model_type"]].load(manifest["estimator"], directory, series)
+    if manifest.get("scaler"):
+        from sklearn.preprocessing import MinMaxScaler
+        model.scaler = MinMaxScaler()
+        model.scaler.__dict__.update(_decode(manifest["scaler"]))
+    model.is_trained = True
+    return model, manifest
+
+
+def load_training_data(directory: Path, metric: Optional[str] = None,
+                       tail: Optional[int] = None) -> Optional[pd.DataFrame]:
+    """
+    Read an artifact's training data, optionally one metric or its last rows only.
+
+    Args:
+        directory (Path): Artifact directory
+        metric (str): Only this metric's rows
+        tail (int): Only the last rows
+
+    Returns:
+        pd.DataFrame, or None if the artifact has no training data
+
+    Raises:
+        KeyError: If the metric is not in the training data
+    """
+    entry = read_manifest(directory).get("training_data")
+    if not entry:
+        return None
+    return read_frame(directory / entry["directory"], entry, metric, tail)
@@ -0,0 +1,191 @@
+"""
+Memory-mapped storage for the training data of saved models.
+
+Series and training frames are written as uncompressed .npy files and opened
+with np.load(mmap_mode='r'), so worker processes loading the same model
+version share its pages through the OS page cache instead of each holding a
+copy, and a read of the last few points only touches the pages they are on.
+Training frames are split into one group of column files per metric, so a
+single metric's history (or its tail) is read without the others.
+"""
+
+import logging
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+GROUP_COLUMN = "metric"
+
+
+def _open(path: Path) -> np.ndarray:
+    """Map a read-only .npy file."""
+    return np.load(path, mmap_mode='r', allow_pickle=False)
+
+
+def write_series(directory: Path, name: str, series: pd.Series) -> Dict[str, Any]:
+    """
+    Write a series as .npy files of values and (for dated series) int64 nanosecond timestamps.
+
+    Args:
+        directory (Path): Directory to write into
+        name (str): File name prefix
+        series (pd.Series): Series to store
+
+    Returns:
+        Dict describing the stored series, for read_series()
+    """
+    np.save(directory / f"{name}.values.npy", series.to_numpy(dtype=float))
+    entry = {"name": series.name, "prefix": name, "index": "positional"}
+    if isinstance(series.index, pd.DatetimeIndex):
+        # asi8 is UTC for timezone-aware indexes
+        np.save(directory / f"{name}.index.npy", series.index.as_unit("ns").asi8)
+        entry.update(index="datetime", tz=str(series.index.tz) if series.index.tz is not None else None)
+    return entry
+
+
+def read_series(directory: Path, entry: Dict[str, Any]) -> pd.Series:
+    """
+    Open a series written by write_series without copying it into memory.
+
+    Args:
+        directory (Path): Directory holding the files
+        entry (Dict): Entry returned by write_series()
+
+    Returns:
+        pd.Series backed by read-only memory maps
+    """
+    values = _open(directory / f"{entry['prefix']}.values.npy")
+    index = None
+    if entry["index"] == "datetime":
+        index = pd.DatetimeIndex(_open(directory / f"{entry['prefix']}.index.npy").view("M8[ns]"), copy=False)
+        if entry.get("tz"):
+            index = index.tz_localize("UTC").tz_convert(entry["tz"])
+    return pd.Series(values, index=index, name=entry.get("name"), copy=False)
+
+
+def write_frame(directory: Path, frame: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Write a DataFrame as per-metric groups of column .npy files.
+
+    Datetimes are stored as int64 nanoseconds and text as fixed-width
+    unicode, so every column can be memory-mapped. Frames without a
+    'metric' column form a single group.
+
+    Args:
+        directory (Path): Directory to create the archive in
+        frame (pd.DataFrame): Frame to store
+
+    Returns:
+        Dict describing columns and groups, for read_frame()
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    columns = []
+    for position, column in enumerate(frame.columns):
+        values = frame[column]
+        entry = {"name": str(column), "key": f"c{position}"}
+        if pd.api.types.is_datetime64_any_dtype(values):
+            entry.update(kind="datetime", dtype=str(values.dtype))
+        elif pd.api.types.is_numeric_dtype(values):
+            entry["kind"] = "numeric"
+        else:
+            entry["kind"] = "text"
+        columns.append(entry)
+
+    if GROUP_COLUMN in frame.columns:
+        labels = frame[GROUP_COLUMN].astype(str).to_numpy()
+        metrics = list(dict.fromkeys(labels))
+    else:
+        labels, metrics = None, [None]
+
+    groups = []
+    for number, metric in enumerate(metrics):
+        rows = np.flatnonzero(labels == metric) if labels is not None else np.arange(len(frame))
+        group = frame.iloc[rows]
+        key = f"g{number}"
+        # Positions in the original frame, to restore its row order when groups are combined
+        np.save(directory / f"{key}.rows.npy", rows.astype(np.int64))
+        for column, entry in zip(frame.columns, columns):
+            values = group[column]
+            if entry["kind"] == "datetime":
+                array = values.to_numpy(dtype="datetime64[ns]").astype(np.int64)
+            elif entry["kind"] == "numeric":
+                array = values.to_numpy()
+            else:
+                array = values.astype(str).to_numpy(dtype=str)
+            np.save(directory / f"{key}.{entry['key']}.npy", array)
+        groups.append({"metric": metric, "key": key, "rows": len(rows)})
+
+    return {"directory": directory.name, "rows": len(frame), "columns": columns, "groups": groups}
+
+
+def list_metrics(entry: Dict[str, Any]) -> List[Optional[str]]:
+    """
+    List the metric groups of an archived frame.
+
+    Args:
+        entry (Dict): Entry returned by write_frame()
+
+    Returns:
+        List of metric names (None for a frame without a 'metric' column)
+    """
+    return [group["metric"] for group in entry["groups"]]
+
+
+def read_frame(directory: Path, entry: Dict[str, Any], metric: Optional[str] = None,
+               tail: Optional[int] = None) -> pd.DataFrame:
+    """
+    Read an archived frame, one metric of it, or the last rows of one metric.
+
+    Args:
+        directory (Path): Archive directory
+        entry (Dict): Entry returned by write_frame()
+        metric (str): Only this metric's rows (default: the whole frame)
+        tail (int): Only the last rows of the selected metric
+
+    Returns:
+        pd.DataFrame; only the requested rows are read from disk. Reads of a single
+        group (one metric, or a frame without metrics) keep numeric and naive
+        datetime columns on the memory maps; text columns and frames combined
+        from several metrics are copies
+
+    Raises:
+        KeyError: If the metric is not in the archive
+    """
+    groups = entry["groups"]
+    if metric is not None:
+        groups = [group for group in groups if group["metric"] == metric]
+        if not groups:
+            raise KeyError(f"Metric {metric} not in training data archive")
+
+    parts, positions = [], []
+    for group in groups:
+        # Slicing a memory map before converting it reads only the tail's pages
+        start = max(0, group["rows"] - tail) if tail is not None and len(groups) == 1 else 0
+        part = {}
+        for column in entry["columns"]:
+            values = np.asarray(_open(directory / f"{group['key']}.{column['key']}.npy")[start:])
+            if column["kind"] == "datetime":
+                dtype = pd.api.types.pandas_dtype(column["dtype"])
+                if isinstance(dtype, pd.DatetimeTZDtype):
+                    # Timezone-aware columns were stored as UTC instants
+                    values = pd.Series(pd.to_datetime(values, utc=True)).astype(dtype)
+                else:
+                    # A view keeps nanosecond columns on the memory map; other units are converted
+                    values = values.view("M8[ns]")
+                    values = values if dtype == values.dtype else values.astype(dtype)
+            part[column["name"]] = values
+        # copy=False keeps numeric and naive datetime columns backed by the memory maps
+        parts.append(pd.DataFrame(part, copy=False))
+        positions.append(np.asarray(_open(directory / f"{group['key']}.rows.npy")[start:]))
+
+    if not parts:
+        return pd.DataFrame({column["name"]: [] for column in entry["columns"]})
+    if len(parts) == 1:
+        return parts[0]
+    frame = pd.concat(parts, ignore_index=True)
+    frame = frame.iloc[np.argsort(np.concatenate(positions), kind="stable")].reset_index(drop=True)
+    return frame.tail(tail).reset_index(drop=True) if tail is not None else frame
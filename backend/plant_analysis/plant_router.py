@@ -14,6 +14,7 @@ import logging
 from .plant_database import plant_db
 from .plant_advisor import plant_advisor, PlantAnalysis, HealthStatus
 from .deepseek_client import deepseek_client
+from execution import execution_manager, ExecutorSaturatedError
 
 logger = logging.getLogger(__name__)
 
@@ -139,8 +140,10 @@ async def analyze_sensor_data(sensor_data: PlantSensorData):
         # Convert Pydantic model to dict
         sensor_dict = sensor_data.dict()
         
-        # Perform analysis
-        analysis = plant_advisor.analyze_sensor_data(sensor_dict, sensor_data.plant_type)
+        # Perform analysis (may call the DeepSeek API synchronously)
+        analysis = await execution_manager.run_io(
+            plant_advisor.analyze_sensor_data, sensor_dict, sensor_data.plant_type
+        )
         
         # Convert sensor readings to response format
         sensor_readings = [
@@ -175,6 +178,8 @@ async def analyze_sensor_data(sensor_data: PlantSensorData):
     except ValueError as e:
         logger.warning(f"Invalid plant or growth stage: {str(e)}")
         raise HTTPException(status_code=400, detail=str(e))
+    except ExecutorSaturatedError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         logger.error(f"Error analyzing sensor data: {str(e)}")
         raise HTTPException(status_code=500, detail="Error analyzing sensor data")
@@ -215,13 +220,17 @@ async def get_ai_advice(sensor_data: PlantSensorData):
         sensor_dict = sensor_data.dict()
         
         # Get AI advice
-        ai_advice = plant_advisor.deepseek_client.get_gardening_advice(plant_data, sensor_dict)
+        ai_advice = await execution_manager.run_io(
+            plant_advisor.deepseek_client.get_gardening_advice, plant_data, sensor_dict
+        )
         
         logger.info(f"Generated AI advice for {sensor_data.plant_type}")
         return {"advice": ai_advice}
         
     except HTTPException:
         raise
+    except ExecutorSaturatedError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         logger.error(f"Error getting AI advice: {str(e)}")
         raise HTTPException(status_code=500, detail="Error getting AI advice")
@@ -6,5 +6,9 @@ using various machine learning models including ARIMA, Prophet, and LSTM.
 """
 
 from .predictor import PredictiveModel, TimeSeriesPredictor
+from .arima_search import StepwiseArimaSearch
+from .backends import backend_registry
+from .backtest import Backtester
+from .statistical import fit_fast_model, FAST_MODEL_TYPES
 
-__all__ = ['PredictiveModel', 'TimeSeriesPredictor']
+__all__ = ['PredictiveModel', 'TimeSeriesPredictor', 'StepwiseArimaSearch', 'fit_fast_model', 'FAST_MODEL_TYPES', 'backend_registry', 'Backtester']
@@ -0,0 +1,314 @@
+"""
+Stepwise ARIMA order selection for BloomTracker forecasts.
+
+This module implements the Hyndman-Khandakar stepwise search: the
+differencing order is chosen with repeated KPSS tests, then the search starts
+from four seed models and only visits neighbours of the current best model.
+Each step's candidates are fitted concurrently on a process pool, fits stop
+at the step's time budget, and the AIC and fit time of every candidate are
+recorded.
+"""
+
+import os
+import time
+import logging
+import warnings
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, Future, wait
+from typing import Dict, List, Any, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .backends import backend_registry
+from execution import worker_cpu_budget
+
+logger = logging.getLogger(__name__)
+
+# Series shorter than this are searched in-process; pool start-up would dominate
+PARALLEL_MIN_SAMPLES = 500
+
+# Seconds past a step's budget before its remaining fits are treated as stuck and the pool is replaced
+FIT_GRACE_SECONDS = 5.0
+
+_search_pool: Optional[ProcessPoolExecutor] = None
+_search_pool_workers = 0
+
+
+def default_search_workers() -> int:
+    """
+    Get the number of processes an ARIMA search uses by default.
+
+    ARIMA_SEARCH_WORKERS (default min(4, CPUs)), capped inside execution-layer
+    workers at their share of the machine's CPUs, so a full pool of workers
+    does not each start their own search processes.
+
+    Returns:
+        int: Search worker processes (1 searches in-process)
+    """
+    workers = int(os.getenv("ARIMA_SEARCH_WORKERS", str(min(4, os.cpu_count() or 1))))
+    budget = worker_cpu_budget()
+    return max(1, min(workers, budget) if budget is not None else workers)
+
+
+def _get_search_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Get the process pool shared by searches in this process, creating it on first use."""
+    global _search_pool, _search_pool_workers
+    if _search_pool is None or _search_pool_workers != max_workers:
+        if _search_pool is not None:
+            _search_pool.shutdown(wait=False)
+        _search_pool = ProcessPoolExecutor(max_workers=max_workers,
+                                           mp_context=multiprocessing.get_context("spawn"))
+        _search_pool_workers = max_workers
+    return _search_pool
+
+
+def _discard_search_pool(pool: ProcessPoolExecutor):
+    """Stop using a pool whose workers are stuck in abandoned fits; the next search starts a fresh one."""
+    global _search_pool, _search_pool_workers
+    if _search_pool is pool:
+        _search_pool = None
+        _search_pool_workers = 0
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+class _FitDeadlineExceeded(Exception):
+    """Raised from the optimizer callback to stop a fit that ran past its deadline."""
+
+
+def _trend_for(d: int, with_constant: bool) -> str:
+    """Map 'include a constant' to statsmodels' trend argument for a differencing order."""
+    if not with_constant or d > 1:
+        return "n"
+    # After one difference a constant becomes a linear drift term
+    return "c" if d == 0 else "t"
+
+
+def fit_candidate(series: pd.Series, order: Tuple[int, int, int], with_constant: bool,
+                  maxiter: int = 50, deadline: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Fit one ARIMA candidate and report its AIC and fit time.
+
+    Module-level so it can run in worker processes.
+
+    Args:
+        series (pd.Series): Training series
+        order (Tuple[int, int, int]): (p, d, q)
+        with_constant (bool): Include a constant (d=0) or drift (d=1) term
+        maxiter (int): Optimizer iteration cap; poor candidates stop early instead of converging slowly
+        deadline (float): time.time() after which the fit is stopped at its next optimizer iteration
+
+    Returns:
+        Dict with order, constant flag, aic, params, convergence flag, fit time and any error
+    """
+    started = time.perf_counter()
+    result = {"order": list(order), "with_constant": with_constant, "aic": None, "params": None,
+              "converged": False, "error": None}
+
+    def check_deadline(params):
+        if time.time() >= deadline:
+            raise _FitDeadlineExceeded()
+
+    try:
+        if deadline is not None and time.time() >= deadline:
+            raise _FitDeadlineExceeded()
+        ARIMA = backend_registry.load("arima").ARIMA
+        method_kwargs = {"maxiter": maxiter}
+        if deadline is not None:
+            method_kwargs["callback"] = check_deadline
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            fitted = ARIMA(series, order=order, trend=_trend_for(order[1], with_constant)).fit(
+                method_kwargs=method_kwargs)
+        aic = float(fitted.aic)
+        if np.isfinite(aic):
+            result["aic"] = aic
+            result["params"] = np.asarray(fitted.params).tolist()
+            result["converged"] = bool(fitted.mle_retvals.get("converged", True)) if fitted.mle_retvals else True
+        else:
+            result["error"] = "Non-finite AIC"
+    except _FitDeadlineExceeded:
+        result["error"] = "Stopped at the search step's time budget"
+    except Exception as e:
+        result["error"] = str(e)
+    result["fit_seconds"] = round(time.perf_counter() - started, 4)
+    return result
+
+
+def select_differencing(series: pd.Series, max_d: int = 2, alpha: float = 0.05) -> int:
+    """
+    Choose d by differencing until the KPSS test no longer rejects stationarity.
+
+    Args:
+        series (pd.Series): Training series
+        max_d (int): Highest differencing order considered
+        alpha (float): KPSS significance level
+
+    Returns:
+        int: Differencing order
+    """
+    values = series.dropna().to_numpy(dtype=float)
+    for d in range(max_d + 1):
+        if len(values) < 8 or np.allclose(values, values[0]):
+            return d
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                p_value = backend_registry.load("arima").kpss(values, regression="c", nlags="auto")[1]
+        except Exception as e:
+            logger.debug(f"KPSS test failed at d={d}: {str(e)}")
+            return d
+        if p_value >= alpha:
+            return d
+        values = np.diff(values)
+    return max_d
+
+
+class StepwiseArimaSearch:
+    """
+    Hyndman-Khandakar stepwise search over ARIMA(p, d, q) orders.
+
+    Starting from ARIMA(2,d,2), (0,d,0), (1,d,0) and (0,d,1), each step fits
+    every unvisited neighbour of the best model (p and/or q changed by one,
+    constant toggled) and moves to the best of them while the AIC improves.
+    """
+
+    def __init__(self, max_p: int = 3, max_q: int = 3, max_d: int = 2, max_steps: int = 20,
+                 max_workers: Optional[int] = None, fit_timeout: float = 30.0, maxiter: int = 50,
+                 parallel_min_samples: int = PARALLEL_MIN_SAMPLES):
+        """
+        Initialize the search.
+
+        Args:
+            max_p (int): Highest AR order
+            max_q (int): Highest MA order
+            max_d (int): Highest differencing order
+            max_steps (int): Maximum number of neighbourhood moves
+            max_workers (int): Worker processes for candidate fits (default: default_search_workers())
+            fit_timeout (float): Time budget of a step's fits; fits still running are stopped
+            maxiter (int): Optimizer iteration cap for candidate fits
+            parallel_min_samples (int): Minimum series length before fits are sent to worker processes
+        """
+        self.max_p = max_p
+        self.max_q = max_q
+        self.max_d = max_d
+        self.max_steps = max_steps
+        self.max_workers = max_workers if max_workers is not None else default_search_workers()
+        self.fit_timeout = fit_timeout
+        self.maxiter = maxiter
+        self.parallel_min_samples = parallel_min_samples
+
+    def _fit_many(self, series: pd.Series, candidates: List[Tuple[Tuple[int, int, int], bool]],
+                  parallel: bool) -> List[Dict[str, Any]]:
+        """Fit a step's candidates within the step's time budget, concurrently when parallel is set."""
+        deadline = time.time() + self.fit_timeout
+        if not parallel:
+            return [fit_candidate(series, order, const, self.maxiter, deadline) for order, const in candidates]
+
+        pool = _get_search_pool(self.max_workers)
+        futures: Dict[Future, Tuple[Tuple[int, int, int], bool]] = {
+            pool.submit(fit_candidate, series, order, const, self.maxiter, deadline): (order, const)
+            for order, const in candidates
+        }
+        # Fits stop themselves at the deadline; the grace period covers the optimizer iteration in progress
+        done, pending = wait(futures, timeout=self.fit_timeout + FIT_GRACE_SECONDS)
+
+        results = [future.result() for future in done]
+        if pending:
+            # A worker stuck inside one iteration would delay every later step, so the pool is replaced
+            logger.warning(f"{len(pending)} ARIMA fits did not stop at their deadline; replacing the search pool")
+            _discard_search_pool(pool)
+        for future in pending:
+            order, const = futures[future]
+            results.append({"order": list(order), "with_constant": const, "aic": None, "params": None,
+                            "converged": False, "error": f"Abandoned after {self.fit_timeout}s",
+                            "fit_seconds": self.fit_timeout})
+        return results
+
+    def search(self, series: pd.Series) -> Dict[str, Any]:
+        """
+        Run the stepwise search.
+
+        Args:
+            series (pd.Series): Training series
+
+        Returns:
+            Dict with the best order, constant flag, AIC and parameters plus a log
+            of every candidate with its AIC and fit time
+
+        Raises:
+            ValueError: If no candidate could be fitted
+        """
+        if not backend_registry.is_available("arima"):
+            raise ValueError("statsmodels is required for ARIMA order search")
+
+        started = time.perf_counter()
+        d = select_differencing(series, self.max_d)
+        parallel = self.max_workers > 1 and len(series) >= self.parallel_min_samples
+        allow_constant = d <= 1
+
+        visited: Dict[Tuple[Tuple[int, int, int], bool], Dict[str, Any]] = {}
+
+        def unvisited(candidates):
+            seen = set()
+            fresh = []
+            for order, const in candidates:
+                p, _, q = order
+                const = const and allow_constant
+                key = (order, const)
+                if 0 <= p <= self.max_p and 0 <= q <= self.max_q and key not in visited and key not in seen:
+                    seen.add(key)
+                    fresh.append(key)
+            return fresh
+
+        def evaluate(candidates):
+            for result in self._fit_many(series, candidates, parallel):
+                visited[(tuple(result["order"]), result["with_constant"])] = result
+
+        def best_of(results):
+            scored = [r for r in results if r["aic"] is not None]
+            return min(scored, key=lambda r: r["aic"]) if scored else None
+
+        # Step 0: the four Hyndman-Khandakar seed models
+        evaluate(unvisited([((2, d, 2), True), ((0, d, 0), True), ((1, d, 0), True), ((0, d, 1), True),
+                            ((0, d, 0), False)]))
+        best = best_of(visited.values())
+        if best is None:
+            raise ValueError("No ARIMA candidate could be fitted")
+
+        steps = 0
+        while steps < self.max_steps:
+            p, _, q = best["order"]
+            const = best["with_constant"]
+            neighbours = unvisited([
+                ((p + dp, d, q + dq), const)
+                for dp, dq in ((-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (1, 1), (-1, 1), (1, -1))
+            ] + [((p, d, q), not const)])
+            if not neighbours:
+                break
+
+            evaluate(neighbours)
+            step_best = best_of(visited[key] for key in neighbours)
+            steps += 1
+            if step_best is None or step_best["aic"] >= best["aic"]:
+                break
+            best = step_best
+
+        candidates = sorted(visited.values(), key=lambda r: (r["aic"] is None, r["aic"] or 0.0))
+        return {
+            "order": tuple(best["order"]),
+            "with_constant": best["with_constant"],
+            "trend": _trend_for(best["order"][1], best["with_constant"]),
+            "aic": best["aic"],
+            "params": best["params"],
+            "differencing": d,
+            "steps": steps,
+            "evaluated": len(visited),
+            "parallel": parallel,
+            "workers": self.max_workers if parallel else 1,
+            "duration_seconds": round(time.perf_counter() - started, 3),
+            "candidates": [
+                {key: r[key] for key in ("order", "with_constant", "aic", "converged", "fit_seconds", "error")}
+                for r in candidates
+            ]
+        }
@@ -0,0 +1,206 @@
+"""
+On-demand registry of the heavy forecasting libraries.
+
+statsmodels, Prophet and TensorFlow take seconds and hundreds of MB to
+import. This module reports whether each is installed using
+importlib.util.find_spec (without importing it), imports a library the first
+time one of its models is used, and offers warm_up() to preload libraries
+off the request path.
+"""
+
+import os
+import time
+import logging
+import importlib
+import importlib.util
+import threading
+from types import SimpleNamespace
+from typing import Dict, List, Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Model type -> (top-level package checked for availability, [(module, [names])] imported on load)
+BACKEND_SPECS: Dict[str, Tuple[str, List[Tuple[str, List[str]]]]] = {
+    "arima": ("statsmodels", [
+        ("statsmodels.tsa.arima.model", ["ARIMA"]),
+        ("statsmodels.tsa.stattools", ["adfuller", "kpss"]),
+    ]),
+    "prophet": ("prophet", [
+        ("prophet", ["Prophet"]),
+    ]),
+    "lstm": ("tensorflow", [
+        ("tensorflow", []),
+        ("tensorflow.keras.models", ["Sequential"]),
+        ("tensorflow.keras.layers", ["LSTM", "Dense", "Dropout"]),
+        ("tensorflow.keras.optimizers", ["Adam"]),
+    ]),
+}
+
+
+class BackendRegistry:
+    """
+    Lazily imports the library behind each model type.
+
+    load() returns a namespace with the imported names (plus 'tf' for the
+    TensorFlow module); the first call imports under a lock, later calls
+    return the cached namespace.
+    """
+
+    def __init__(self, specs: Optional[Dict[str, Tuple[str, List[Tuple[str, List[str]]]]]] = None):
+        """
+        Initialize the registry.
+
+        Args:
+            specs (Dict): Backend specifications (default: BACKEND_SPECS)
+        """
+        self.specs = specs or BACKEND_SPECS
+        self._available: Dict[str, bool] = {}
+        self._loaded: Dict[str, SimpleNamespace] = {}
+        self._load_seconds: Dict[str, float] = {}
+        self._errors: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def is_available(self, name: str) -> bool:
+        """
+        Check whether a backend's library is installed, without importing it.
+
+        Args:
+            name (str): Backend name ('arima', 'prophet', 'lstm')
+
+        Returns:
+            bool: True if the library can be imported
+        """
+        if name in self._errors:
+            return False
+        if name not in self._available:
+            try:
+                self._available[name] = importlib.util.find_spec(self.specs[name][0]) is not None
+            except (ImportError, ValueError):
+                self._available[name] = False
+        return self._available[name]
+
+    def is_loaded(self, name: str) -> bool:
+        """
+        Check whether a backend has already been imported.
+
+        Args:
+            name (str): Backend name
+
+        Returns:
+            bool: True if load() has succeeded before
+        """
+        return name in self._loaded
+
+    def load(self, name: str) -> SimpleNamespace:
+        """
+        Import a backend's library on first use.
+
+        Args:
+            name (str): Backend name ('arima', 'prophet', 'lstm')
+
+        Returns:
+            SimpleNamespace with the backend's classes and functions
+
+        Raises:
+            ImportError: If the library is missing or fails to import
+        """
+        loaded = self._loaded.get(name)
+        if loaded is not None:
+            return loaded
+
+        with self._lock:
+            if name in self._loaded:
+                return self._loaded[name]
+            if name in self._errors:
+                raise ImportError(self._errors[name])
+
+            started = time.perf_counter()
+            namespace = SimpleNamespace()
+            try:
+                for module_name, names in self.specs[name][1]:
+                    module = importlib.import_module(module_name)
+                    if module_name == "tensorflow":
+                        namespace.tf = module
+                    for attribute in names:
+                        setattr(namespace, attribute, getattr(module, attribute))
+            except Exception as e:
+                # Installed but broken (e.g. binary mismatch): report it as unavailable from now on
+                self._errors[name] = f"{name} backend failed to import: {str(e)}"
+                logger.warning(self._errors[name])
+                raise ImportError(self._errors[name]) from e
+
+            self._load_seconds[name] = round(time.perf_counter() - started, 3)
+            self._loaded[name] = namespace
+            logger.info(f"Loaded {name} backend in {self._load_seconds[name]}s")
+            return namespace
+
+    def warm_up(self, names: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Import the given (or all available) backends ahead of the first request.
+
+        Args:
+            names (List[str]): Backend names, or None for every available backend
+
+        Returns:
+            Dict from backend name to load time in seconds or error message
+        """
+        results = {}
+        for name in names or list(self.specs):
+            if not self.is_available(name):
+                results[name] = "not installed"
+                continue
+            try:
+                self.load(name)
+                results[name] = self._load_seconds.get(name, 0.0)
+            except ImportError as e:
+                results[name] = str(e)
+        return results
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get availability and load state of every backend in this process.
+
+        Returns:
+            Dict from backend name to availability, load state and load time
+        """
+        return {
+            name: {
+                "available": self.is_available(name),
+                "loaded": self.is_loaded(name),
+                "load_seconds": self._load_seconds.get(name),
+                "error": self._errors.get(name)
+            }
+            for name in self.specs
+        }
+
+
+def warmup_backend_names() -> List[str]:
+    """
+    Backends to preload, from PREDICTION_WARMUP ('arima,lstm', 'all' or empty for none).
+
+    Returns:
+        List of backend names
+    """
+    setting = os.getenv("PREDICTION_WARMUP", "").strip().lower()
+    if not setting:
+        return []
+    if setting == "all":
+        return list(BACKEND_SPECS)
+    return [name.strip() for name in setting.split(",") if name.strip() in BACKEND_SPECS]
+
+
+def warm_up_backends(names: List[str]) -> Dict[str, Any]:
+    """
+    Picklable entry point for preloading backends in a worker process.
+
+    Args:
+        names (List[str]): Backend names
+
+    Returns:
+        Dict from backend name to load time in seconds or error message
+    """
+    return backend_registry.warm_up(names)
+
+
+# Global instance
+backend_registry = BackendRegistry()
@@ -0,0 +1,304 @@
+"""
+Rolling-origin backtesting for BloomTracker forecasting models.
+
+Each model type is trained on an expanding window of the series and scored
+on the following horizon, for several forecast origins. Accuracy is recorded
+together with fit/predict wall time and peak memory, per dataset and model
+type, and summarised in a benchmark report. Cached results let 'auto' model
+selection pick the model with the best accuracy/latency trade-off.
+"""
+
+import json
+import os
+import time
+import logging
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+def rolling_origins(n_samples: int, horizon: int, max_folds: int, min_train_size: Optional[int] = None) -> List[int]:
+    """
+    Choose forecast origins (training set sizes) for rolling-origin evaluation.
+
+    Args:
+        n_samples (int): Series length
+        horizon (int): Steps forecast from each origin
+        max_folds (int): Maximum number of origins
+        min_train_size (int): Smallest training window (default: half the series, at least 3)
+
+    Returns:
+        List of increasing origins; empty if the series is too short
+    """
+    first = max(3, min_train_size or n_samples // 2)
+    last = n_samples - horizon
+    if last < first:
+        return []
+    step = max(1, (last - first) // max(1, max_folds - 1))
+    origins = list(range(last, first - 1, -step))[:max_folds]
+    return sorted(origins)
+
+
+class Backtester:
+    """
+    Runs rolling-origin cross-validation and keeps the results on disk.
+
+    Results are stored per (dataset, model type) as
+    {results_dir}/{dataset}/{model_type}.json, so model types can be
+    backtested in parallel worker processes without sharing a file.
+    """
+
+    def __init__(self, results_dir: str = "cache/backtests", horizon: int = 5, max_folds: int = 5,
+                 max_age_days: int = 7, accuracy_tolerance: float = 0.05):
+        """
+        Initialize the backtester.
+
+        Args:
+            results_dir (str): Directory for results and reports
+            horizon (int): Default steps forecast from each origin
+            max_folds (int): Default maximum number of origins
+            max_age_days (int): Age after which results are ignored by recommend()
+            accuracy_tolerance (float): Relative RMSE margin within which the fastest model is preferred
+        """
+        self.results_dir = Path(results_dir)
+        self.horizon = horizon
+        self.max_folds = max_folds
+        self.max_age_days = max_age_days
+        self.accuracy_tolerance = accuracy_tolerance
+
+    def evaluate(self, model_type: str, time_series_data: pd.DataFrame, horizon: Optional[int] = None,
+                 max_folds: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Backtest one model type on a series.
+
+        Peak memory is measured with tracemalloc, which covers Python and
+        NumPy allocations but not native TensorFlow buffers.
+
+        Args:
+            model_type (str): Model type to evaluate
+            time_series_data (pd.DataFrame): Series with 'value' (and optionally 'date') columns
+            horizon (int): Steps forecast from each origin
+            max_folds (int): Maximum number of origins
+
+        Returns:
+            Dict with per-fold and mean accuracy, timing and peak memory
+        """
+        # Imported here because predictor imports this module
+        from .predictor import PredictiveModel
+
+        horizon = horizon or self.horizon
+        max_folds = max_folds or self.max_folds
+        ordered = time_series_data.sort_values('date', kind='stable') if 'date' in time_series_data else time_series_data
+        ordered = ordered.dropna(subset=['value']).reset_index(drop=True)
+        origins = rolling_origins(len(ordered), horizon, max_folds)
+
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+
+        folds = []
+        model_used = None
+        try:
+            for origin in origins:
+                actual = ordered['value'].iloc[origin:origin + horizon].to_numpy(dtype=float)
+                tracemalloc.reset_peak()
+                baseline, _ = tracemalloc.get_traced_memory()
+                try:
+                    fit_started = time.perf_counter()
+                    model = PredictiveModel(model_type=model_type)
+                    model.train(ordered.iloc[:origin], 'value', 'date')
+                    predict_started = time.perf_counter()
+                    forecast = model.predict(steps=horizon)
+                    predict_finished = time.perf_counter()
+                except Exception as e:
+                    folds.append({"origin": origin, "error": str(e)})
+                    continue
+
+                model_used = model.model_type
+                predicted = np.asarray(forecast['predicted_values'][:len(actual)], dtype=float)
+                errors = actual - predicted
+                denominator = np.abs(actual) + np.abs(predicted)
+                _, peak = tracemalloc.get_traced_memory()
+                folds.append({
+                    "origin": origin,
+                    "mae": float(np.mean(np.abs(errors))),
+                    "rmse": float(np.sqrt(np.mean(errors ** 2))),
+                    "smape": float(np.mean(np.where(denominator > 0, 2 * np.abs(errors) / np.where(denominator > 0, denominator, 1), 0.0))),
+                    "fit_seconds": predict_started - fit_started,
+                    "predict_seconds": predict_finished - predict_started,
+                    "peak_memory_bytes": int(peak - baseline)
+                })
+        finally:
+            if started_tracing:
+                tracemalloc.stop()
+
+        scored = [fold for fold in folds if "error" not in fold]
+        result = {
+            "model_type": model_type,
+            "model_used": model_used,
+            "samples": len(ordered),
+            "horizon": horizon,
+            "folds": folds,
+            "successful_folds": len(scored),
+            "ran_at": datetime.now().isoformat()
+        }
+        if scored:
+            result["summary"] = {
+                metric: float(np.mean([fold[metric] for fold in scored]))
+                for metric in ("mae", "rmse", "smape", "fit_seconds", "predict_seconds")
+            }
+            result["summary"]["peak_memory_bytes"] = max(fold["peak_memory_bytes"] for fold in scored)
+        else:
+            result["error"] = folds[0]["error"] if folds else "Series too short for backtesting"
+        return result
+
+    def run(self, dataset: str, model_type: str, time_series_data: pd.DataFrame, horizon: Optional[int] = None,
+            max_folds: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Backtest a model type, store the result and refresh the dataset's report.
+
+        Args:
+            dataset (str): Dataset name
+            model_type (str): Model type to evaluate
+            time_series_data (pd.DataFrame): Series to evaluate on
+            horizon (int): Steps forecast from each origin
+            max_folds (int): Maximum number of origins
+
+        Returns:
+            Dict with the backtest result
+        """
+        result = self.evaluate(model_type, time_series_data, horizon, max_folds)
+        result["dataset"] = dataset
+
+        dataset_dir = self.results_dir / dataset
+        dataset_dir.mkdir(parents=True, exist_ok=True)
+        result_path = dataset_dir / f"{model_type}.json"
+        tmp_path = result_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(result, f, indent=2)
+        os.replace(tmp_path, result_path)
+
+        self.write_report(dataset)
+        logger.info(f"Backtested {dataset}/{model_type}: {result.get('summary', result.get('error'))}")
+        return result
+
+    def load_results(self, dataset: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Load the stored backtest results of a dataset.
+
+        Args:
+            dataset (str): Dataset name
+
+        Returns:
+            Dict from model type to result
+        """
+        results = {}
+        dataset_dir = self.results_dir / dataset
+        if not dataset_dir.exists():
+            return results
+        for result_path in sorted(dataset_dir.glob("*.json")):
+            if result_path.stem == "report":
+                continue
+            try:
+                with open(result_path, 'r') as f:
+                    results[result_path.stem] = json.load(f)
+            except Exception as e:
+                logger.warning(f"Could not read backtest result {result_path}: {str(e)}")
+        return results
+
+    def recommend(self, dataset: str) -> Optional[str]:
+        """
+        Pick the model type with the best accuracy/latency trade-off from fresh results.
+
+        Among models whose mean RMSE is within accuracy_tolerance of the best,
+        the one with the lowest mean fit + predict time wins. Results whose
+        model fell back to another type are ignored.
+
+        Args:
+            dataset (str): Dataset name
+
+        Returns:
+            str: Recommended model type, or None without usable results
+        """
+        cutoff = datetime.now() - timedelta(days=self.max_age_days)
+        candidates = {}
+        for model_type, result in self.load_results(dataset).items():
+            summary = result.get("summary")
+            if (not summary or result.get("model_used") not in (model_type, None)
+                    or datetime.fromisoformat(result["ran_at"]) < cutoff):
+                continue
+            candidates[model_type] = summary
+
+        if not candidates:
+            return None
+        best_rmse = min(summary["rmse"] for summary in candidates.values())
+        eligible = [model_type for model_type, summary in candidates.items()
+                    if summary["rmse"] <= best_rmse * (1 + self.accuracy_tolerance)]
+        return min(eligible, key=lambda m: candidates[m]["fit_seconds"] + candidates[m]["predict_seconds"])
+
+    def write_report(self, dataset: str) -> Optional[Dict[str, Any]]:
+        """
+        Build the benchmark report of a dataset and write it as JSON and Markdown.
+
+        Args:
+            dataset (str): Dataset name
+
+        Returns:
+            Dict with per-model summaries and the recommendation, or None without results
+        """
+        results = self.load_results(dataset)
+        if not results:
+            return None
+
+        rows = []
+        for model_type, result in results.items():
+            summary = result.get("summary", {})
+            rows.append({
+                "model_type": model_type,
+                "model_used": result.get("model_used"),
+                "samples": result.get("samples"),
+                "horizon": result.get("horizon"),
+                "folds": result.get("successful_folds", 0),
+                **summary,
+                "error": result.get("error"),
+                "ran_at": result.get("ran_at")
+            })
+        rows.sort(key=lambda row: row.get("rmse", float("inf")))
+        report = {
+            "dataset": dataset,
+            "generated_at": datetime.now().isoformat(),
+            "recommended_model": self.recommend(dataset),
+            "models": rows
+        }
+
+        lines = [
+            f"# Backtest report: {dataset}",
+            "",
+            f"Generated {report['generated_at']}. Recommended model: **{report['recommended_model'] or 'n/a'}**",
+            "",
+            "| Model | Used | Folds | MAE | RMSE | sMAPE | Fit (s) | Predict (s) | Peak memory (MB) |",
+            "| ----- | ---- | ----- | --- | ---- | ----- | ------- | ----------- | ---------------- |"
+        ]
+        for row in rows:
+            if "rmse" not in row:
+                lines.append(f"| {row['model_type']} | {row['model_used'] or '-'} | 0 | - | - | - | - | - | - |")
+                continue
+            lines.append(
+                f"| {row['model_type']} | {row['model_used']} | {row['folds']} | {row['mae']:.4g} | {row['rmse']:.4g} "
+                f"| {row['smape']:.3f} | {row['fit_seconds']:.4f} | {row['predict_seconds']:.4f} "
+                f"| {row['peak_memory_bytes'] / (1024 * 1024):.2f} |"
+            )
+
+        dataset_dir = self.results_dir / dataset
+        for name, content in (("report.json", json.dumps(report, indent=2)), ("report.md", "\n".join(lines) + "\n")):
+            tmp_path = dataset_dir / f"{name}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w') as f:
+                f.write(content)
+            os.replace(tmp_path, dataset_dir / name)
+        return report
@@ -0,0 +1,233 @@
+"""
+Response cache for the /predict forecast endpoints.
+
+Forecasts are deterministic for a given data source, model type, set of
+source files and saved model version, so responses are cached under that
+key for a limited time. Identical requests arriving while a forecast is
+being computed wait for it instead of starting their own, a cached
+longer-horizon forecast answers shorter requests by slicing, and every
+response carries a content ETag for conditional GETs.
+"""
+
+import os
+import json
+import time
+import asyncio
+import hashlib
+import logging
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple, Callable, Awaitable, Hashable, Iterable
+
+logger = logging.getLogger(__name__)
+
+FORECAST_FIELDS = ("predicted_values", "timestamps")
+
+
+def files_version(paths: Iterable[Path]) -> str:
+    """
+    Fingerprint a set of files from their paths, sizes and modification times.
+
+    Args:
+        paths: Files to fingerprint (missing files are skipped)
+
+    Returns:
+        str: Hex digest that changes whenever a file is added, removed or modified
+    """
+    digest = hashlib.sha1()
+    for file_path in paths:
+        try:
+            stat = file_path.stat()
+        except OSError:
+            continue
+        digest.update(f"{file_path}|{stat.st_size}|{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def slice_forecast(result: Dict[str, Any], steps: int) -> Dict[str, Any]:
+    """
+    Cut a forecast response down to its first steps points.
+
+    Handles single-source responses and the per-source results of /predict/all.
+
+    Args:
+        result (Dict): Forecast response
+        steps (int): Number of steps to keep
+
+    Returns:
+        Dict with the same shape and at most steps forecast points
+    """
+    data = result.get("data")
+    if not isinstance(data, dict):
+        return result
+    if "predicted_values" in data:
+        sliced = {**data, **{field: data[field][:steps] for field in FORECAST_FIELDS if field in data}}
+        message = result.get("message")
+        if message and data.get("model_used"):
+            message = f"{steps}-step forecast generated successfully using {data['model_used']} model."
+        return {**result, "data": sliced, "message": message}
+    return {**result, "data": {name: slice_forecast(value, steps) if isinstance(value, dict) else value
+                               for name, value in data.items()}}
+
+
+def is_cacheable(result: Dict[str, Any]) -> bool:
+    """
+    Check that a forecast response succeeded, including every source of a multi-source response.
+
+    Args:
+        result (Dict): Forecast response
+
+    Returns:
+        bool: True if the response can be cached
+    """
+    if not result.get("success"):
+        return False
+    data = result.get("data")
+    if isinstance(data, dict) and "predicted_values" not in data:
+        return all(value.get("success", True) for value in data.values() if isinstance(value, dict))
+    return True
+
+
+class _CachedForecast:
+    """A cached response with the number of steps it holds."""
+
+    def __init__(self, result: Dict[str, Any], steps: int):
+        self.result = result
+        self.steps = steps
+        self.created = time.monotonic()
+        self._etags: Dict[int, str] = {}
+
+    def view(self, steps: int) -> Tuple[Dict[str, Any], str]:
+        """Get the response for a number of steps and its ETag."""
+        result = self.result if steps == self.steps else slice_forecast(self.result, steps)
+        if steps not in self._etags:
+            body = json.dumps(result, sort_keys=True, default=str).encode()
+            self._etags[steps] = f'"{hashlib.sha1(body).hexdigest()[:32]}"'
+        return result, self._etags[steps]
+
+
+class ForecastCache:
+    """
+    TTL cache of forecast responses with in-flight request coalescing.
+
+    Keys must contain everything a forecast depends on apart from the
+    horizon, e.g. (endpoint, model type, data and model versions per source).
+    The cache belongs to one event loop (the serving process).
+    """
+
+    def __init__(self, ttl_seconds: Optional[float] = None, max_entries: int = 256):
+        """
+        Initialize the forecast cache.
+
+        Args:
+            ttl_seconds (float): Seconds a response is served (FORECAST_CACHE_TTL, default 300; 0 disables caching)
+            max_entries (int): Responses kept before the least recently used is dropped
+        """
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else float(os.getenv("FORECAST_CACHE_TTL", "300"))
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, _CachedForecast]" = OrderedDict()
+        self._inflight: Dict[Hashable, Tuple[int, asyncio.Task]] = {}
+        self.stats = {"hits": 0, "sliced_hits": 0, "misses": 0, "coalesced": 0, "expired": 0, "evictions": 0}
+
+    def _lookup(self, key: Hashable, steps: int) -> Optional[_CachedForecast]:
+        """Get a fresh entry holding at least steps points."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry.created > self.ttl_seconds:
+            del self._entries[key]
+            self.stats["expired"] += 1
+            return None
+        if entry.steps < steps:
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _store(self, key: Hashable, result: Dict[str, Any], steps: int):
+        """Keep a successful response, evicting the least recently used beyond max_entries."""
+        current = self._entries.get(key)
+        if current is not None and current.steps > steps and time.monotonic() - current.created <= self.ttl_seconds:
+            return  # Keep the longer horizon
+        self._entries[key] = _CachedForecast(result, steps)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    async def get_or_compute(self, key_fn: Callable[[], Awaitable[Hashable]], steps: int,
+                             compute: Callable[[int], Awaitable[Dict[str, Any]]]) -> Tuple[Dict[str, Any], str, str]:
+        """
+        Serve a forecast from the cache, from a computation in flight, or by computing it.
+
+        The key is taken again once a computation finishes and the result is
+        stored under it, so a forecast that trained and saved a model is
+        served to the requests that follow (whose key has the new version).
+
+        Args:
+            key_fn (Callable): Coroutine function returning the cache key (everything but the horizon)
+            steps (int): Requested number of steps
+            compute (Callable): Coroutine function computing the response for a number of steps
+
+        Returns:
+            Tuple of (response, ETag, cache status: 'hit', 'coalesced' or 'miss')
+        """
+        if self.ttl_seconds <= 0:
+            result = await compute(steps)
+            return (*_CachedForecast(result, steps).view(steps), "miss")
+
+        key = await key_fn()
+        entry = self._lookup(key, steps)
+        if entry is not None:
+            self.stats["sliced_hits" if entry.steps > steps else "hits"] += 1
+            return (*entry.view(steps), "hit")
+
+        inflight = self._inflight.get(key)
+        if inflight is not None and inflight[0] >= steps:
+            self.stats["coalesced"] += 1
+            computed_steps, task = inflight
+            status = "coalesced"
+        else:
+            self.stats["misses"] += 1
+            computed_steps = steps
+            task = asyncio.ensure_future(self._compute_and_store(key_fn, steps, compute))
+            self._inflight[key] = (steps, task)
+            task.add_done_callback(lambda _: self._forget(key, task))
+            status = "miss"
+
+        # Shielded so a client disconnecting does not cancel the computation others are waiting on
+        result = await asyncio.shield(task)
+        return (*_CachedForecast(result, computed_steps).view(steps), status)
+
+    async def _compute_and_store(self, key_fn: Callable[[], Awaitable[Hashable]], steps: int,
+                                 compute: Callable[[int], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Run a computation and cache its result if it succeeded."""
+        result = await compute(steps)
+        if is_cacheable(result):
+            try:
+                self._store(await key_fn(), result, steps)
+            except Exception as e:
+                logger.warning(f"Could not cache forecast: {str(e)}")
+        return result
+
+    def _forget(self, key: Hashable, task: asyncio.Task):
+        """Remove a finished computation unless a newer one replaced it."""
+        if key in self._inflight and self._inflight[key][1] is task:
+            del self._inflight[key]
+
+    def invalidate(self):
+        """Drop every cached response (e.g. after a model was deleted)."""
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache occupancy and counters.
+
+        Returns:
+            Dict with entry count, TTL, in-flight computations and counters
+        """
+        return {
+            "entries": len(self._entries),
+            "ttl_seconds": self.ttl_seconds,
+            "in_flight": len(self._inflight),
+            **self.stats
+        }
@@ -6,49 +6,106 @@ ARIMA, Prophet, and LSTM models with automatic model selection.
 """
 
 import os
+import copy
 import json
+import time
+import hashlib
 import logging
 import pickle
+import re
+import weakref
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 import numpy as np
 import pandas as pd
-from sklearn.preprocessing import MinMaxScaler
-from sklearn.metrics import mean_squared_error, mean_absolute_error
 import warnings
 warnings.filterwarnings('ignore')
 
-# Import ML libraries with error handling
-try:
-    from statsmodels.tsa.arima.model import ARIMA
-    from statsmodels.tsa.stattools import adfuller
-    ARIMA_AVAILABLE = True
-except ImportError:
-    ARIMA_AVAILABLE = False
-
-try:
-    from prophet import Prophet
-    PROPHET_AVAILABLE = True
-except ImportError:
-    PROPHET_AVAILABLE = False
-
-try:
-    import tensorflow as tf
-    from tensorflow.keras.models import Sequential
-    from tensorflow.keras.layers import LSTM, Dense, Dropout
-    from tensorflow.keras.optimizers import Adam
-    LSTM_AVAILABLE = True
-except ImportError:
-    LSTM_AVAILABLE = False
+# Heavy ML libraries are imported on first use; availability is checked without importing them
+from .backends import backend_registry
+
+ARIMA_AVAILABLE = backend_registry.is_available("arima")
+PROPHET_AVAILABLE = backend_registry.is_available("prophet")
+LSTM_AVAILABLE = backend_registry.is_available("lstm")
 
 # Import data loaders
 from data_loaders.modis_loader import ModisDataLoader
 from data_loaders.merra_loader import MerraDataLoader
 from data_loaders.alos_loader import AlosDataLoader
 
+# Import model persistence
+from models.model_manager import ModelManager
+from models.registry import ModelRegistry
+from .arima_search import StepwiseArimaSearch
+from .statistical import FAST_MODEL_TYPES, fit_fast_model
+from .backtest import Backtester
+
 logger = logging.getLogger(__name__)
 
+# Series up to this length are forecast with the NumPy engine when model_type is 'auto'
+FAST_MODEL_MAX_SAMPLES = 200
+
+# Compiled multi-step forecasters, one per Keras model, dropped with the model
+_lstm_forecasters: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def lstm_forecast(model: Any, windows: np.ndarray, steps: int) -> np.ndarray:
+    """
+    Roll an LSTM forward over several steps for a batch of series in one compiled call.
+    
+    The recurrence (predict, drop the oldest value, append the prediction)
+    runs inside a tf.function loop, so a whole forecast costs about one
+    Keras call instead of one predict() per step. The step count is a tensor
+    argument, so different horizons reuse the same graph.
+    
+    Args:
+        model: Trained Keras model mapping (batch, seq_length, 1) windows to (batch, 1)
+        windows (np.ndarray): Scaled input windows, shape (batch, seq_length, 1)
+        steps (int): Number of steps to forecast
+        
+    Returns:
+        np.ndarray: Scaled forecasts, shape (batch, steps)
+    """
+    tf = backend_registry.load("lstm").tf
+    forecaster = _lstm_forecasters.get(model)
+    if forecaster is None:
+        @tf.function(reduce_retracing=True)
+        def forecaster(window, n_steps):
+            outputs = tf.TensorArray(window.dtype, size=n_steps)
+            for step in tf.range(n_steps):
+                predicted = model(window, training=False)
+                outputs = outputs.write(step, predicted[:, 0])
+                window = tf.concat([window[:, 1:, :], predicted[:, tf.newaxis, :]], axis=1)
+            return tf.transpose(outputs.stack())
+        _lstm_forecasters[model] = forecaster
+    
+    return forecaster(tf.convert_to_tensor(windows, dtype=tf.float32), tf.constant(steps, dtype=tf.int32)).numpy()
+
+
+def build_lstm_network(seq_length: int) -> Any:
+    """
+    Build and compile the stacked LSTM used for forecasting.
+    
+    Args:
+        seq_length (int): Input window length
+        
+    Returns:
+        Compiled Keras model
+    """
+    keras = backend_registry.load("lstm")
+    model = keras.Sequential([
+        keras.LSTM(50, return_sequences=True, input_shape=(seq_length, 1)),
+        keras.Dropout(0.2),
+        keras.LSTM(50, return_sequences=False),
+        keras.Dropout(0.2),
+        keras.Dense(25),
+        keras.Dense(1)
+    ])
+    model.compile(optimizer=keras.Adam(learning_rate=0.001), loss='mse')
+    return model
+
+
 class PredictiveModel:
     """
     Base class for predictive models supporting ARIMA, Prophet, and LSTM.
@@ -57,16 +114,19 @@ class PredictiveModel:
     models with automatic model selection based on data characteristics.
     """
     
-    def __init__(self, model_type: str = "auto"):
+    def __init__(self, model_type: str = "auto", search_workers: Optional[int] = None):
         """
         Initialize the predictive model.
         
         Args:
-            model_type (str): Type of model to use ('arima', 'prophet', 'lstm', 'auto')
+            model_type (str): Type of model to use ('arima', 'prophet', 'lstm', 'fast',
+                'holt_winters', 'seasonal_naive', 'linear_trend', 'auto')
+            search_workers (int): Worker processes for the ARIMA order search (default: default_search_workers())
         """
         self.model_type = model_type
+        self.search_workers = search_workers
         self.model = None
-        self.scaler = MinMaxScaler()
+        self.scaler = None  # fitted by LSTM training
         self.is_trained = False
         self.training_data = None
         self.metadata = {}
@@ -82,7 +142,9 @@ class PredictiveModel:
         Returns:
             str: Selected model type
         """
-        if self.model_type != "auto":
+        if self.model_type in FAST_MODEL_TYPES:
+            return self.model_type  # NumPy/SciPy only, always available
+        elif self.model_type != "auto":
             # Check if requested model is available, otherwise fallback
             if self.model_type == "lstm" and not LSTM_AVAILABLE:
                 logger.warning("LSTM model not available, falling back to ARIMA")
@@ -96,15 +158,15 @@ class PredictiveModel:
             return self.model_type
             
         n_samples = len(data)
+        if n_samples <= FAST_MODEL_MAX_SAMPLES:
+            return "fast"  # Statistical models fit short series in milliseconds
         
         # Check data characteristics
         has_seasonality = self._detect_seasonality(data[target_column])
         is_stationary = self._check_stationarity(data[target_column])
         
-        # Model selection logic with availability checks
-        if n_samples < 10 and ARIMA_AVAILABLE:
-            return "arima"  # ARIMA works with small datasets
-        elif n_samples >= 30 and LSTM_AVAILABLE and not is_stationary:
+        # Model selection logic with availability checks; every series here is longer than FAST_MODEL_MAX_SAMPLES
+        if LSTM_AVAILABLE and not is_stationary:
             return "lstm"  # LSTM for complex patterns with sufficient data
         elif has_seasonality and PROPHET_AVAILABLE:
             return "prophet"  # Prophet for seasonal data
@@ -151,7 +213,7 @@ class PredictiveModel:
             return False
             
         try:
-            result = adfuller(series.dropna())
+            result = backend_registry.load("arima").adfuller(series.dropna())
             return result[1] < 0.05  # p-value < 0.05 indicates stationarity
         except:
             return False
@@ -186,7 +248,9 @@ class PredictiveModel:
             logger.info(f"Training {selected_model} model on {len(data)} samples")
             
             # Train the selected model
-            if selected_model == "arima" and ARIMA_AVAILABLE:
+            if selected_model in FAST_MODEL_TYPES:
+                return self._train_fast(data, target_column)
+            elif selected_model == "arima" and ARIMA_AVAILABLE:
                 return self._train_arima(data, target_column)
             elif selected_model == "prophet" and PROPHET_AVAILABLE:
                 return self._train_prophet(data, target_column)
@@ -200,42 +264,63 @@ class PredictiveModel:
             logger.error(f"Error training model: {str(e)}")
             raise
     
+    def _train_fast(self, data: pd.DataFrame, target_column: str) -> Dict[str, Any]:
+        """Train a NumPy statistical model (Holt-Winters, seasonal naive or linear trend)."""
+        try:
+            self.model, selection = fit_fast_model(self.model_type, data[target_column].to_numpy(dtype=float))
+            self.is_trained = True
+            self.training_data = data[target_column]
+            
+            return {
+                "model_type": self.model.label,
+                "selected": self.model.name,
+                "season_length": selection["season_length"],
+                "scores": selection["scores"],
+                "training_samples": len(data),
+                "status": "success"
+            }
+            
+        except Exception as e:
+            logger.error(f"Error training {self.model_type} model: {str(e)}")
+            raise
+    
+    @staticmethod
+    def _arima_endog(series: pd.Series) -> pd.Series:
+        """Drop a date index statsmodels cannot forecast from (repeated dates) in favour of positions."""
+        if series.index.is_unique:
+            return series
+        return pd.Series(series.to_numpy(), index=pd.RangeIndex(len(series)), name=series.name)
+    
     def _train_arima(self, data: pd.DataFrame, target_column: str) -> Dict[str, Any]:
-        """Train ARIMA model."""
+        """Train ARIMA model, choosing the order with a stepwise AIC search."""
         try:
-            # Auto ARIMA parameter selection
-            best_aic = float('inf')
-            best_order = (1, 1, 1)
-            
-            # Try different ARIMA orders
-            for p in range(0, 3):
-                for d in range(0, 2):
-                    for q in range(0, 3):
-                        try:
-                            model = ARIMA(data[target_column], order=(p, d, q))
-                            fitted_model = model.fit()
-                            if fitted_model.aic < best_aic:
-                                best_aic = fitted_model.aic
-                                best_order = (p, d, q)
-                                self.model = fitted_model
-                        except:
-                            continue
-            
-            if self.model is None:
-                # Fallback to simple ARIMA(1,1,1)
-                self.model = ARIMA(data[target_column], order=(1, 1, 1)).fit()
+            ARIMA = backend_registry.load("arima").ARIMA
+            series = self._arima_endog(data[target_column])
+            try:
+                search = StepwiseArimaSearch(max_workers=self.search_workers).search(series)
+                best_order = search["order"]
+                # Refit from the winning candidate's parameters without the iteration cap
+                self.model = ARIMA(series, order=best_order, trend=search["trend"]).fit(
+                    start_params=search["params"])
+            except Exception as e:
+                logger.warning(f"ARIMA order search failed, using ARIMA(1,1,1): {str(e)}")
+                search = None
                 best_order = (1, 1, 1)
+                self.model = ARIMA(series, order=best_order).fit()
             
             self.is_trained = True
             self.training_data = data[target_column]
             
-            return {
+            result = {
                 "model_type": "ARIMA",
                 "order": best_order,
                 "aic": float(self.model.aic),
                 "training_samples": len(data),
                 "status": "success"
             }
+            if search is not None:
+                result["order_search"] = {key: value for key, value in search.items() if key != "params"}
+            return result
             
         except Exception as e:
             logger.error(f"Error training ARIMA: {str(e)}")
@@ -251,7 +336,7 @@ class PredictiveModel:
             })
             
             # Initialize and fit Prophet
-            self.model = Prophet(
+            self.model = backend_registry.load("prophet").Prophet(
                 yearly_seasonality=True,
                 weekly_seasonality=True,
                 daily_seasonality=False,
@@ -277,6 +362,8 @@ class PredictiveModel:
         try:
             # Prepare data for LSTM
             values = data[target_column].values.reshape(-1, 1)
+            from sklearn.preprocessing import MinMaxScaler
+            self.scaler = MinMaxScaler()
             scaled_values = self.scaler.fit_transform(values)
             
             # Create sequences for LSTM
@@ -294,16 +381,7 @@ class PredictiveModel:
                 raise ValueError("Insufficient data for LSTM training")
             
             # Build LSTM model
-            self.model = Sequential([
-                LSTM(50, return_sequences=True, input_shape=(seq_length, 1)),
-                Dropout(0.2),
-                LSTM(50, return_sequences=False),
-                Dropout(0.2),
-                Dense(25),
-                Dense(1)
-            ])
-            
-            self.model.compile(optimizer=Adam(learning_rate=0.001), loss='mse')
+            self.model = build_lstm_network(seq_length)
             
             # Train the model
             self.model.fit(X, y, epochs=50, batch_size=32, verbose=0, validation_split=0.2)
@@ -322,7 +400,122 @@ class PredictiveModel:
         except Exception as e:
             logger.error(f"Error training LSTM: {str(e)}")
             raise
-    
+
+    def update(self, new_points: pd.DataFrame, target_column: str = 'value', date_column: str = 'date',
+               epochs: int = 5) -> Dict[str, Any]:
+        """
+        Extend a trained model with newly arrived observations instead of refitting it.
+
+        ARIMA keeps its fitted parameters and only runs the state-space filter
+        over the new points, LSTM is fine-tuned from its current weights for a
+        few epochs, and Prophet is refitted with the previous parameters as the
+        optimizer's starting point.
+
+        Args:
+            new_points (pd.DataFrame): Observations newer than the training data
+            target_column (str): Name of the target column
+            date_column (str): Name of the date column (optional)
+            epochs (int): Fine-tuning epochs for LSTM
+
+        Returns:
+            Dict containing update results
+        """
+        if not self.is_trained:
+            raise ValueError("Model must be trained before it can be updated")
+
+        if date_column and date_column in new_points.columns:
+            new_points = new_points.sort_values(date_column).set_index(date_column)
+        new_series = new_points[target_column].dropna()
+        if new_series.empty:
+            raise ValueError("No new observations to update with")
+
+        try:
+            if self.model_type in FAST_MODEL_TYPES:
+                method = self._update_fast(new_series)
+            elif self.model_type == "arima":
+                method = self._update_arima(new_series)
+            elif self.model_type == "prophet":
+                method = self._update_prophet(new_series)
+            elif self.model_type == "lstm":
+                method = self._update_lstm(new_series, epochs)
+            else:
+                raise ValueError(f"Unknown model type: {self.model_type}")
+        except Exception as e:
+            logger.error(f"Error updating {self.model_type} model: {str(e)}")
+            raise
+
+        return {
+            "model_type": self.model_type,
+            "update_method": method,
+            "new_samples": len(new_series),
+            "training_samples": len(self.training_data),
+            "status": "success"
+        }
+
+    def _update_fast(self, new_series: pd.Series) -> str:
+        """Refit the statistical model on the extended series; a full fit is already cheap."""
+        full_series = pd.concat([self.training_data, new_series])
+        self.model, _ = fit_fast_model(self.model_type, full_series.to_numpy(dtype=float))
+        self.training_data = full_series
+        return "refit"
+
+    def _update_arima(self, new_series: pd.Series) -> str:
+        """Extend the ARIMA filter over new points, keeping the fitted parameters."""
+        full_series = pd.concat([self.training_data, new_series])
+        try:
+            self.model = self.model.append(new_series, refit=False)
+            method = "append"
+        except Exception as e:
+            # append() needs an index that continues the training index; irregular dates do not
+            logger.debug(f"ARIMA append failed, re-filtering full series: {str(e)}")
+            self.model = self.model.apply(self._arima_endog(full_series), refit=False)
+            method = "apply"
+        self.training_data = full_series
+        return method
+
+    def _update_prophet(self, new_series: pd.Series) -> str:
+        """Refit Prophet on the extended series, warm-started from the previous parameters."""
+        full_series = pd.concat([self.training_data, new_series])
+        params = self.model.params
+        warm_start = {name: params[name][0][0] for name in ('k', 'm', 'sigma_obs')}
+        warm_start.update({name: params[name][0] for name in ('delta', 'beta')})
+
+        prophet_data = pd.DataFrame({
+            'ds': full_series.index if hasattr(full_series.index, 'to_pydatetime') else pd.date_range(start='2020-01-01', periods=len(full_series), freq='D'),
+            'y': full_series.values
+        })
+        self.model = backend_registry.load("prophet").Prophet(
+            yearly_seasonality=True,
+            weekly_seasonality=True,
+            daily_seasonality=False,
+            seasonality_mode='multiplicative'
+        )
+        self.model.fit(prophet_data, init=warm_start)
+        self.training_data = full_series
+        return "warm_start"
+
+    def _update_lstm(self, new_series: pd.Series, epochs: int) -> str:
+        """Fine-tune the LSTM on windows ending in the new points, reusing the fitted scaler."""
+        full_series = pd.concat([self.training_data, new_series])
+        seq_length = self.metadata['seq_length']
+
+        # Only windows whose target is a new point, plus their history
+        tail = full_series.values[-(len(new_series) + seq_length):].reshape(-1, 1)
+        scaled_tail = self.scaler.transform(tail)
+        X = np.array([scaled_tail[i - seq_length:i] for i in range(seq_length, len(scaled_tail))])
+        y = scaled_tail[seq_length:]
+
+        if len(X):
+            # Fine-tuned on a clone: the fitted network may still be serving other requests
+            keras = backend_registry.load("lstm")
+            network = keras.tf.keras.models.clone_model(self.model)
+            network.set_weights(self.model.get_weights())
+            network.compile(optimizer=keras.Adam(learning_rate=0.001), loss='mse')
+            network.fit(X, y, epochs=epochs, batch_size=32, verbose=0)
+            self.model = network
+        self.training_data = full_series
+        return "fine_tune"
+
     def predict(self, steps: int = 5) -> Dict[str, Any]:
         """
         Generate predictions using the trained model.
@@ -337,7 +530,9 @@ class PredictiveModel:
             raise ValueError("Model must be trained before making predictions")
         
         try:
-            if self.model_type == "arima":
+            if self.model_type in FAST_MODEL_TYPES:
+                return self._predict_fast(steps)
+            elif self.model_type == "arima":
                 return self._predict_arima(steps)
             elif self.model_type == "prophet":
                 return self._predict_prophet(steps)
@@ -350,6 +545,25 @@ class PredictiveModel:
             logger.error(f"Error making predictions: {str(e)}")
             raise
     
+    def _predict_fast(self, steps: int) -> Dict[str, Any]:
+        """Generate statistical model predictions with analytic 95% intervals."""
+        forecast, lower, upper = self.model.forecast(steps)
+        
+        # Generate future dates
+        last_date = self.training_data.index[-1] if hasattr(self.training_data.index, 'to_pydatetime') else pd.Timestamp.now()
+        future_dates = pd.date_range(start=last_date + timedelta(days=1), periods=steps, freq='D')
+        
+        return {
+            "predicted_values": forecast.tolist(),
+            "timestamps": [d.strftime('%Y-%m-%d') for d in future_dates],
+            "confidence_intervals": {
+                "lower": lower.tolist(),
+                "upper": upper.tolist()
+            },
+            "model_used": self.model.label,
+            "confidence": 0.8
+        }
+    
     def _predict_arima(self, steps: int) -> Dict[str, Any]:
         """Generate ARIMA predictions."""
         forecast = self.model.forecast(steps=steps)
@@ -395,20 +609,12 @@ class PredictiveModel:
         # Use last sequence for prediction
         last_sequence = self.training_data.tail(self.metadata['seq_length']).values
         scaled_sequence = self.scaler.transform(last_sequence.reshape(-1, 1))
-        
-        predictions = []
         current_sequence = scaled_sequence[-self.metadata['seq_length']:].reshape(1, self.metadata['seq_length'], 1)
         
-        for _ in range(steps):
-            pred = self.model.predict(current_sequence, verbose=0)
-            predictions.append(pred[0, 0])
-            
-            # Update sequence for next prediction
-            current_sequence = np.roll(current_sequence, -1, axis=1)
-            current_sequence[0, -1, 0] = pred[0, 0]
+        predictions = lstm_forecast(self.model, current_sequence, steps)[0]
         
         # Inverse transform predictions
-        predictions = self.scaler.inverse_transform(np.array(predictions).reshape(-1, 1)).flatten()
+        predictions = self.scaler.inverse_transform(predictions.reshape(-1, 1)).flatten()
         
         # Generate future dates
         last_date = self.training_data.index[-1] if hasattr(self.training_data.index, 'to_pydatetime') else pd.Timestamp.now()
@@ -428,12 +634,326 @@ class TimeSeriesPredictor:
     forecasting capabilities for different geospatial data sources.
     """
     
-    def __init__(self):
-        """Initialize the time series predictor."""
+    def __init__(self, model_manager: Optional[ModelManager] = None, model_max_age_days: int = 7,
+                 holdout_size: int = 5, max_incremental_updates: int = 30,
+                 backtester: Optional[Backtester] = None, model_registry: Optional[ModelRegistry] = None):
+        """
+        Initialize the time series predictor.
+        
+        Args:
+            model_manager (ModelManager): Persistent model store, or None for the default directory
+            model_max_age_days (int): Age after which a cached model is retrained
+            holdout_size (int): Most recent samples held out to measure forecast error when training
+            max_incremental_updates (int): Warm-start updates allowed before a model is refitted from scratch
+            backtester (Backtester): Backtest store consulted by 'auto' selection, or None for the default directory
+            model_registry (ModelRegistry): In-memory cache of loaded models, or None for one over model_manager
+        """
         self.modis_loader = ModisDataLoader()
         self.merra_loader = MerraDataLoader()
         self.alos_loader = AlosDataLoader()
+        self.model_manager = model_manager or ModelManager()
+        self.model_max_age_days = model_max_age_days
+        self.holdout_size = holdout_size
+        self.max_incremental_updates = max_incremental_updates
+        self.backtester = backtester or Backtester()
+        self.model_registry = model_registry or ModelRegistry(self.model_manager)
+        self.cache_stats = {"memory_hits": 0, "disk_hits": 0, "updated": 0, "trained": 0}
+    
+    @staticmethod
+    def canonical_order(time_series_data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Order a series by date, then metric, so appended observations always come last.
+        
+        Extractors that melt a wide frame order rows by metric first, which
+        puts a new date in the middle of the frame.
+        
+        Args:
+            time_series_data (pd.DataFrame): Extracted time series
+            
+        Returns:
+            pd.DataFrame: The rows sorted by ('date', 'metric') where present (stable)
+        """
+        keys = [column for column in ('date', 'metric') if column in time_series_data.columns]
+        if not keys:
+            return time_series_data
+        return time_series_data.sort_values(keys, kind='mergesort')
+    
+    @staticmethod
+    def data_fingerprint(time_series_data: pd.DataFrame) -> str:
+        """
+        Fingerprint the training data so a cached model is only reused for the same series.
+        
+        Only the metric and value columns are hashed: several extractors stamp
+        undated values with the current time, which would otherwise change the
+        fingerprint on every request. Rows are hashed in canonical_order(), so
+        the fingerprint of a prefix of that order identifies the data a model
+        was trained on when new observations are appended.
+        
+        Args:
+            time_series_data (pd.DataFrame): Extracted time series
+            
+        Returns:
+            str: Hex digest of the series
+        """
+        ordered = TimeSeriesPredictor.canonical_order(time_series_data)
+        columns = [column for column in ('metric', 'value') if column in ordered.columns]
+        hashed = pd.util.hash_pandas_object(ordered[columns], index=False).values
+        return hashlib.sha1(hashed.tobytes()).hexdigest()
+    
+    def get_trained_model(self, data_source: str, model_type: str,
+                          time_series_data: pd.DataFrame) -> Tuple[PredictiveModel, Dict[str, Any], str]:
+        """
+        Get a model trained on the given series, from memory, from disk, or by training it.
+        
+        The latest version of (dataset, model_type) is taken from the model
+        registry, which keeps it in memory or loads it from disk, and is reused
+        while it was trained on the same series (data fingerprint) and is not
+        older than model_max_age_days. Versions trained by POST /predict/train
+        in another worker take over because the registry follows the latest
+        persisted version. When the series only gained new observations since
+        the persisted model was trained, a copy of that model is updated
+        instead of refitted.
+        
+        Args:
+            data_source (str): Data source ('modis', 'merra', 'alos')
+            model_type (str): Requested model type
+            time_series_data (pd.DataFrame): Training series
+            
+        Returns:
+            Tuple of (trained model, training result, cache status: 'memory', 'disk', 'updated' or 'trained')
+        """
+        fingerprint = self.data_fingerprint(time_series_data)
+        max_age = timedelta(days=self.model_max_age_days)
+        
+        model_info = self.model_manager.get_model_info(data_source, model_type)
+        if model_info is None or self.model_manager.is_model_fresh(data_source, model_type, self.model_max_age_days):
+            loaded = self.model_registry.get(data_source, model_type)
+            if loaded is not None and isinstance(loaded[0], PredictiveModel):
+                model, metadata, from_memory = loaded
+                trained_at = metadata.get('trained_at')
+                if (metadata.get('fingerprint') == fingerprint and trained_at
+                        and datetime.now() - datetime.fromisoformat(trained_at) <= max_age):
+                    self.cache_stats["memory_hits" if from_memory else "disk_hits"] += 1
+                    return model, metadata['training_result'], "memory" if from_memory else "disk"
+
+                if model_info is not None:
+                    # Updated as a copy so requests still using the registered version are unaffected;
+                    # every update path assigns a new estimator rather than changing the fitted one
+                    updated = self._update_and_persist(data_source, model_type, copy.copy(model),
+                                                       model_info.get('training_samples', 0), metadata,
+                                                       time_series_data)
+                    if updated is not None:
+                        return updated[0], updated[1], "updated"
+
+        model, training_result = self._fit_and_persist(data_source, model_type, time_series_data)
+        return model, training_result, "trained"
+
+    def _update_and_persist(self, data_source: str, model_type: str, model: PredictiveModel,
+                            previous_length: int, metadata: Dict[str, Any],
+                            time_series_data: pd.DataFrame) -> Optional[Tuple[PredictiveModel, Dict[str, Any]]]:
+        """
+        Warm-start a persisted model when the new series only appends observations to its training data.
+
+        After max_incremental_updates consecutive updates the model is refitted
+        from scratch so parameter drift does not accumulate.
+
+        Args:
+            data_source (str): Data source name
+            model_type (str): Requested model type
+            model (PredictiveModel): Persisted model
+            previous_length (int): Length of the series the persisted model was trained on
+            metadata (Dict): Persisted model metadata
+            time_series_data (pd.DataFrame): New training series
+
+        Returns:
+            Tuple of (updated model, training result), or None if a full refit is needed
+        """
+        updates = metadata.get('training_result', {}).get('incremental_updates', 0)
+        ordered = self.canonical_order(time_series_data)
+        if (len(ordered) <= previous_length or updates >= self.max_incremental_updates
+                or self.data_fingerprint(ordered.iloc[:previous_length]) != metadata.get('fingerprint')):
+            return None
+
+        started = time.perf_counter()
+        try:
+            update_result = model.update(ordered.iloc[previous_length:], 'value', 'date')
+        except Exception as e:
+            logger.warning(f"Incremental update of {data_source}_{model_type} failed, refitting: {str(e)}")
+            return None
+
+        trained_at = datetime.now()
+        training_result = {
+            **metadata['training_result'],
+            "training_samples": update_result["training_samples"],
+            "training_duration_seconds": round(time.perf_counter() - started, 3),
+            "trained_at": trained_at.isoformat(),
+            "incremental_updates": updates + 1,
+            "update": update_result
+        }
+        self.cache_stats["updated"] += 1
+
+        self._persist_and_register(data_source, model_type, model, time_series_data, {
+            **metadata,
+            'fingerprint': self.data_fingerprint(time_series_data),
+            'trained_at': trained_at.isoformat(),
+            'training_result': training_result
+        })
+        return model, training_result
+    
+    def train_model(self, data_source: str, model_type: str = "auto") -> Dict[str, Any]:
+        """
+        Run the training pipeline for a data source and persist the result as a new model version.
+        
+        Args:
+            data_source (str): Data source ('modis', 'merra', 'alos')
+            model_type (str): Model type to train
+            
+        Returns:
+            Dict describing the trained version: duration, samples and holdout error metrics
+        """
+        raw_data = self._load_source_data(data_source)
+        time_series_data = self.extract_time_series_data(data_source, raw_data)
+        if len(time_series_data) < 3:
+            raise ValueError(f"Insufficient data for {data_source} training")
+        
+        model, training_result = self._fit_and_persist(data_source, model_type, time_series_data)
+        model_info = self.model_manager.get_model_info(data_source, model_type) or {}
+        
+        return {
+            "dataset": data_source,
+            "requested_model": model_type,
+            "model_used": model.model_type,
+            "version": model_info.get('version'),
+            "processed_files": raw_data.get('total_files', 0),
+            **training_result
+        }
+    
+    def _fit_and_persist(self, data_source: str, model_type: str,
+                         time_series_data: pd.DataFrame) -> Tuple[PredictiveModel, Dict[str, Any]]:
+        """
+        Evaluate on a holdout, fit on the full series and save the model through the ModelManager.
+        
+        Args:
+            data_source (str): Data source name
+            model_type (str): Requested model type
+            time_series_data (pd.DataFrame): Training series
+            
+        Returns:
+            Tuple of (trained model, training result including duration and evaluation)
+        """
+        fingerprint = self.data_fingerprint(time_series_data)
+        resolved_type = self.resolve_model_type(data_source, model_type)
+        evaluation = self._evaluate_holdout(resolved_type, time_series_data)
+        
+        started = time.perf_counter()
+        model = PredictiveModel(model_type=resolved_type)
+        training_result = model.train(time_series_data, 'value', 'date')
+        trained_at = datetime.now()
+        training_result.update({
+            "training_duration_seconds": round(time.perf_counter() - started, 3),
+            "trained_at": trained_at.isoformat(),
+            "evaluation": evaluation,
+            "selected_by": "backtest" if resolved_type != model_type else "requested" if model_type != "auto" else "heuristic"
+        })
+        self.cache_stats["trained"] += 1
+        
+        self._persist_and_register(data_source, model_type, model, time_series_data, {
+            'fingerprint': fingerprint,
+            'trained_at': trained_at.isoformat(),
+            'selected_model': model.model_type,
+            'training_result': training_result
+        })
+        return model, training_result
+    
+    def _persist_and_register(self, data_source: str, model_type: str, model: PredictiveModel,
+                              time_series_data: pd.DataFrame, metadata: Dict[str, Any]):
+        """
+        Save a model as a new version and keep it resident in the model registry.
+        
+        Args:
+            data_source (str): Data source name
+            model_type (str): Requested model type
+            model (PredictiveModel): Trained model
+            time_series_data (pd.DataFrame): Training series
+            metadata (Dict): Model metadata
+        """
+        saved = self.model_manager.save_model(data_source, model_type, model, time_series_data, metadata)
+        if not saved:
+            logger.warning(f"Could not persist {data_source}_{model_type}; serving it from memory only")
+            version = None
+        else:
+            version = (self.model_manager.get_model_info(data_source, model_type) or {}).get('version')
+        self.model_registry.put(data_source, model_type, version, model, metadata)
+    
+    def resolve_model_type(self, data_source: str, model_type: str) -> str:
+        """
+        Replace 'auto' with the model recommended by stored backtest results, if any.
+        
+        Args:
+            data_source (str): Data source name
+            model_type (str): Requested model type
+            
+        Returns:
+            str: Model type to train
+        """
+        if model_type != "auto":
+            return model_type
+        try:
+            return self.backtester.recommend(data_source) or model_type
+        except Exception as e:
+            logger.warning(f"Could not read backtest results for {data_source}: {str(e)}")
+            return model_type
+    
+    def backtest_model(self, data_source: str, model_type: str, horizon: int = 5, max_folds: int = 5) -> Dict[str, Any]:
+        """
+        Run a rolling-origin backtest of one model type on a data source and store the result.
+        
+        Args:
+            data_source (str): Data source ('modis', 'merra', 'alos')
+            model_type (str): Model type to evaluate
+            horizon (int): Steps forecast from each origin
+            max_folds (int): Maximum number of origins
+            
+        Returns:
+            Dict with the backtest result
+        """
+        time_series_data = self.extract_time_series_data(data_source, self._load_source_data(data_source))
+        return self.backtester.run(data_source, model_type, time_series_data, horizon, max_folds)
+    
+    def _evaluate_holdout(self, model_type: str, time_series_data: pd.DataFrame) -> Optional[Dict[str, Any]]:
+        """
+        Measure forecast error by training without the latest samples and forecasting them.
+        
+        Args:
+            model_type (str): Requested model type
+            time_series_data (pd.DataFrame): Full training series
+            
+        Returns:
+            Dict with holdout size, MAE, RMSE and duration, or None if the series is too short
+        """
+        ordered = time_series_data.sort_values('date', kind='stable') if 'date' in time_series_data else time_series_data
+        holdout = max(1, min(self.holdout_size, len(ordered) // 5))
+        if len(ordered) - holdout < 3:
+            return None
         
+        started = time.perf_counter()
+        try:
+            candidate = PredictiveModel(model_type=model_type)
+            candidate.train(ordered.iloc[:-holdout], 'value', 'date')
+            forecast = candidate.predict(steps=holdout)
+        except Exception as e:
+            logger.warning(f"Holdout evaluation failed: {str(e)}")
+            return {"holdout_samples": holdout, "error": str(e)}
+        
+        actual = ordered['value'].iloc[-holdout:].to_numpy(dtype=float)
+        predicted = np.asarray(forecast['predicted_values'][:holdout], dtype=float)
+        return {
+            "holdout_samples": holdout,
+            "mae": float(np.mean(np.abs(actual - predicted))),
+            "rmse": float(np.sqrt(np.mean((actual - predicted) ** 2))),
+            "duration_seconds": round(time.perf_counter() - started, 3)
+        }
+    
     def extract_time_series_data(self, data_source: str, data: Dict[str, Any]) -> pd.DataFrame:
         """
         Extract time series data from processed geospatial data.
@@ -465,20 +985,21 @@ class TimeSeriesPredictor:
         
         for file_data in data.get('files', []):
             vegetation_data = file_data.get('vegetation_indices', {})
+            file_date = file_data.get('file_info', {}).get('date')
             
             for index_name, index_data in vegetation_data.items():
-                if 'mean_value' in index_data:
+                if index_data.get('mean_value') is not None:
                     time_series_data.append({
-                        'date': pd.Timestamp.now(),  # Placeholder - would need actual dates from HDF
+                        'date': pd.Timestamp(file_date) if file_date else pd.Timestamp.now(),
                         'value': index_data['mean_value'],
                         'metric': index_name,
                         'source': 'MODIS'
                     })
         
         if not time_series_data:
-            # Create synthetic data for demonstration
+            # Create synthetic data for demonstration (seeded, so cached models stay valid)
             dates = pd.date_range(start='2020-01-01', periods=30, freq='D')
-            values = np.random.normal(0.5, 0.1, 30)  # Synthetic NDVI values
+            values = np.random.default_rng(0).normal(0.5, 0.1, 30)  # Synthetic NDVI values
             
             return pd.DataFrame({
                 'date': dates,
@@ -491,6 +1012,18 @@ class TimeSeriesPredictor:
     
     def _extract_merra_timeseries(self, data: Dict[str, Any]) -> pd.DataFrame:
         """Extract time series from MERRA-2 data."""
+        # Prefer real area-mean series from the multi-file cube, dated per file
+        try:
+            series = self.merra_loader.get_area_mean_series()
+        except Exception as e:
+            logger.warning(f"Could not build MERRA-2 time-series cube: {str(e)}")
+            series = pd.DataFrame()
+        
+        if not series.empty:
+            long_data = series.reset_index().melt(id_vars='date', var_name='metric', value_name='value')
+            long_data['source'] = 'MERRA-2'
+            return long_data.dropna(subset=['value'])[['date', 'value', 'metric', 'source']]
+        
         time_series_data = []
         
         for file_data in data.get('files', []):
@@ -506,9 +1039,9 @@ class TimeSeriesPredictor:
                     })
         
         if not time_series_data:
-            # Create synthetic data for demonstration
+            # Create synthetic data for demonstration (seeded)
             dates = pd.date_range(start='2020-01-01', periods=30, freq='D')
-            values = np.random.normal(280, 10, 30)  # Synthetic temperature values
+            values = np.random.default_rng(0).normal(280, 10, 30)  # Synthetic temperature values
             
             return pd.DataFrame({
                 'date': dates,
@@ -538,9 +1071,9 @@ class TimeSeriesPredictor:
                     })
         
         if not time_series_data:
-            # Create synthetic data for demonstration
+            # Create synthetic data for demonstration (seeded)
             dates = pd.date_range(start='2020-01-01', periods=30, freq='D')
-            values = np.random.normal(0.3, 0.05, 30)  # Synthetic reflectivity values
+            values = np.random.default_rng(0).normal(0.3, 0.05, 30)  # Synthetic reflectivity values
             
             return pd.DataFrame({
                 'date': dates,
@@ -551,6 +1084,25 @@ class TimeSeriesPredictor:
         
         return pd.DataFrame(time_series_data)
     
+    def _load_source_data(self, data_source: str) -> Dict[str, Any]:
+        """
+        Load the processed data of a source through its loader.
+        
+        Args:
+            data_source (str): Data source ('modis', 'merra', 'alos')
+            
+        Returns:
+            Dict returned by the loader's load_data()
+        """
+        if data_source == "modis":
+            return self.modis_loader.load_data()
+        elif data_source == "merra":
+            return self.merra_loader.load_data()
+        elif data_source == "alos":
+            return self.alos_loader.load_data()
+        else:
+            raise ValueError(f"Unknown data source: {data_source}")
+    
     def predict_data_source(self, data_source: str, model_type: str = "auto", steps: int = 5) -> Dict[str, Any]:
         """
         Generate predictions for a specific data source.
@@ -567,14 +1119,7 @@ class TimeSeriesPredictor:
             logger.info(f"Generating predictions for {data_source} using {model_type} model")
             
             # Load data
-            if data_source == "modis":
-                raw_data = self.modis_loader.load_data()
-            elif data_source == "merra":
-                raw_data = self.merra_loader.load_data()
-            elif data_source == "alos":
-                raw_data = self.alos_loader.load_data()
-            else:
-                raise ValueError(f"Unknown data source: {data_source}")
+            raw_data = self._load_source_data(data_source)
             
             # Extract time series data
             time_series_data = self.extract_time_series_data(data_source, raw_data)
@@ -582,9 +1127,8 @@ class TimeSeriesPredictor:
             if len(time_series_data) < 3:
                 raise ValueError(f"Insufficient data for {data_source} prediction")
             
-            # Train model
-            model = PredictiveModel(model_type=model_type)
-            training_result = model.train(time_series_data, 'value', 'date')
+            # Reuse a model trained on the same series, training one only if needed
+            model, training_result, cache_status = self.get_trained_model(data_source, model_type, time_series_data)
             
             # Generate predictions
             predictions = model.predict(steps=steps)
@@ -604,7 +1148,8 @@ class TimeSeriesPredictor:
                     "processed_files": raw_data.get('total_files', 0),
                     "file_type": "HDF" if data_source == "modis" else "NetCDF" if data_source == "merra" else "Mixed",
                     "confidence": confidence,
-                    "training_samples": training_result.get('training_samples', 0)
+                    "training_samples": training_result.get('training_samples', 0),
+                    "model_cache": cache_status
                 },
                 "message": f"{steps}-step forecast generated successfully using {predictions['model_used']} model."
             }
@@ -619,6 +1164,192 @@ class TimeSeriesPredictor:
                 "message": f"Failed to generate predictions for {data_source}"
             }
     
+    @staticmethod
+    def split_series(time_series_data: pd.DataFrame) -> Dict[Tuple[str, str], pd.DataFrame]:
+        """
+        Split an extracted long-format frame into one date-ordered series per (source, metric).
+
+        Args:
+            time_series_data (pd.DataFrame): Extracted time series with source and metric columns
+
+        Returns:
+            Dict mapping (source, metric) to that series' rows
+        """
+        groups = {}
+        for (source, metric), frame in time_series_data.groupby(['source', 'metric'], sort=True):
+            if 'date' in frame.columns:
+                frame = frame.sort_values('date', kind='stable')
+            groups[(source, metric)] = frame.reset_index(drop=True)
+        return groups
+
+    @staticmethod
+    def series_dataset_name(data_source: str, metric: str) -> str:
+        """
+        Name under which a single series' models are cached and persisted.
+
+        Args:
+            data_source (str): Data source ('modis', 'merra', 'alos')
+            metric (str): Metric name
+
+        Returns:
+            str: Dataset name without underscores, e.g. 'modis-NDVI'
+        """
+        return f"{data_source}-{re.sub(r'[^A-Za-z0-9]+', '-', str(metric)).strip('-')}"
+
+    def list_series(self, data_source: str) -> List[Dict[str, Any]]:
+        """
+        List the (source, metric) series available for a data source.
+
+        Args:
+            data_source (str): Data source ('modis', 'merra', 'alos')
+
+        Returns:
+            List of dicts with source, metric and sample count
+        """
+        time_series_data = self.extract_time_series_data(data_source, self._load_source_data(data_source))
+        return [{"source": source, "metric": metric, "samples": len(frame)}
+                for (source, metric), frame in self.split_series(time_series_data).items()]
+
+    def forecast_series(self, data_source: str, model_type: str = "auto", steps: int = 5,
+                        metrics: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Forecast every (source, metric) series of a data source separately.
+
+        Each series gets its own cached model under series_dataset_name(). With
+        LSTM all series share one network trained on their pooled windows and
+        forecast together in a single batch per step.
+
+        Args:
+            data_source (str): Data source ('modis', 'merra', 'alos')
+            model_type (str): Model type to use
+            steps (int): Number of prediction steps
+            metrics (List[str]): Metrics to forecast, or None for all
+
+        Returns:
+            Dict containing one result per series and the per-series errors
+        """
+        try:
+            raw_data = self._load_source_data(data_source)
+            groups = self.split_series(self.extract_time_series_data(data_source, raw_data))
+            if metrics:
+                groups = {key: frame for key, frame in groups.items() if key[1] in metrics}
+
+            if model_type == "lstm" and LSTM_AVAILABLE:
+                series_results, errors = self._forecast_lstm_batch(data_source, groups, steps)
+            else:
+                series_results, errors = [], []
+                for (source, metric), frame in groups.items():
+                    try:
+                        if len(frame) < 3:
+                            raise ValueError(f"Insufficient data ({len(frame)} samples)")
+                        model, training_result, cache_status = self.get_trained_model(
+                            self.series_dataset_name(data_source, metric), model_type, frame)
+                        predictions = model.predict(steps=steps)
+                        series_results.append({
+                            "source": source,
+                            "metric": metric,
+                            "predicted_values": predictions["predicted_values"],
+                            "timestamps": predictions["timestamps"],
+                            "confidence_intervals": predictions.get("confidence_intervals"),
+                            "model_used": predictions["model_used"],
+                            "training_samples": training_result.get('training_samples', len(frame)),
+                            "model_cache": cache_status
+                        })
+                    except Exception as e:
+                        logger.warning(f"Forecast failed for {source}/{metric}: {str(e)}")
+                        errors.append({"source": source, "metric": metric, "error": str(e)})
+
+            return {
+                "success": bool(series_results) or not errors,
+                "data": {"series": series_results, "errors": errors},
+                "metadata": {
+                    "dataset": data_source,
+                    "processed_files": raw_data.get('total_files', 0),
+                    "series_count": len(series_results),
+                    "failed_series": len(errors)
+                },
+                "message": f"{steps}-step forecasts generated for {len(series_results)} series"
+            }
+
+        except Exception as e:
+            logger.error(f"Error generating series forecasts for {data_source}: {str(e)}")
+            return {
+                "success": False,
+                "error": f"Error generating series forecasts: {str(e)}",
+                "data": None,
+                "metadata": None,
+                "message": f"Failed to generate series forecasts for {data_source}"
+            }
+
+    def _forecast_lstm_batch(self, data_source: str, groups: Dict[Tuple[str, str], pd.DataFrame],
+                             steps: int) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Train one LSTM on the windows of all series and forecast them as a single batch.
+
+        Every series is min-max scaled on its own so they can share weights.
+
+        Args:
+            data_source (str): Data source name
+            groups (Dict): (source, metric) -> series rows
+            steps (int): Number of prediction steps
+
+        Returns:
+            Tuple of (per-series results, per-series errors)
+        """
+        errors = []
+        usable = {key: frame for key, frame in groups.items() if len(frame) >= 8}
+        for key in groups.keys() - usable.keys():
+            errors.append({"source": key[0], "metric": key[1],
+                           "error": f"Insufficient data ({len(groups[key])} samples)"})
+        if not usable:
+            return [], errors
+
+        keys = list(usable)
+        seq_length = min(10, min(len(frame) for frame in usable.values()) // 3)
+        from sklearn.preprocessing import MinMaxScaler
+        scalers = {key: MinMaxScaler() for key in keys}
+        scaled = {key: scalers[key].fit_transform(usable[key]['value'].to_numpy(dtype=float).reshape(-1, 1))
+                  for key in keys}
+
+        fingerprint = hashlib.sha1("".join(self.data_fingerprint(usable[key]) for key in keys).encode()).hexdigest()
+        # The shared network is not persisted; it is registered under its data fingerprint
+        cached = self.model_registry.get_cached(f"{data_source}-batch", "lstm", fingerprint)
+        if cached is not None and datetime.now() - datetime.fromisoformat(cached[1]['trained_at']) <= timedelta(days=self.model_max_age_days):
+            model, cache_status = cached[0], "memory"
+            self.cache_stats["memory_hits"] += 1
+        else:
+            X = np.concatenate([np.array([values[i - seq_length:i] for i in range(seq_length, len(values))])
+                                for values in scaled.values()])
+            y = np.concatenate([values[seq_length:] for values in scaled.values()])
+            model = build_lstm_network(seq_length)
+            model.fit(X, y, epochs=50, batch_size=32, verbose=0, validation_split=0.2)
+            self.model_registry.put(f"{data_source}-batch", "lstm", fingerprint, model,
+                                    {"training_samples": len(X), "trained_at": datetime.now().isoformat()})
+            self.cache_stats["trained"] += 1
+            cache_status = "trained"
+
+        # Advance all series together in one compiled call
+        windows = np.stack([scaled[key][-seq_length:] for key in keys])
+        forecasts = lstm_forecast(model, windows, steps)
+
+        results = []
+        for row, key in enumerate(keys):
+            frame = usable[key]
+            values = scalers[key].inverse_transform(forecasts[row].reshape(-1, 1)).flatten()
+            last_date = pd.Timestamp(frame['date'].iloc[-1]) if 'date' in frame.columns else pd.Timestamp.now()
+            future_dates = pd.date_range(start=last_date + timedelta(days=1), periods=steps, freq='D')
+            results.append({
+                "source": key[0],
+                "metric": key[1],
+                "predicted_values": values.tolist(),
+                "timestamps": [d.strftime('%Y-%m-%d') for d in future_dates],
+                "confidence_intervals": None,
+                "model_used": "LSTM (shared batch)",
+                "training_samples": len(frame),
+                "model_cache": cache_status
+            })
+        return results, errors
+
     def predict_all_sources(self, model_type: str = "auto", steps: int = 5) -> Dict[str, Any]:
         """
         Generate predictions for all data sources.
@@ -669,3 +1400,120 @@ class TimeSeriesPredictor:
                 "metadata": None,
                 "message": "Failed to generate multi-source predictions"
             }
+
+
+# Per-process predictor used by the shared execution layer's worker pools
+_worker_predictor: Optional[TimeSeriesPredictor] = None
+
+
+def get_worker_predictor() -> TimeSeriesPredictor:
+    """
+    Get the predictor instance owned by the current worker process.
+    
+    Returns:
+        TimeSeriesPredictor created on first use in this process
+    """
+    global _worker_predictor
+    if _worker_predictor is None:
+        _worker_predictor = TimeSeriesPredictor()
+    return _worker_predictor
+
+
+def run_source_prediction(data_source: str, model_type: str = "auto", steps: int = 5) -> Dict[str, Any]:
+    """
+    Picklable entry point for predicting a single data source in a worker.
+    
+    Args:
+        data_source (str): Data source ('modis', 'merra', 'alos')
+        model_type (str): Model type to use
+        steps (int): Number of prediction steps
+        
+    Returns:
+        Dict containing predictions and metadata
+    """
+    return get_worker_predictor().predict_data_source(data_source, model_type, steps)
+
+
+def run_registry_stats() -> Dict[str, Any]:
+    """
+    Picklable entry point for reading a worker's model registry counters.
+    
+    Returns:
+        Dict with the worker's process id and registry stats (empty before its first prediction)
+    """
+    stats = _worker_predictor.model_registry.get_stats() if _worker_predictor is not None else {}
+    return {"pid": os.getpid(), **stats}
+
+
+def run_training(data_source: str, model_type: str = "auto") -> Dict[str, Any]:
+    """
+    Picklable entry point for training and persisting a model in a worker.
+    
+    Args:
+        data_source (str): Data source ('modis', 'merra', 'alos')
+        model_type (str): Model type to train
+        
+    Returns:
+        Dict describing the trained model version
+    """
+    return get_worker_predictor().train_model(data_source, model_type)
+
+
+def run_list_series(data_source: str) -> List[Dict[str, Any]]:
+    """
+    Picklable entry point for listing the (source, metric) series of a data source in a worker.
+
+    Args:
+        data_source (str): Data source ('modis', 'merra', 'alos')
+
+    Returns:
+        List of dicts with source, metric and sample count
+    """
+    return get_worker_predictor().list_series(data_source)
+
+
+def run_series_forecast(data_source: str, model_type: str = "auto", steps: int = 5,
+                        metrics: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Picklable entry point for forecasting a batch of (source, metric) series in a worker.
+
+    Args:
+        data_source (str): Data source ('modis', 'merra', 'alos')
+        model_type (str): Model type to use
+        steps (int): Number of prediction steps
+        metrics (List[str]): Metrics to forecast, or None for all
+
+    Returns:
+        Dict containing per-series forecasts and errors
+    """
+    return get_worker_predictor().forecast_series(data_source, model_type, steps, metrics)
+
+
+def run_backtest(data_source: str, model_type: str, horizon: int = 5, max_folds: int = 5) -> Dict[str, Any]:
+    """
+    Picklable entry point for backtesting one model type on a data source in a worker.
+    
+    Args:
+        data_source (str): Data source ('modis', 'merra', 'alos')
+        model_type (str): Model type to evaluate
+        horizon (int): Steps forecast from each origin
+        max_folds (int): Maximum number of origins
+        
+    Returns:
+        Dict with the backtest result
+    """
+    return get_worker_predictor().backtest_model(data_source, model_type, horizon, max_folds)
+
+
+def run_all_predictions(model_type: str = "auto", steps: int = 5) -> Dict[str, Any]:
+    """
+    Picklable entry point for predicting all data sources in a worker.
+    
+    Args:
+        model_type (str): Model type to use
+        steps (int): Number of prediction steps
+        
+    Returns:
+        Dict containing combined predictions
+    """
+    return get_worker_predictor().predict_all_sources(model_type, steps)
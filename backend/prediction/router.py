@@ -5,22 +5,38 @@ This module provides REST API endpoints for time-series forecasting
 of geospatial data using various machine learning models.
 """
 
+import math
+import asyncio
 import logging
-from typing import Optional
-from fastapi import APIRouter, HTTPException, Query
+from typing import Optional, Dict, Any, List, Tuple, Callable
+from fastapi import APIRouter, HTTPException, Query, Header, Response
 from pydantic import BaseModel
 
-from .predictor import TimeSeriesPredictor
+from .predictor import (run_source_prediction, run_all_predictions, run_training,
+                        run_list_series, run_series_forecast, run_backtest, run_registry_stats, ARIMA_AVAILABLE,
+                        PROPHET_AVAILABLE, LSTM_AVAILABLE)
+from .backtest import Backtester
+from .forecast_cache import ForecastCache, files_version
 from models.model_manager import ModelManager
+from data_loaders.modis_loader import ModisDataLoader
+from data_loaders.merra_loader import MerraDataLoader
+from data_loaders.alos_loader import AlosDataLoader
+from execution import execution_manager, ExecutorSaturatedError, job_manager
 
 logger = logging.getLogger(__name__)
 
 # Initialize router
 router = APIRouter(prefix="/predict", tags=["prediction"])
 
-# Initialize predictor and model manager
-predictor = TimeSeriesPredictor()
+MODEL_TYPES = ["auto", "fast", "holt_winters", "seasonal_naive", "linear_trend", "arima", "prophet", "lstm"]
+
+# Initialize model manager (predictions run in the execution layer's worker processes)
 model_manager = ModelManager()
+backtester = Backtester()
+
+# Forecast responses, keyed by the source files and saved models they were computed from
+forecast_cache = ForecastCache()
+source_loaders = {"modis": ModisDataLoader(), "merra": MerraDataLoader(), "alos": AlosDataLoader()}
 
 # Pydantic models for API responses
 class PredictionResponse(BaseModel):
@@ -37,10 +53,73 @@ class TrainingResponse(BaseModel):
     message: str
     metadata: Optional[dict] = None
 
+def _forecast_key(endpoint: str, sources: List[str], model: str) -> Tuple:
+    """
+    Build the forecast cache key of a request from the state its forecast depends on.
+    
+    Args:
+        endpoint: Endpoint name
+        sources: Data sources the forecast reads
+        model: Requested model type
+        
+    Returns:
+        Tuple of endpoint, model and, per source, the version of its files and of its saved model
+    """
+    # Models are saved under the requested type ('auto' included), so that pair's version is the one served
+    return (endpoint, model, tuple(
+        (files_version(path for _, path, _ in source_loaders[source].list_files()),
+         (model_manager.get_model_info(source, model) or {}).get('version'))
+        for source in sources
+    ))
+
+async def _cached_forecast(endpoint: str, sources: List[str], model: str, steps: int,
+                           func: Callable[..., Dict[str, Any]], *args) -> Tuple[Dict[str, Any], str, str]:
+    """
+    Serve a forecast through the forecast cache, computing it in a worker process on a miss.
+    
+    Args:
+        endpoint: Endpoint name
+        sources: Data sources the forecast reads
+        model: Requested model type
+        steps: Number of prediction steps
+        func: Worker entry point, called with *args and the number of steps
+        
+    Returns:
+        Tuple of (forecast result, ETag, cache status)
+    """
+    return await forecast_cache.get_or_compute(
+        lambda: execution_manager.run_io(_forecast_key, endpoint, sources, model),
+        steps,
+        lambda n: execution_manager.run_cpu(func, *args, n)
+    )
+
+def _forecast_response(result: Dict[str, Any], etag: str, status: str, if_none_match: Optional[str],
+                       response: Response):
+    """
+    Answer a conditional request with 304 Not Modified, or attach the cache headers to the response.
+    
+    Args:
+        result: Successful forecast result
+        etag: ETag of the result
+        status: Cache status ('hit', 'coalesced' or 'miss')
+        if_none_match: If-None-Match request header
+        response: Response whose headers are set
+        
+    Returns:
+        Response with status 304, or the PredictionResponse
+    """
+    headers = {"ETag": etag, "X-Forecast-Cache": status}
+    if if_none_match and any(tag.strip() in ("*", etag, f"W/{etag}") for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return PredictionResponse(**result)
+
 @router.get("/modis", response_model=PredictionResponse)
 async def predict_modis(
-    model: str = Query("auto", description="Model type: auto, arima, prophet, lstm"),
-    steps: int = Query(5, description="Number of prediction steps", ge=1, le=30)
+    response: Response,
+    model: str = Query("auto", description="Model type: auto, fast, holt_winters, seasonal_naive, linear_trend, arima, prophet, lstm"),
+    steps: int = Query(5, description="Number of prediction steps", ge=1, le=30),
+    if_none_match: Optional[str] = Header(None)
 ):
     """
     Predict vegetation index trends from MODIS data.
@@ -58,21 +137,26 @@ async def predict_modis(
     try:
         logger.info(f"Generating MODIS predictions with {model} model for {steps} steps")
         
-        result = predictor.predict_data_source("modis", model, steps)
+        result, etag, status = await _cached_forecast("modis", ["modis"], model, steps,
+                                                      run_source_prediction, "modis", model)
         
         if result["success"]:
-            return PredictionResponse(**result)
+            return _forecast_response(result, etag, status, if_none_match, response)
         else:
             raise HTTPException(status_code=500, detail=result.get("error", "Prediction failed"))
             
+    except ExecutorSaturatedError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         logger.error(f"Error in MODIS prediction: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error generating MODIS predictions: {str(e)}")
 
 @router.get("/merra", response_model=PredictionResponse)
 async def predict_merra(
-    model: str = Query("auto", description="Model type: auto, arima, prophet, lstm"),
-    steps: int = Query(5, description="Number of prediction steps", ge=1, le=30)
+    response: Response,
+    model: str = Query("auto", description="Model type: auto, fast, holt_winters, seasonal_naive, linear_trend, arima, prophet, lstm"),
+    steps: int = Query(5, description="Number of prediction steps", ge=1, le=30),
+    if_none_match: Optional[str] = Header(None)
 ):
     """
     Predict climate variables from MERRA-2 data.
@@ -90,21 +174,26 @@ async def predict_merra(
     try:
         logger.info(f"Generating MERRA-2 predictions with {model} model for {steps} steps")
         
-        result = predictor.predict_data_source("merra", model, steps)
+        result, etag, status = await _cached_forecast("merra", ["merra"], model, steps,
+                                                      run_source_prediction, "merra", model)
         
         if result["success"]:
-            return PredictionResponse(**result)
+            return _forecast_response(result, etag, status, if_none_match, response)
         else:
             raise HTTPException(status_code=500, detail=result.get("error", "Prediction failed"))
             
+    except ExecutorSaturatedError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         logger.error(f"Error in MERRA-2 prediction: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error generating MERRA-2 predictions: {str(e)}")
 
 @router.get("/alos", response_model=PredictionResponse)
 async def predict_alos(
-    model: str = Query("auto", description="Model type: auto, arima, prophet, lstm"),
-    steps: int = Query(5, description="Number of prediction steps", ge=1, le=30)
+    response: Response,
+    model: str = Query("auto", description="Model type: auto, fast, holt_winters, seasonal_naive, linear_trend, arima, prophet, lstm"),
+    steps: int = Query(5, description="Number of prediction steps", ge=1, le=30),
+    if_none_match: Optional[str] = Header(None)
 ):
     """
     Predict terrain changes from ALOS PALSAR data.
@@ -122,21 +211,26 @@ async def predict_alos(
     try:
         logger.info(f"Generating ALOS PALSAR predictions with {model} model for {steps} steps")
         
-        result = predictor.predict_data_source("alos", model, steps)
+        result, etag, status = await _cached_forecast("alos", ["alos"], model, steps,
+                                                      run_source_prediction, "alos", model)
         
         if result["success"]:
-            return PredictionResponse(**result)
+            return _forecast_response(result, etag, status, if_none_match, response)
         else:
             raise HTTPException(status_code=500, detail=result.get("error", "Prediction failed"))
             
+    except ExecutorSaturatedError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         logger.error(f"Error in ALOS PALSAR prediction: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error generating ALOS PALSAR predictions: {str(e)}")
 
 @router.get("/all", response_model=PredictionResponse)
 async def predict_all(
-    model: str = Query("auto", description="Model type: auto, arima, prophet, lstm"),
-    steps: int = Query(5, description="Number of prediction steps", ge=1, le=30)
+    response: Response,
+    model: str = Query("auto", description="Model type: auto, fast, holt_winters, seasonal_naive, linear_trend, arima, prophet, lstm"),
+    steps: int = Query(5, description="Number of prediction steps", ge=1, le=30),
+    if_none_match: Optional[str] = Header(None)
 ):
     """
     Generate combined predictions from all data sources.
@@ -154,66 +248,161 @@ async def predict_all(
     try:
         logger.info(f"Generating multi-source predictions with {model} model for {steps} steps")
         
-        result = predictor.predict_all_sources(model, steps)
+        result, etag, status = await _cached_forecast("all", list(source_loaders), model, steps,
+                                                      run_all_predictions, model)
         
         if result["success"]:
-            return PredictionResponse(**result)
+            return _forecast_response(result, etag, status, if_none_match, response)
         else:
             raise HTTPException(status_code=500, detail=result.get("error", "Multi-source prediction failed"))
             
+    except ExecutorSaturatedError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         logger.error(f"Error in multi-source prediction: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error generating multi-source predictions: {str(e)}")
 
+@router.get("/batch", response_model=PredictionResponse)
+async def predict_batch(
+    sources: str = Query("modis,merra,alos", description="Comma-separated data sources"),
+    metrics: Optional[str] = Query(None, description="Comma-separated metrics to forecast (default: all)"),
+    model: str = Query("auto", description="Model type: auto, fast, holt_winters, seasonal_naive, linear_trend, arima, prophet, lstm"),
+    steps: int = Query(5, description="Number of prediction steps", ge=1, le=30)
+):
+    """
+    Forecast every (source, metric) series of the selected sources in one call.
+    
+    Unlike the per-source endpoints, which fit one model to all metrics of a
+    source, each metric (NDVI, EVI, every MERRA-2 variable, every ALOS band)
+    is forecast as its own series. The series of each source are split into
+    chunks that run in parallel on the process pool; with LSTM each source's
+    series share one model and are forecast as a single batch.
+    
+    Args:
+        sources: Data sources to forecast
+        metrics: Metrics to forecast, or all
+        model: Model type to use for prediction
+        steps: Number of future steps to predict
+        
+    Returns:
+        PredictionResponse with one forecast per series and the per-series errors
+    """
+    try:
+        source_list = [s.strip() for s in sources.split(",") if s.strip()]
+        if not source_list or any(s not in ["modis", "merra", "alos"] for s in source_list):
+            raise HTTPException(status_code=400, detail="Invalid sources. Must be a subset of: modis, merra, alos")
+        metric_filter = {m.strip() for m in metrics.split(",") if m.strip()} if metrics else None
+        
+        logger.info(f"Generating batch forecasts for {source_list} with {model} model for {steps} steps")
+        
+        listings = await asyncio.gather(*(execution_manager.run_cpu(run_list_series, s) for s in source_list))
+        
+        # One chunk per worker and source; LSTM keeps a source's series together for the shared batch
+        workers = max(1, execution_manager.cpu_workers)
+        chunks = []
+        for source, listing in zip(source_list, listings):
+            source_metrics = [entry["metric"] for entry in listing
+                              if metric_filter is None or entry["metric"] in metric_filter]
+            if not source_metrics:
+                continue
+            size = len(source_metrics) if model == "lstm" else math.ceil(len(source_metrics) / workers)
+            chunks.extend((source, source_metrics[i:i + size]) for i in range(0, len(source_metrics), size))
+        
+        results = await asyncio.gather(*(
+            execution_manager.run_cpu(run_series_forecast, source, model, steps, chunk) for source, chunk in chunks
+        ))
+        
+        series, errors = [], []
+        for (source, chunk), result in zip(chunks, results):
+            if result["success"] and result["data"]:
+                series.extend(result["data"]["series"])
+                errors.extend(result["data"]["errors"])
+            else:
+                errors.extend({"source": source, "metric": metric, "error": result.get("error")} for metric in chunk)
+        
+        return PredictionResponse(
+            success=bool(series) or not errors,
+            data={"series": series, "errors": errors},
+            metadata={
+                "sources": source_list,
+                "model_requested": model,
+                "steps": steps,
+                "series_count": len(series),
+                "failed_series": len(errors),
+                "chunks": len(chunks)
+            },
+            message=f"{steps}-step forecasts generated for {len(series)} series"
+        )
+        
+    except HTTPException:
+        raise
+    except ExecutorSaturatedError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error in batch prediction: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error generating batch predictions: {str(e)}")
+
 @router.post("/train", response_model=TrainingResponse)
 async def train_model(
-    dataset: str = Query(..., description="Dataset to train: modis, merra, alos"),
-    model: str = Query("auto", description="Model type: auto, arima, prophet, lstm")
+    dataset: str = Query(..., description="Dataset to train: modis, merra, alos, all"),
+    model: str = Query("auto", description="Model type: auto, fast, holt_winters, seasonal_naive, linear_trend, arima, prophet, lstm, all"),
+    wait: bool = Query(False, description="Wait for training to finish instead of returning a job id")
 ):
     """
-    Train and save a new model for the specified dataset.
+    Queue training of new model versions for the specified dataset(s).
     
-    Forces retraining of the specified model type for the given dataset
-    and saves the trained model for future use.
+    Each (dataset, model) pair is fitted in the process pool, scored on a
+    holdout of the most recent samples and persisted through the
+    ModelManager. The endpoint returns a job id at once; poll
+    GET /predict/jobs/{job_id} for progress and results. Submitting the same
+    request while it is still queued or running returns the existing job.
     
     Args:
-        dataset: Dataset to train on (modis, merra, alos)
-        model: Model type to train
+        dataset: Dataset to train on (modis, merra, alos, or all)
+        model: Model type to train (or all for fast, arima, prophet and lstm)
+        wait: Block until the job has finished
         
     Returns:
-        TrainingResponse with training results
+        TrainingResponse with the job status
     """
     try:
         logger.info(f"Training {model} model for {dataset} dataset")
         
         # Validate dataset
-        if dataset not in ["modis", "merra", "alos"]:
-            raise HTTPException(status_code=400, detail="Invalid dataset. Must be: modis, merra, alos")
+        if dataset not in ["modis", "merra", "alos", "all"]:
+            raise HTTPException(status_code=400, detail="Invalid dataset. Must be: modis, merra, alos, all")
         
         # Validate model type
-        if model not in ["auto", "arima", "prophet", "lstm"]:
-            raise HTTPException(status_code=400, detail="Invalid model type. Must be: auto, arima, prophet, lstm")
+        if model not in MODEL_TYPES + ["all"]:
+            raise HTTPException(status_code=400, detail=f"Invalid model type. Must be: {', '.join(MODEL_TYPES)}, all")
         
-        # Generate predictions to train the model
-        result = predictor.predict_data_source(dataset, model, steps=5)
+        datasets = ["modis", "merra", "alos"] if dataset == "all" else [dataset]
+        models = ["fast", "arima", "prophet", "lstm"] if model == "all" else [model]
+        job, deduplicated = job_manager.submit("train", run_training, [(d, m) for d in datasets for m in models])
         
-        if result["success"]:
-            # Extract training metadata
-            metadata = result.get("metadata", {})
-            
-            return TrainingResponse(
-                success=True,
-                message=f"Model retrained and saved successfully for {dataset} using {model}",
-                metadata={
-                    "dataset": dataset.upper(),
-                    "model_used": model,
-                    "training_samples": metadata.get("training_samples", 0),
-                    "last_updated": "2025-10-04",
-                    "confidence": metadata.get("confidence", 0.8)
-                }
-            )
+        if wait:
+            await job.done.wait()
+        job_info = job.to_dict()
+        
+        if job.done.is_set():
+            message = (f"Training job {job.status}: {job.completed_items} model(s) trained and saved, "
+                       f"{job.failed_items} failed")
+        elif deduplicated:
+            message = "An identical training job is already in progress"
         else:
-            raise HTTPException(status_code=500, detail=f"Training failed: {result.get('error', 'Unknown error')}")
+            message = "Training job queued"
+        
+        return TrainingResponse(
+            success=job.status != "failed",
+            message=message,
+            metadata={
+                **job_info,
+                "dataset": dataset.upper(),
+                "model_requested": model,
+                "deduplicated": deduplicated,
+                "status_url": f"/predict/jobs/{job.id}"
+            }
+        )
             
     except HTTPException:
         raise
@@ -221,25 +410,151 @@ async def train_model(
         logger.error(f"Error training model: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error training model: {str(e)}")
 
+@router.post("/backtest", response_model=TrainingResponse)
+async def backtest_models(
+    dataset: str = Query(..., description="Dataset to backtest: modis, merra, alos, all"),
+    models: Optional[str] = Query(None, description="Comma-separated model types (default: every installed type)"),
+    horizon: int = Query(5, description="Steps forecast from each origin", ge=1, le=30),
+    folds: int = Query(5, description="Maximum number of forecast origins", ge=1, le=20),
+    wait: bool = Query(False, description="Wait for the backtest to finish instead of returning a job id")
+):
+    """
+    Queue rolling-origin backtests of model types on the specified dataset(s).
+    
+    Each (dataset, model) pair runs as one job item on the process pool, so
+    model types are evaluated in parallel. Results record MAE, RMSE and sMAPE
+    with fit/predict time and peak memory; once stored, 'auto' model
+    selection uses them for that dataset.
+    
+    Args:
+        dataset: Dataset to backtest (modis, merra, alos, or all)
+        models: Model types to compare
+        horizon: Steps forecast from each origin
+        folds: Maximum number of forecast origins
+        wait: Block until the job has finished
+        
+    Returns:
+        TrainingResponse with the job status
+    """
+    if dataset not in ["modis", "merra", "alos", "all"]:
+        raise HTTPException(status_code=400, detail="Invalid dataset. Must be: modis, merra, alos, all")
+    
+    if models:
+        model_list = [m.strip() for m in models.split(",") if m.strip()]
+        invalid = [m for m in model_list if m not in MODEL_TYPES or m == "auto"]
+        if invalid:
+            raise HTTPException(status_code=400, detail=f"Invalid model types: {', '.join(invalid)}")
+    else:
+        model_list = ["holt_winters", "seasonal_naive", "linear_trend"]
+        model_list += [m for m, available in (("arima", ARIMA_AVAILABLE), ("prophet", PROPHET_AVAILABLE),
+                                              ("lstm", LSTM_AVAILABLE)) if available]
+    
+    datasets = ["modis", "merra", "alos"] if dataset == "all" else [dataset]
+    job, deduplicated = job_manager.submit("backtest", run_backtest,
+                                           [(d, m, horizon, folds) for d in datasets for m in model_list])
+    if wait:
+        await job.done.wait()
+    
+    return TrainingResponse(
+        success=job.status != "failed",
+        message=f"Backtest job {job.status}",
+        metadata={
+            **job.to_dict(),
+            "dataset": dataset.upper(),
+            "models": model_list,
+            "deduplicated": deduplicated,
+            "status_url": f"/predict/jobs/{job.id}",
+            "report_urls": [f"/predict/backtest/{d}" for d in datasets]
+        }
+    )
+
+@router.get("/backtest/{dataset}", response_model=dict)
+async def get_backtest_report(dataset: str):
+    """
+    Get the benchmark report of a dataset's stored backtest results.
+    
+    Args:
+        dataset: Dataset name (modis, merra, alos)
+        
+    Returns:
+        Dict with per-model accuracy, timing and memory and the recommended model
+    """
+    if dataset not in ["modis", "merra", "alos"]:
+        raise HTTPException(status_code=400, detail="Invalid dataset. Must be: modis, merra, alos")
+    report = await execution_manager.run_io(backtester.write_report, dataset)
+    if report is None:
+        raise HTTPException(status_code=404, detail=f"No backtest results for {dataset}")
+    return {"success": True, **report}
+
+@router.get("/jobs", response_model=dict)
+async def list_jobs():
+    """
+    List background jobs, newest first.
+    
+    Returns:
+        Dict containing job summaries and counts
+    """
+    return {
+        "success": True,
+        "jobs": job_manager.list_jobs(),
+        "statistics": job_manager.get_stats()
+    }
+
+@router.get("/jobs/{job_id}", response_model=dict)
+async def get_job(job_id: str):
+    """
+    Get the status of a background job.
+    
+    The status is 'queued', 'running', 'completed' (every item succeeded),
+    'partial' (some items failed; see progress.failed and the per-item
+    results) or 'failed' (no item succeeded).
+    
+    Args:
+        job_id: Id returned by POST /predict/train or /predict/backtest
+        
+    Returns:
+        Dict with status, progress, elapsed time and per-item results
+    """
+    job = job_manager.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return {"success": True, **job.to_dict()}
+
 @router.get("/models", response_model=dict)
 async def list_models():
     """
     List all saved models and their metadata.
     
     Returns information about all trained models including
-    their training dates, sample counts, and file sizes.
+    their training dates, sample counts, and file sizes, and the
+    in-memory model registry counters of the worker processes that
+    answered (not necessarily every worker in the pool).
     
     Returns:
         Dict containing model information
     """
     try:
-        models_info = model_manager.list_models()
-        stats = model_manager.get_model_stats()
+        models_info = await execution_manager.run_io(model_manager.list_models)
+        stats = await execution_manager.run_io(model_manager.get_model_stats)
+        
+        # One call per worker, but the pool may hand several to the same worker, so this is a
+        # sample of the workers keyed by pid rather than a pool-wide total
+        workers = max(1, execution_manager.cpu_workers)
+        registries = {}
+        for worker_stats in await asyncio.gather(*(execution_manager.run_cpu(run_registry_stats) for _ in range(workers)),
+                                                 return_exceptions=True):
+            if isinstance(worker_stats, dict):
+                registries[worker_stats.pop("pid")] = worker_stats
         
         return {
             "success": True,
             "models": models_info,
             "statistics": stats,
+            "registry": {
+                "sampled_workers": registries,
+                "pool_workers": workers,
+                "complete": len(registries) >= workers
+            },
             "message": "Model information retrieved successfully"
         }
         
@@ -260,9 +575,11 @@ async def delete_model(dataset: str, model_type: str):
         Dict with deletion status
     """
     try:
-        success = model_manager.delete_model(dataset, model_type)
+        success = await execution_manager.run_io(model_manager.delete_model, dataset, model_type)
         
         if success:
+            # Forecasts served by the deleted model must not outlive it
+            forecast_cache.invalidate()
             return {
                 "success": True,
                 "message": f"Model {dataset}_{model_type} deleted successfully"
@@ -0,0 +1,333 @@
+"""
+Lightweight statistical forecasters for BloomTracker.
+
+This module implements Holt-Winters exponential smoothing, seasonal naive and
+linear trend forecasts with NumPy/SciPy only. Fits are closed-form or take a
+few dozen optimizer iterations, and prediction intervals are analytic, so
+short series are forecast in a few milliseconds without statsmodels,
+Prophet or TensorFlow.
+"""
+
+import logging
+from abc import ABC, abstractmethod
+from typing import Dict, Any, Optional, Tuple
+
+import numpy as np
+from scipy import optimize, stats
+
+logger = logging.getLogger(__name__)
+
+FAST_MODEL_TYPES = ("fast", "holt_winters", "seasonal_naive", "linear_trend")
+
+
+def detect_season_length(values: np.ndarray, min_lag: int = 2, max_lag: Optional[int] = None,
+                         threshold: float = 0.3) -> Optional[int]:
+    """
+    Detect a season length from the autocorrelation of the detrended series.
+
+    Args:
+        values (np.ndarray): Series values
+        min_lag (int): Shortest season considered
+        max_lag (int): Longest season considered (default: half the series)
+        threshold (float): Minimum autocorrelation at the peak
+
+    Returns:
+        int: Lag of the strongest autocorrelation peak, or None if there is no clear season
+    """
+    n = len(values)
+    max_lag = min(max_lag or n // 2, n // 2)
+    if max_lag < min_lag:
+        return None
+
+    t = np.arange(n)
+    x = values - np.polyval(np.polyfit(t, values, 1), t)
+    denominator = float(x @ x)
+    if denominator <= 0:
+        return None
+
+    acf = np.array([x[:-lag] @ x[lag:] for lag in range(1, max_lag + 2)]) / denominator
+    best_lag, best_value = None, threshold
+    for lag in range(min_lag, max_lag + 1):
+        value = acf[lag - 1]
+        if value >= best_value and value >= acf[lag - 2] and value >= acf[lag]:
+            best_lag, best_value = lag, value
+    return best_lag
+
+
+class StatisticalForecaster(ABC):
+    """Base class: fit() on a 1-D array, then forecast() means with analytic intervals."""
+
+    name = "statistical"
+
+    def __init__(self):
+        self.n_samples = 0
+        self.n_params = 0
+        self.sse = np.nan
+        self.residual_count = 0
+
+    @property
+    def sigma2(self) -> float:
+        """Residual variance of the one-step-ahead errors."""
+        return self.sse / max(1, self.residual_count - self.n_params)
+
+    @property
+    def score(self) -> float:
+        """AIC per residual, comparable between models fitted on different numbers of residuals."""
+        if self.residual_count <= 0 or not np.isfinite(self.sse):
+            return np.inf
+        mse = max(self.sse / self.residual_count, 1e-12)
+        return float(np.log(mse) + 2 * self.n_params / self.residual_count)
+
+    @property
+    def label(self) -> str:
+        """Human-readable model description."""
+        return self.name
+
+    @abstractmethod
+    def fit(self, values: np.ndarray) -> "StatisticalForecaster":
+        """
+        Fit the model and record its residual statistics (sse, residual_count, n_params).
+
+        Args:
+            values (np.ndarray): Series values
+
+        Returns:
+            StatisticalForecaster: self, for chaining
+
+        Raises:
+            ValueError: If the series is too short for the model
+        """
+
+    def forecast(self, steps: int, alpha: float = 0.05) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Forecast future values.
+
+        Args:
+            steps (int): Number of steps to forecast
+            alpha (float): Significance level of the prediction interval
+
+        Returns:
+            Tuple of (mean, lower, upper) arrays
+        """
+        mean, variance = self._forecast_moments(steps)
+        half_width = stats.norm.ppf(1 - alpha / 2) * np.sqrt(np.maximum(variance, 0.0))
+        return mean, mean - half_width, mean + half_width
+
+    @abstractmethod
+    def _forecast_moments(self, steps: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Compute the forecast mean and variance of the fitted model.
+
+        Args:
+            steps (int): Number of steps to forecast
+
+        Returns:
+            Tuple of (mean, variance) arrays
+        """
+
+
+class LinearTrendForecaster(StatisticalForecaster):
+    """Ordinary least-squares line through time, with exact OLS prediction intervals."""
+
+    name = "linear_trend"
+
+    def fit(self, values: np.ndarray) -> "LinearTrendForecaster":
+        n = len(values)
+        if n < 3:
+            raise ValueError("Linear trend needs at least 3 samples")
+        t = np.arange(n, dtype=float)
+        self.t_mean = t.mean()
+        self.sxx = float(((t - self.t_mean) ** 2).sum())
+        self.slope = float(((t - self.t_mean) * (values - values.mean())).sum() / self.sxx)
+        self.intercept = float(values.mean() - self.slope * self.t_mean)
+
+        residuals = values - (self.intercept + self.slope * t)
+        self.n_samples = n
+        self.n_params = 2
+        self.sse = float(residuals @ residuals)
+        self.residual_count = n
+        return self
+
+    def _forecast_moments(self, steps: int) -> Tuple[np.ndarray, np.ndarray]:
+        t = np.arange(self.n_samples, self.n_samples + steps, dtype=float)
+        mean = self.intercept + self.slope * t
+        variance = self.sigma2 * (1 + 1 / self.n_samples + (t - self.t_mean) ** 2 / self.sxx)
+        return mean, variance
+
+    def forecast(self, steps: int, alpha: float = 0.05) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # The OLS interval uses Student's t rather than the normal quantile
+        mean, variance = self._forecast_moments(steps)
+        half_width = stats.t.ppf(1 - alpha / 2, df=max(1, self.n_samples - 2)) * np.sqrt(variance)
+        return mean, mean - half_width, mean + half_width
+
+    @property
+    def label(self) -> str:
+        return f"LinearTrend(slope={self.slope:.4g})"
+
+
+class SeasonalNaiveForecaster(StatisticalForecaster):
+    """Repeat the last observed season (the last value when there is no season)."""
+
+    name = "seasonal_naive"
+
+    def __init__(self, season_length: Optional[int] = None):
+        super().__init__()
+        self.season_length = season_length
+
+    def fit(self, values: np.ndarray) -> "SeasonalNaiveForecaster":
+        m = self.season_length or 1
+        if len(values) <= m:
+            raise ValueError(f"Seasonal naive needs more than {m} samples")
+        residuals = values[m:] - values[:-m]
+        self.m = m
+        self.last_season = values[-m:].copy()
+        self.n_samples = len(values)
+        self.n_params = 0
+        self.sse = float(residuals @ residuals)
+        self.residual_count = len(residuals)
+        return self
+
+    def _forecast_moments(self, steps: int) -> Tuple[np.ndarray, np.ndarray]:
+        h = np.arange(1, steps + 1)
+        mean = self.last_season[(h - 1) % self.m]
+        variance = self.sigma2 * ((h - 1) // self.m + 1)
+        return mean, variance
+
+    @property
+    def label(self) -> str:
+        return f"SeasonalNaive(m={self.m})" if self.m > 1 else "Naive"
+
+
+class HoltWintersForecaster(StatisticalForecaster):
+    """
+    Additive Holt-Winters smoothing in error-correction (ETS A,A,A / A,A,N) form.
+
+    Smoothing parameters minimise the one-step-ahead SSE with a bounded
+    L-BFGS-B search of at most maxiter iterations. Prediction intervals use
+    the closed-form ETS variance.
+    """
+
+    name = "holt_winters"
+
+    def __init__(self, season_length: Optional[int] = None, maxiter: int = 50):
+        super().__init__()
+        self.season_length = season_length
+        self.maxiter = maxiter
+
+    def _initial_states(self, values: np.ndarray) -> Tuple[float, float, np.ndarray]:
+        m = self.m
+        if m > 1:
+            first, second = values[:m].mean(), values[m:2 * m].mean()
+            return first, (second - first) / m, values[:m] - first
+        return values[0], values[1] - values[0], np.zeros(1)
+
+    def _smooth(self, values: np.ndarray, alpha: float, beta: float, gamma: float):
+        """Run the filter; returns (sse, level, trend, seasonals)."""
+        level, trend, seasonals = self._initial_states(values)
+        seasonals = seasonals.copy()
+        m = len(seasonals)
+        sse = 0.0
+        for t, y in enumerate(values):
+            season = seasonals[t % m]
+            error = y - (level + trend + season)
+            sse += error * error
+            level = level + trend + alpha * error
+            trend = trend + beta * error
+            seasonals[t % m] = season + gamma * error
+        return sse, level, trend, seasonals
+
+    def _parameters(self, x: np.ndarray) -> Tuple[float, float, float]:
+        # beta <= alpha and gamma <= 1 - alpha keep the model forecastable
+        alpha = x[0]
+        beta = alpha * x[1]
+        gamma = (1 - alpha) * x[2] if self.m > 1 else 0.0
+        return alpha, beta, gamma
+
+    def fit(self, values: np.ndarray) -> "HoltWintersForecaster":
+        m = self.season_length or 1
+        if m > 1 and len(values) < 2 * m:
+            raise ValueError(f"Seasonal Holt-Winters needs at least {2 * m} samples")
+        if len(values) < 4:
+            raise ValueError("Holt-Winters needs at least 4 samples")
+        self.m = m
+
+        n_smoothing = 3 if m > 1 else 2
+        result = optimize.minimize(
+            lambda x: self._smooth(values, *self._parameters(x))[0],
+            x0=np.array([0.3, 0.1, 0.1][:n_smoothing]),
+            bounds=[(1e-4, 1 - 1e-4)] * n_smoothing,
+            method="L-BFGS-B",
+            options={"maxiter": self.maxiter}
+        )
+        x = result.x if n_smoothing == 3 else np.append(result.x, 0.0)
+        self.alpha, self.beta, self.gamma = self._parameters(x)
+        self.sse, self.level, self.trend, self.seasonals = self._smooth(values, self.alpha, self.beta, self.gamma)
+        self.n_samples = len(values)
+        self.n_params = n_smoothing + 2 + (m if m > 1 else 0)
+        self.residual_count = len(values)
+        return self
+
+    def _forecast_moments(self, steps: int) -> Tuple[np.ndarray, np.ndarray]:
+        h = np.arange(1, steps + 1)
+        mean = self.level + h * self.trend + self.seasonals[(self.n_samples + h - 1) % len(self.seasonals)]
+
+        alpha, beta, gamma, m = self.alpha, self.beta, self.gamma, self.m
+        variance = 1 + (h - 1) * (alpha ** 2 + alpha * beta * h + beta ** 2 * h * (2 * h - 1) / 6)
+        if m > 1:
+            k = (h - 1) // m
+            variance = variance + gamma * k * (2 * alpha + gamma + beta * m * (k + 1))
+        return mean, self.sigma2 * variance
+
+    @property
+    def label(self) -> str:
+        season = f", m={self.m}" if self.m > 1 else ""
+        return f"HoltWinters(alpha={self.alpha:.3g}, beta={self.beta:.3g}{season})"
+
+
+def fit_fast_model(model_type: str, values: np.ndarray,
+                   season_length: Optional[int] = None) -> Tuple[StatisticalForecaster, Dict[str, Any]]:
+    """
+    Fit a statistical forecaster, or for 'fast' the best of all three by score.
+
+    Args:
+        model_type (str): 'fast', 'holt_winters', 'seasonal_naive' or 'linear_trend'
+        values (np.ndarray): Series values
+        season_length (int): Season length, or None to detect it
+
+    Returns:
+        Tuple of (fitted forecaster, score per candidate)
+
+    Raises:
+        ValueError: If no candidate could be fitted
+    """
+    values = np.asarray(values, dtype=float)
+    if season_length is None:
+        season_length = detect_season_length(values)
+
+    candidates = {
+        # Non-seasonal variants are the fallback when the series is too short for the season
+        "holt_winters": [HoltWintersForecaster(season_length), HoltWintersForecaster(None)],
+        "seasonal_naive": [SeasonalNaiveForecaster(season_length), SeasonalNaiveForecaster(None)],
+        "linear_trend": [LinearTrendForecaster()]
+    }
+    if model_type != "fast":
+        candidates = {model_type: candidates[model_type]}
+
+    fitted, scores = [], {}
+    for name, variants in candidates.items():
+        forecaster = None
+        for variant in variants:
+            try:
+                forecaster = variant.fit(values)
+                break
+            except ValueError as e:
+                logger.debug(f"Skipping {variant.name}: {str(e)}")
+        if forecaster is None:
+            scores[name] = None
+            continue
+        fitted.append(forecaster)
+        scores[name] = round(forecaster.score, 6) if np.isfinite(forecaster.score) else None
+
+    if not fitted:
+        raise ValueError(f"Could not fit {model_type} model on {len(values)} samples")
+    return min(fitted, key=lambda f: f.score), {"season_length": season_length, "scores": scores}
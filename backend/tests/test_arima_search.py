@@ -0,0 +1,48 @@
+"""Tests for the stepwise ARIMA search's time budget and worker defaults."""
+
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("statsmodels")
+
+from execution import executor
+from prediction.arima_search import StepwiseArimaSearch, fit_candidate, default_search_workers
+
+
+@pytest.fixture
+def series():
+    return pd.Series(np.random.default_rng(0).normal(size=3000).cumsum())
+
+
+def test_fit_stops_at_deadline(series):
+    started = time.perf_counter()
+    result = fit_candidate(series, (3, 1, 3), True, maxiter=500, deadline=time.time() + 0.05)
+    assert result["aic"] is None
+    assert "time budget" in result["error"]
+    assert time.perf_counter() - started < 2
+
+
+def test_fit_after_deadline_does_not_start(series):
+    result = fit_candidate(series, (1, 1, 1), True, deadline=time.time() - 1)
+    assert result["error"] and result["fit_seconds"] < 0.05
+
+
+def test_search_without_budget_fails_fast(series):
+    started = time.perf_counter()
+    with pytest.raises(ValueError, match="No ARIMA candidate"):
+        StepwiseArimaSearch(max_workers=1, fit_timeout=0).search(series)
+    assert time.perf_counter() - started < 5
+
+
+def test_default_workers_capped_inside_pool_worker(monkeypatch):
+    monkeypatch.setenv("ARIMA_SEARCH_WORKERS", "4")
+    monkeypatch.setattr(executor, "_worker_cpu_budget", None)
+    assert default_search_workers() == 4
+    monkeypatch.setattr(executor, "_worker_cpu_budget", 1)
+    assert default_search_workers() == 1
+    assert StepwiseArimaSearch().max_workers == 1
+    monkeypatch.setattr(executor, "_worker_cpu_budget", 2)
+    assert default_search_workers() == 2
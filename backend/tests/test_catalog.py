@@ -0,0 +1,121 @@
+"""Tests for incremental refreshes of the data catalog."""
+
+import os
+
+import pytest
+
+from data_loaders.cache import FileResultCache
+from data_loaders.catalog import DataCatalog
+
+
+class TextLoader:
+    """Minimal catalog loader: every *.txt file is one entry whose result is its content."""
+
+    def __init__(self, data_dir):
+        self.data_dir = data_dir
+        self.cache = FileResultCache("text", cache_dir=None)
+        self.variant = "v1"
+        self.failing = set()
+        self.processed = []
+
+    def list_files(self, mode=None):
+        variant = mode or self.variant
+        return [("txt", path, variant) for path in sorted(self.data_dir.glob("*.txt"))]
+
+    def process_files(self, files):
+        results = []
+        for _, path, variant in files:
+            self.processed.append(path.name)
+            if path.name in self.failing:
+                results.append(OSError(f"cannot read {path.name}"))
+            else:
+                results.append({"name": path.name, "variant": variant, "text": path.read_text()})
+        return results
+
+    def failure_result(self, kind, path, error):
+        return {"name": path.name, "error": error}
+
+    def build_response(self, entries, mode=None):
+        return {"files": [result for _, result in entries]}
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    directory = tmp_path / "data"
+    directory.mkdir()
+    for name in ("a.txt", "b.txt"):
+        (directory / name).write_text(name)
+    return directory
+
+
+@pytest.fixture
+def loader(data_dir):
+    return TextLoader(data_dir)
+
+
+def make_catalog(loader, tmp_path, **kwargs):
+    settings = {"min_refresh_interval": 0, "checksums": False, **kwargs}
+    return DataCatalog({"text": loader}, db_path=str(tmp_path / "catalog.sqlite"), **settings)
+
+
+def variants(catalog):
+    return sorted((entry["filename"], entry["variant"]) for entry in catalog.list_entries("text"))
+
+
+def test_only_new_changed_and_removed_files_are_reindexed(loader, data_dir, tmp_path):
+    catalog = make_catalog(loader, tmp_path)
+    assert catalog.refresh("text") == {"added": 2, "updated": 0, "removed": 0, "unchanged": 0}
+    assert catalog.refresh("text") == {"added": 0, "updated": 0, "removed": 0, "unchanged": 2}
+
+    (data_dir / "a.txt").write_text("changed contents")
+    os.utime(data_dir / "a.txt", ns=(0, 1))
+    (data_dir / "b.txt").unlink()
+    (data_dir / "c.txt").write_text("c.txt")
+    loader.processed.clear()
+
+    assert catalog.refresh("text") == {"added": 1, "updated": 1, "removed": 1, "unchanged": 0}
+    assert sorted(loader.processed) == ["a.txt", "c.txt"]
+    assert [result["text"] for result in catalog.load("text")["files"]] == ["changed contents", "c.txt"]
+
+
+def test_failed_files_are_retried_after_the_retry_interval(loader, tmp_path):
+    loader.failing = {"a.txt"}
+    catalog = make_catalog(loader, tmp_path, retry_interval=0)
+    catalog.refresh("text")
+    assert catalog.load("text")["files"][0] == {"name": "a.txt", "error": "cannot read a.txt"}
+    assert catalog.get_stats()["sources"]["text"]["errors"] == 1
+
+    loader.failing = set()
+    assert catalog.refresh("text") == {"added": 0, "updated": 1, "removed": 0, "unchanged": 1}
+    assert catalog.load("text")["files"][0]["text"] == "a.txt"
+    assert catalog.get_stats()["sources"]["text"]["errors"] == 0
+
+
+def test_failed_files_are_not_retried_within_the_retry_interval(loader, tmp_path):
+    loader.failing = {"a.txt"}
+    catalog = make_catalog(loader, tmp_path, retry_interval=3600)
+    catalog.refresh("text")
+
+    loader.failing = set()
+    assert catalog.refresh("text")["unchanged"] == 2
+    assert catalog.refresh("text", force=True)["updated"] == 2
+    assert catalog.get_stats()["sources"]["text"]["errors"] == 0
+
+
+def test_rows_of_stale_variants_are_removed(loader, tmp_path):
+    catalog = make_catalog(loader, tmp_path)
+    catalog.refresh("text")
+
+    loader.variant = "v2"  # e.g. new QA settings
+    assert catalog.refresh("text") == {"added": 2, "updated": 0, "removed": 2, "unchanged": 0}
+    assert variants(catalog) == [("a.txt", "v2"), ("b.txt", "v2")]
+
+
+def test_variants_listed_under_other_options_are_kept(loader, tmp_path):
+    catalog = make_catalog(loader, tmp_path)
+    catalog.refresh("text")
+    catalog.refresh("text", mode="approximate")
+
+    assert catalog.refresh("text")["removed"] == 0
+    assert variants(catalog) == [("a.txt", "approximate"), ("a.txt", "v1"),
+                                 ("b.txt", "approximate"), ("b.txt", "v1")]
@@ -0,0 +1,48 @@
+"""Tests for the process pool's per-worker initialization."""
+
+import asyncio
+import os
+
+import pytest
+
+from execution import ExecutionManager, worker_cpu_budget
+
+_initialized = []
+
+
+def mark_worker(tag: str) -> str:
+    _initialized.append(tag)
+    return tag
+
+
+def worker_state():
+    return os.getpid(), list(_initialized), worker_cpu_budget()
+
+
+def test_every_worker_runs_initializers():
+    manager = ExecutionManager(io_workers=1, cpu_workers=2)
+    manager.add_worker_initializer(mark_worker, "warm")
+
+    async def run():
+        return await asyncio.gather(*(manager.run_cpu(worker_state) for _ in range(8)))
+
+    try:
+        states = asyncio.run(run())
+    finally:
+        manager.shutdown()
+    assert all(initialized == ["warm"] for _, initialized, _ in states)
+    assert all(budget == max(1, (os.cpu_count() or 1) // 2) for _, _, budget in states)
+
+
+def test_initializers_must_precede_pool_start():
+    manager = ExecutionManager(io_workers=1, cpu_workers=1)
+    try:
+        asyncio.run(manager.run_cpu(os.getpid))
+        with pytest.raises(RuntimeError):
+            manager.add_worker_initializer(mark_worker, "late")
+    finally:
+        manager.shutdown()
+
+
+def test_budget_is_unset_outside_the_pool():
+    assert worker_cpu_budget() is None
@@ -0,0 +1,173 @@
+"""Tests for the forecast response cache: slicing, coalescing, ETags and conditional GETs."""
+
+import asyncio
+import importlib
+
+import pandas as pd
+import pytest
+from fastapi import Response
+
+from models.model_manager import ModelManager
+from prediction.forecast_cache import ForecastCache, slice_forecast
+
+
+def forecast(steps: int, success: bool = True):
+    return {
+        "success": success,
+        "message": f"{steps}-step forecast generated successfully using arima model.",
+        "data": {"predicted_values": [float(i) for i in range(steps)],
+                 "timestamps": [f"2026-01-{i + 1:02d}" for i in range(steps)],
+                 "model_used": "arima"}
+    }
+
+
+class Forecaster:
+    """Counts computations; each one waits for release so concurrent requests overlap."""
+
+    def __init__(self, success: bool = True):
+        self.success = success
+        self.calls = []
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self, steps: int):
+        self.calls.append(steps)
+        await self.release.wait()
+        return forecast(steps, self.success)
+
+
+async def constant_key():
+    return ("modis", "arima", (("files-v1", 1),))
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_slice_forecast_cuts_single_and_multi_source_responses():
+    single = slice_forecast(forecast(10), 3)
+    assert single["data"]["predicted_values"] == [0.0, 1.0, 2.0]
+    assert len(single["data"]["timestamps"]) == 3
+    assert single["message"].startswith("3-step")
+
+    combined = slice_forecast({"success": True, "data": {"modis": forecast(10), "merra": forecast(10)}}, 2)
+    assert all(len(source["data"]["predicted_values"]) == 2 for source in combined["data"].values())
+
+
+def test_longer_forecast_answers_shorter_requests_by_slicing():
+    async def scenario():
+        cache, compute = ForecastCache(ttl_seconds=60), Forecaster()
+        long_result, long_etag, long_status = await cache.get_or_compute(constant_key, 10, compute)
+        short_result, short_etag, short_status = await cache.get_or_compute(constant_key, 4, compute)
+        again_result, again_etag, again_status = await cache.get_or_compute(constant_key, 4, compute)
+        longer = await cache.get_or_compute(constant_key, 12, compute)
+        return cache, compute, (long_result, long_etag, long_status), (short_result, short_etag, short_status), \
+            (again_result, again_etag, again_status), longer
+
+    cache, compute, long, short, again, longer = run(scenario())
+
+    assert long[2] == "miss" and short[2] == "hit" and again[2] == "hit"
+    assert short[0]["data"]["predicted_values"] == [0.0, 1.0, 2.0, 3.0]
+    assert short[1] != long[1]
+    assert again[1] == short[1]
+    # A cached 10-step forecast cannot answer 12 steps
+    assert longer[2] == "miss"
+    assert compute.calls == [10, 12]
+    assert cache.stats["sliced_hits"] == 2
+
+
+def test_concurrent_requests_share_one_computation():
+    async def scenario():
+        cache, compute = ForecastCache(ttl_seconds=60), Forecaster()
+        compute.release.clear()
+        requests = [asyncio.ensure_future(cache.get_or_compute(constant_key, steps, compute)) for steps in (8, 8, 5)]
+        await asyncio.sleep(0)
+        compute.release.set()
+        return compute, await asyncio.gather(*requests)
+
+    compute, results = run(scenario())
+
+    assert compute.calls == [8]
+    assert [status for _, _, status in results] == ["miss", "coalesced", "coalesced"]
+    assert results[0][1] == results[1][1]
+    assert len(results[2][0]["data"]["predicted_values"]) == 5
+
+
+def test_failed_forecasts_are_not_cached():
+    async def scenario():
+        cache, compute = ForecastCache(ttl_seconds=60), Forecaster(success=False)
+        first = await cache.get_or_compute(constant_key, 5, compute)
+        second = await cache.get_or_compute(constant_key, 5, compute)
+        return compute, first, second
+
+    compute, first, second = run(scenario())
+    assert compute.calls == [5, 5]
+    assert first[2] == second[2] == "miss"
+
+
+def test_result_is_stored_under_the_key_taken_after_computing():
+    versions = {"model": None}
+
+    async def key():
+        return ("modis", "auto", versions["model"])
+
+    async def train_and_forecast(steps):
+        versions["model"] = 1  # The forecast trained and saved a model
+        return forecast(steps)
+
+    async def scenario():
+        cache = ForecastCache(ttl_seconds=60)
+        await cache.get_or_compute(key, 5, train_and_forecast)
+        return await cache.get_or_compute(key, 5, Forecaster())
+
+    assert run(scenario())[2] == "hit"
+
+
+def test_disabled_cache_always_computes():
+    async def scenario():
+        cache, compute = ForecastCache(ttl_seconds=0), Forecaster()
+        for _ in range(2):
+            await cache.get_or_compute(constant_key, 5, compute)
+        return cache, compute
+
+    cache, compute = run(scenario())
+    assert compute.calls == [5, 5]
+    assert cache.get_stats()["entries"] == 0
+
+
+@pytest.fixture
+def router(tmp_path, monkeypatch):
+    # The router creates its model store relative to the working directory on import
+    monkeypatch.chdir(tmp_path)
+    return importlib.import_module("prediction.router")
+
+
+@pytest.mark.parametrize("if_none_match", ['"abc"', 'W/"abc"', '"other", "abc"', "*"])
+def test_matching_if_none_match_returns_304(router, if_none_match):
+    response = router._forecast_response(forecast(3), '"abc"', "hit", if_none_match, Response())
+    assert response.status_code == 304
+    assert response.headers["ETag"] == '"abc"'
+    assert response.headers["X-Forecast-Cache"] == "hit"
+
+
+@pytest.mark.parametrize("if_none_match", [None, '"other"'])
+def test_other_requests_get_the_forecast_with_cache_headers(router, if_none_match):
+    response = Response()
+    body = router._forecast_response(forecast(3), '"abc"', "miss", if_none_match, response)
+    assert body.data["predicted_values"] == [0.0, 1.0, 2.0]
+    assert response.headers["ETag"] == '"abc"'
+    assert response.headers["X-Forecast-Cache"] == "miss"
+
+
+def test_deleting_a_model_drops_cached_forecasts(router, tmp_path, monkeypatch):
+    manager = ModelManager(models_dir=str(tmp_path / "saved_models"))
+    assert manager.save_model("modis", "auto", {"weights": [1.0]}, pd.DataFrame({"value": [1.0]}), {})
+    monkeypatch.setattr(router, "model_manager", manager)
+    monkeypatch.setattr(router, "forecast_cache", ForecastCache(ttl_seconds=60))
+
+    async def scenario():
+        await router.forecast_cache.get_or_compute(constant_key, 5, Forecaster())
+        await router.delete_model("modis", "auto")
+        return await router.forecast_cache.get_or_compute(constant_key, 5, Forecaster())
+
+    assert run(scenario())[2] == "miss"
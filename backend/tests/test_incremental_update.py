@@ -0,0 +1,75 @@
+"""Tests for warm-start updates of persisted models when observations are appended."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from models.model_manager import ModelManager
+from prediction.backtest import Backtester
+from prediction.predictor import TimeSeriesPredictor
+
+
+def wide_frame(n_dates: int) -> pd.DataFrame:
+    """Two area-mean metrics over n_dates days, as returned by the MERRA-2 cube."""
+    dates = pd.date_range("2021-01-01", periods=30, freq="D", name="date")
+    rng = np.random.default_rng(1)
+    frame = pd.DataFrame({"T2M": 280 + rng.normal(0, 1, 30).cumsum(),
+                          "QV2M": 0.01 + rng.normal(0, 0.001, 30)}, index=dates)
+    return frame.iloc[:n_dates]
+
+
+def metric_major(n_dates: int) -> pd.DataFrame:
+    """Long layout produced by melt(): all dates of one metric, then the next."""
+    long_data = wide_frame(n_dates).reset_index().melt(id_vars="date", var_name="metric", value_name="value")
+    long_data["source"] = "MERRA-2"
+    return long_data
+
+
+def date_major(n_dates: int) -> pd.DataFrame:
+    """Long layout with rows ordered by date."""
+    return metric_major(n_dates).sort_values(["date", "metric"]).reset_index(drop=True)
+
+
+@pytest.fixture
+def predictor(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return TimeSeriesPredictor(model_manager=ModelManager(str(tmp_path / "models")),
+                               backtester=Backtester(str(tmp_path / "backtests")))
+
+
+def test_fingerprint_ignores_row_layout():
+    assert (TimeSeriesPredictor.data_fingerprint(metric_major(10))
+            == TimeSeriesPredictor.data_fingerprint(date_major(10)))
+    assert (TimeSeriesPredictor.data_fingerprint(metric_major(10))
+            != TimeSeriesPredictor.data_fingerprint(metric_major(11)))
+
+
+def test_canonical_prefix_is_previous_series():
+    previous = TimeSeriesPredictor.canonical_order(metric_major(10))
+    current = TimeSeriesPredictor.canonical_order(metric_major(11))
+    assert TimeSeriesPredictor.data_fingerprint(current.iloc[:len(previous)]) == \
+        TimeSeriesPredictor.data_fingerprint(previous)
+    assert (current.iloc[len(previous):]["date"] == pd.Timestamp("2021-01-11")).all()
+
+
+@pytest.mark.parametrize("layout", [metric_major, date_major])
+def test_appended_date_updates_instead_of_refitting(predictor, layout):
+    model, _, status = predictor.get_trained_model("merra", "linear_trend", layout(10))
+    assert status == "trained"
+
+    model, result, status = predictor.get_trained_model("merra", "linear_trend", layout(11))
+    assert status == "updated"
+    assert result["incremental_updates"] == 1
+    assert result["update"]["new_samples"] == 2
+    assert len(model.training_data) == 22
+
+    _, _, status = predictor.get_trained_model("merra", "linear_trend", layout(11))
+    assert status == "memory"
+
+
+def test_changed_history_refits(predictor):
+    predictor.get_trained_model("merra", "linear_trend", metric_major(10))
+    changed = metric_major(11)
+    changed.loc[0, "value"] += 5
+    _, _, status = predictor.get_trained_model("merra", "linear_trend", changed)
+    assert status == "trained"
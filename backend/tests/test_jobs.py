@@ -0,0 +1,52 @@
+"""Tests for background job status reporting."""
+
+import time
+import asyncio
+
+import pytest
+
+from execution import ExecutionManager, JobManager
+
+
+def train(name: str) -> str:
+    if name.startswith("bad"):
+        raise ValueError(f"cannot train {name}")
+    return name
+
+
+@pytest.mark.parametrize("items, status", [
+    ([("a",), ("b",)], "completed"),
+    ([("a",), ("bad",)], "partial"),
+    ([("bad1",), ("bad2",)], "failed"),
+])
+def test_job_status_reflects_failed_items(items, status):
+    async def run():
+        manager = JobManager(executor=ExecutionManager(io_workers=2, cpu_workers=0))
+        job, _ = manager.submit("train", train, items)
+        await job.done.wait()
+        return job.to_dict(), manager.get_stats()
+
+    job, stats = asyncio.run(run())
+    assert job["status"] == status
+    assert job["progress"]["completed"] + job["progress"]["failed"] == len(items)
+    assert stats["jobs"][status] == 1
+
+
+def slow_train(name: str) -> str:
+    time.sleep(0.2)
+    return name
+
+
+def test_job_keeps_its_task_and_shutdown_cancels_it():
+    async def run():
+        manager = JobManager(executor=ExecutionManager(io_workers=2, cpu_workers=0), max_concurrent=1)
+        job, _ = manager.submit("train", slow_train, [("a",), ("b",), ("c",)])
+        await asyncio.sleep(0)
+        task = job.task
+        await manager.shutdown()
+        return job, task
+
+    job, task = asyncio.run(run())
+    assert task.done()
+    assert job.done.is_set()
+    assert job.completed_items + job.failed_items < 3
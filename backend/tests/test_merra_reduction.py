@@ -0,0 +1,69 @@
+"""Tests for MERRA-2 variable reduction when part of a file cannot be read."""
+
+import numpy as np
+import pytest
+import xarray as xr
+
+da = pytest.importorskip("dask.array")
+
+from data_loaders.cache import INCOMPLETE_KEY
+from data_loaders.catalog import DataCatalog
+from data_loaders.merra_loader import MerraDataLoader
+
+
+def unreadable(block):
+    raise OSError("corrupt chunk")
+
+
+def dataset(broken: bool) -> xr.Dataset:
+    values = da.from_array(np.arange(16, dtype=float).reshape(4, 4), chunks=2)
+    bad = da.map_blocks(unreadable, values, dtype=float) if broken else values * 2
+    return xr.Dataset({"GWETTOP": (("lat", "lon"), values), "FRLAND": (("lat", "lon"), bad)})
+
+
+class FlakyMerraLoader(MerraDataLoader):
+    """Loader whose files open as in-memory datasets, with FRLAND unreadable while broken is set."""
+
+    broken = True
+
+    def _open_dataset(self, nc_file):
+        return dataset(self.broken)
+
+
+@pytest.fixture
+def loader(tmp_path):
+    data_dir = tmp_path / "merra"
+    data_dir.mkdir()
+    (data_dir / "MERRA2_const_2d_lnd_Nx.nc").write_bytes(b"placeholder")
+    return FlakyMerraLoader(data_path=str(data_dir), cache_dir=str(tmp_path / "cache"))
+
+
+def test_failing_variable_does_not_drop_the_others(loader):
+    climate, errors = loader._extract_climate_variables(dataset(broken=True))
+    assert set(climate) == {"GWETTOP"}
+    assert climate["GWETTOP"]["mean_value"] == pytest.approx(7.5)
+    assert "corrupt chunk" in errors["FRLAND"]
+
+
+def test_incomplete_file_is_not_cached(loader):
+    first = loader.load_data()
+    assert first["files"][0][INCOMPLETE_KEY]
+    assert set(first["files"][0]["variable_errors"]) == {"FRLAND"}
+    assert loader.cache.get_stats()["memory_entries"] == 0
+
+    loader.broken = False
+    second = loader.load_data()
+    assert set(second["files"][0]["climate_variables"]) == {"GWETTOP", "FRLAND"}
+    assert loader.cache.get_stats()["memory_entries"] == 1
+
+
+def test_catalog_reprocesses_partial_files(loader, tmp_path):
+    catalog = DataCatalog({"merra": loader}, db_path=str(tmp_path / "catalog.sqlite"),
+                          min_refresh_interval=0, checksums=False, retry_interval=0)
+    assert catalog.refresh("merra")["added"] == 1
+    assert catalog.get_stats()["sources"]["merra"]["partial"] == 1
+
+    loader.broken = False
+    assert catalog.refresh("merra")["updated"] == 1
+    assert catalog.get_stats()["sources"]["merra"]["partial"] == 0
+    assert catalog.refresh("merra")["unchanged"] == 1
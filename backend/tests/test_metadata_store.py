@@ -0,0 +1,50 @@
+"""Tests for the SQLite model metadata store."""
+
+from models.metadata_store import ModelMetadataStore
+
+
+def version_info(version: int, file_size: int = 10):
+    return {"version": version, "last_updated": f"2026-01-0{version}T00:00:00", "training_samples": 5,
+            "file_size": file_size, "format": "artifact", "metadata": {}}
+
+
+def save(store: ModelMetadataStore, dataset: str, model_type: str, max_versions: int = 3):
+    version = store.reserve_version(dataset, model_type)
+    return version, store.add_version(dataset, model_type, version_info(version), max_versions)
+
+
+def test_versions_increase_and_old_ones_are_pruned(tmp_path):
+    store = ModelMetadataStore(tmp_path / "models.db")
+    results = [save(store, "modis", "auto", max_versions=2) for _ in range(3)]
+
+    assert [version for version, _ in results] == [1, 2, 3]
+    assert [v["version"] for v in results[2][1]] == [1]
+    info = store.get("modis", "auto")
+    assert info["version"] == 3
+    assert [v["version"] for v in info["versions"]] == [2, 3]
+
+
+def test_versions_are_not_reused_after_delete(tmp_path):
+    store = ModelMetadataStore(tmp_path / "models.db")
+    save(store, "modis", "auto")
+    save(store, "modis", "auto")
+
+    removed = store.delete("modis", "auto")
+
+    assert removed["version"] == 2
+    assert store.get("modis", "auto") is None
+    assert store.all() == []
+    assert store.stats()["total_models"] == 0
+    assert store.delete("modis", "auto") is None
+    assert store.reserve_version("modis", "auto") == 3
+
+
+def test_writes_bump_the_revision(tmp_path):
+    store = ModelMetadataStore(tmp_path / "models.db")
+    start = store.revision()
+    save(store, "merra", "arima")
+    store.delete("merra", "arima")
+
+    assert store.revision() == start + 3
+    # Another connection to the same database sees the committed state
+    assert ModelMetadataStore(tmp_path / "models.db").revision() == store.revision()
@@ -0,0 +1,28 @@
+"""Tests for the streaming raster statistics accumulator."""
+
+import numpy as np
+import pytest
+
+from data_loaders.raster_stats import RunningStats
+
+
+def test_merged_partial_statistics_match_numpy():
+    values = np.random.default_rng(7).normal(1e4, 3.0, size=10_000)
+    blocks = np.array_split(values, [1, 17, 4000, 4001])
+
+    merged = RunningStats()
+    for block in blocks:
+        partial = RunningStats()
+        partial.update(block)
+        merged.merge(partial)
+    merged.merge(RunningStats())
+
+    stats = merged.to_dict()
+    assert stats["valid_pixels"] == values.size
+    assert stats["mean_value"] == pytest.approx(values.mean(), rel=1e-12)
+    assert stats["std_value"] == pytest.approx(values.std(), rel=1e-9)
+    assert (stats["min_value"], stats["max_value"]) == (values.min(), values.max())
+
+
+def test_empty_accumulator_reports_no_values():
+    assert RunningStats().to_dict()["mean_value"] is None
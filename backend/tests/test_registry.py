@@ -0,0 +1,124 @@
+"""Tests for the in-process model registry."""
+
+import threading
+
+import numpy as np
+import pandas as pd
+
+from models.model_manager import ModelManager
+from models.registry import ModelRegistry, approximate_size
+
+TRAINING_DATA = pd.DataFrame({"date": pd.date_range("2026-01-01", periods=3), "value": [1.0, 2.0, 3.0]})
+
+
+class SlowModelManager(ModelManager):
+    """Model manager whose loads block until released and are counted."""
+
+    def __init__(self, models_dir):
+        super().__init__(models_dir=str(models_dir))
+        self.release = threading.Event()
+        self.release.set()
+        self.loads = 0
+
+    def load_model(self, *args, **kwargs):
+        self.loads += 1
+        self.release.wait(timeout=10)
+        return super().load_model(*args, **kwargs)
+
+
+def save(manager: ModelManager, dataset: str, size: int) -> np.ndarray:
+    model = np.zeros(size, dtype=np.uint8)
+    assert manager.save_model(dataset, "arima", model, TRAINING_DATA, {"size": size})
+    return model
+
+
+def test_models_are_loaded_once_then_served_from_memory(tmp_path):
+    manager = SlowModelManager(tmp_path)
+    save(manager, "modis", 1000)
+    registry = ModelRegistry(manager, max_bytes=10_000)
+
+    first = registry.get("modis", "arima")
+    second = registry.get("modis", "arima")
+
+    assert first[2] is False and second[2] is True
+    assert first[1] == {"size": 1000}
+    assert second[0] is first[0]
+    assert manager.loads == 1
+    stats = registry.get_stats()
+    assert (stats["hits"], stats["misses"], stats["loads"]) == (1, 1, 1)
+    assert stats["hit_rate"] == 0.5
+    assert registry.get("merra", "arima") is None
+
+
+def test_least_recently_used_models_are_evicted_beyond_the_byte_budget(tmp_path):
+    manager = ModelManager(models_dir=str(tmp_path))
+    for dataset in ("modis", "merra", "alos"):
+        save(manager, dataset, 4000)
+    registry = ModelRegistry(manager, max_bytes=approximate_size(np.zeros(4000, dtype=np.uint8)) * 2)
+
+    registry.get("modis", "arima")
+    registry.get("merra", "arima")
+    registry.get("modis", "arima")  # merra becomes the least recently used
+    registry.get("alos", "arima")
+
+    stats = registry.get_stats()
+    assert {entry["dataset"] for entry in stats["resident"]} == {"modis", "alos"}
+    assert stats["evictions"] == 1
+    assert stats["bytes"] <= stats["max_bytes"]
+
+
+def test_model_larger_than_the_budget_is_not_kept(tmp_path):
+    manager = ModelManager(models_dir=str(tmp_path))
+    save(manager, "modis", 5000)
+    registry = ModelRegistry(manager, max_bytes=1000)
+
+    assert registry.get("modis", "arima") is not None
+    stats = registry.get_stats()
+    assert stats["entries"] == 0 and stats["rejected"] == 1
+
+
+def test_concurrent_requests_share_one_load(tmp_path):
+    manager = SlowModelManager(tmp_path)
+    save(manager, "modis", 1000)
+    registry = ModelRegistry(manager, max_bytes=10_000)
+    manager.release.clear()
+
+    results = [None] * 4
+    threads = [threading.Thread(target=lambda i=i: results.__setitem__(i, registry.get("modis", "arima")))
+               for i in range(4)]
+    for thread in threads:
+        thread.start()
+    while registry.get_stats()["coalesced"] < 3:
+        threading.Event().wait(0.01)
+    manager.release.set()
+    for thread in threads:
+        thread.join()
+
+    assert manager.loads == 1
+    assert all(result[0] is results[0][0] for result in results)
+    stats = registry.get_stats()
+    assert (stats["misses"], stats["coalesced"], stats["loads"]) == (4, 3, 1)
+
+
+def test_models_deleted_by_another_process_are_dropped(tmp_path):
+    registry = ModelRegistry(ModelManager(models_dir=str(tmp_path)), max_bytes=10_000)
+    other_process = ModelManager(models_dir=str(tmp_path))
+    save(other_process, "modis", 1000)
+    assert registry.get("modis", "arima") is not None
+
+    other_process.delete_model("modis", "arima")
+
+    assert registry.get("modis", "arima") is None
+    assert registry.get_stats()["entries"] == 0
+
+
+def test_pruned_versions_are_dropped(tmp_path):
+    manager = ModelManager(models_dir=str(tmp_path), max_versions=1)
+    registry = ModelRegistry(manager, max_bytes=10_000)
+    save(manager, "modis", 1000)
+    registry.get("modis", "arima")
+
+    save(manager, "modis", 1000)  # Prunes version 1
+    registry.get("modis", "arima")
+
+    assert [entry["version"] for entry in registry.get_stats()["resident"]] == [2]
@@ -0,0 +1,100 @@
+"""Tests for the per-model-type artifact format: load(save(model)) must forecast identically."""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from models.serializers import MANIFEST_FILE, save_artifact, load_artifact
+from prediction.predictor import PredictiveModel
+
+
+def training_frame(n: int = 60) -> pd.DataFrame:
+    t = np.arange(n)
+    values = 0.5 + 0.002 * t + 0.1 * np.sin(2 * np.pi * t / 12) + np.random.default_rng(3).normal(0, 0.01, n)
+    return pd.DataFrame({"date": pd.date_range("2024-01-01", periods=n, freq="D"), "value": values})
+
+
+def trained(model_type: str, n: int = 60) -> PredictiveModel:
+    model = PredictiveModel(model_type=model_type, search_workers=1)
+    model.train(training_frame(n), "value", "date")
+    assert model.is_trained
+    return model
+
+
+def round_trip(model: PredictiveModel, directory) -> PredictiveModel:
+    save_artifact(directory, model, training_frame(), {"dataset": "modis", "model_type": model.model_type,
+                                                       "version": 1, "metadata": {}})
+    return load_artifact(directory)[0]
+
+
+def assert_same_forecast(model: PredictiveModel, loaded: PredictiveModel, steps: int = 6):
+    expected, actual = model.predict(steps), loaded.predict(steps)
+    np.testing.assert_allclose(actual["predicted_values"], expected["predicted_values"], rtol=1e-6)
+    assert actual["timestamps"] == expected["timestamps"]
+
+
+@pytest.mark.parametrize("model_type", ["holt_winters", "seasonal_naive", "linear_trend"])
+def test_statistical_round_trip(model_type, tmp_path):
+    model = trained(model_type)
+    loaded = round_trip(model, tmp_path)
+
+    assert type(loaded.model) is type(model.model)
+    assert_same_forecast(model, loaded)
+    np.testing.assert_allclose(loaded.predict(6)["confidence_intervals"]["upper"],
+                               model.predict(6)["confidence_intervals"]["upper"])
+
+
+def test_arima_is_rebuilt_from_its_parameters(tmp_path):
+    pytest.importorskip("statsmodels")
+    model = trained("arima")
+    loaded = round_trip(model, tmp_path)
+
+    np.testing.assert_allclose(loaded.model.params, model.model.params)
+    assert loaded.model.model.order == model.model.model.order
+    assert_same_forecast(model, loaded)
+
+
+def test_lstm_round_trip(tmp_path):
+    pytest.importorskip("tensorflow")
+    model = trained("lstm", n=80)
+    loaded = round_trip(model, tmp_path)
+
+    assert_same_forecast(model, loaded)
+
+
+def test_prophet_round_trip(tmp_path):
+    pytest.importorskip("prophet")
+    model = trained("prophet")
+    loaded = round_trip(model, tmp_path)
+
+    assert_same_forecast(model, loaded)
+
+
+def test_scaler_is_restored_from_its_attributes(tmp_path):
+    from sklearn.preprocessing import MinMaxScaler
+    model = trained("linear_trend")
+    values = model.training_data.to_numpy().reshape(-1, 1)
+    model.scaler = MinMaxScaler().fit(values)
+
+    loaded = round_trip(model, tmp_path)
+
+    assert isinstance(loaded.scaler, MinMaxScaler)
+    np.testing.assert_allclose(loaded.scaler.transform(values), model.scaler.transform(values))
+    np.testing.assert_allclose(loaded.scaler.inverse_transform([[0.5]]), model.scaler.inverse_transform([[0.5]]))
+
+
+def test_nothing_is_pickled(tmp_path):
+    round_trip(trained("holt_winters"), tmp_path)
+    assert not [path for path in tmp_path.rglob("*") if path.suffix in (".pkl", ".pickle")]
+
+
+def test_forecaster_classes_outside_the_allow_list_are_rejected(tmp_path):
+    round_trip(trained("holt_winters"), tmp_path)
+    manifest = json.loads((tmp_path / MANIFEST_FILE).read_text())
+    manifest["estimator"]["class"] = "PredictiveModel"
+    (tmp_path / MANIFEST_FILE).write_text(json.dumps(manifest))
+
+    with pytest.raises(ValueError, match="Unknown forecaster class"):
+        load_artifact(tmp_path)
@@ -0,0 +1,98 @@
+"""Tests for the memory-mapped training data archive."""
+
+import mmap
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from models.series_archive import write_series, read_series, write_frame, read_frame, list_metrics
+
+
+def is_memory_mapped(array: np.ndarray) -> bool:
+    base = array
+    while base is not None:
+        if isinstance(base, (np.memmap, mmap.mmap)):
+            return True
+        base = getattr(base, "base", None)
+    return False
+
+
+@pytest.fixture
+def frame():
+    # Metrics interleaved by date, as extract_time_series_data produces for MERRA
+    return pd.DataFrame({
+        "date": np.repeat(pd.date_range("2024-01-01", periods=5, unit="ns"), 2),
+        "metric": ["GWETTOP", "FRLAND"] * 5,
+        "value": np.arange(10, dtype=float) / 10,
+        "pixels": np.arange(10, dtype=np.int64)
+    })
+
+
+def expected(frame: pd.DataFrame, metric: str = None, tail: int = None) -> pd.DataFrame:
+    rows = frame if metric is None else frame[frame["metric"] == metric]
+    rows = rows if tail is None else rows.tail(tail)
+    return rows.reset_index(drop=True)
+
+
+def test_frame_round_trip_keeps_row_order(frame, tmp_path):
+    entry = write_frame(tmp_path / "archive", frame)
+
+    assert list_metrics(entry) == ["GWETTOP", "FRLAND"]
+    pd.testing.assert_frame_equal(read_frame(tmp_path / "archive", entry), frame, check_dtype=False)
+    pd.testing.assert_frame_equal(read_frame(tmp_path / "archive", entry, tail=3), expected(frame, tail=3),
+                                  check_dtype=False)
+
+
+@pytest.mark.parametrize("metric, tail", [("FRLAND", None), ("GWETTOP", 2), ("GWETTOP", 50)])
+def test_one_metric_or_its_tail_is_read(frame, tmp_path, metric, tail):
+    entry = write_frame(tmp_path / "archive", frame)
+
+    result = read_frame(tmp_path / "archive", entry, metric, tail)
+
+    pd.testing.assert_frame_equal(result, expected(frame, metric, tail), check_dtype=False)
+    assert result["value"].dtype == np.float64
+    assert result["pixels"].dtype == np.int64
+    assert result["date"].dtype == frame["date"].dtype
+
+
+def test_frame_without_metrics_is_one_group(frame, tmp_path):
+    single = frame.drop(columns="metric")
+    entry = write_frame(tmp_path / "archive", single)
+
+    assert list_metrics(entry) == [None]
+    pd.testing.assert_frame_equal(read_frame(tmp_path / "archive", entry, tail=4), expected(single, tail=4))
+
+
+def test_unknown_metric_raises_key_error(frame, tmp_path):
+    entry = write_frame(tmp_path / "archive", frame)
+    with pytest.raises(KeyError):
+        read_frame(tmp_path / "archive", entry, "T2M")
+
+
+def test_single_metric_reads_stay_on_the_memory_maps(frame, tmp_path):
+    entry = write_frame(tmp_path / "archive", frame)
+
+    result = read_frame(tmp_path / "archive", entry, "GWETTOP", tail=3)
+
+    for column in ("date", "value", "pixels"):
+        assert is_memory_mapped(result[column].to_numpy()), column
+
+
+def test_timezone_aware_dates_round_trip(frame, tmp_path):
+    frame["date"] = frame["date"].dt.tz_localize("Europe/Rome")
+    entry = write_frame(tmp_path / "archive", frame)
+
+    result = read_frame(tmp_path / "archive", entry, "FRLAND")
+    pd.testing.assert_series_equal(result["date"], expected(frame, "FRLAND")["date"])
+
+
+def test_series_round_trip_is_memory_mapped(tmp_path):
+    series = pd.Series(np.linspace(0, 1, 8), index=pd.date_range("2024-01-01", periods=8, tz="UTC", unit="ns"),
+                       name="value")
+    entry = write_series(tmp_path, "series", series)
+
+    result = read_series(tmp_path, entry)
+
+    pd.testing.assert_series_equal(result, series, check_freq=False)
+    assert is_memory_mapped(result.to_numpy())
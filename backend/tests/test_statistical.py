@@ -0,0 +1,89 @@
+"""Tests for the NumPy/SciPy statistical forecasters."""
+
+import numpy as np
+import pytest
+
+from prediction.statistical import (StatisticalForecaster, LinearTrendForecaster, SeasonalNaiveForecaster,
+                                    HoltWintersForecaster, detect_season_length, fit_fast_model)
+
+
+def seasonal_series(n: int = 96, period: int = 12, noise: float = 0.1, seed: int = 0) -> np.ndarray:
+    t = np.arange(n)
+    rng = np.random.default_rng(seed)
+    return 10 + 0.05 * t + 2 * np.sin(2 * np.pi * t / period) + rng.normal(0, noise, n)
+
+
+def test_base_class_cannot_be_instantiated():
+    with pytest.raises(TypeError):
+        StatisticalForecaster()
+
+
+def test_season_length_is_detected_from_the_autocorrelation():
+    assert detect_season_length(seasonal_series()) == 12
+    assert detect_season_length(np.random.default_rng(1).normal(size=96)) is None
+    assert detect_season_length(np.arange(3, dtype=float)) is None
+
+
+def test_linear_trend_matches_ordinary_least_squares():
+    sm = pytest.importorskip("statsmodels.api")
+    values = 2 + 0.5 * np.arange(30) + np.random.default_rng(2).normal(0, 1, 30)
+
+    model = LinearTrendForecaster().fit(values)
+    mean, lower, upper = model.forecast(5, alpha=0.1)
+
+    design = sm.add_constant(np.arange(30, dtype=float))
+    expected = sm.OLS(values, design).fit().get_prediction(
+        sm.add_constant(np.arange(30, 35, dtype=float), has_constant="add")).summary_frame(alpha=0.1)
+    np.testing.assert_allclose(mean, expected["mean"])
+    np.testing.assert_allclose(lower, expected["obs_ci_lower"])
+    np.testing.assert_allclose(upper, expected["obs_ci_upper"])
+
+
+def test_seasonal_naive_repeats_the_last_season_with_stepwise_wider_intervals():
+    values = np.tile([1.0, 2.0, 3.0, 4.0], 5) + np.repeat([0.0, 0.1, -0.1, 0.2, 0.0], 4)
+
+    model = SeasonalNaiveForecaster(season_length=4).fit(values)
+    mean, variance = model._forecast_moments(8)
+
+    np.testing.assert_allclose(mean, np.tile(values[-4:], 2))
+    np.testing.assert_allclose(variance[4:], 2 * variance[:4])
+    assert model.label == "SeasonalNaive(m=4)"
+    assert SeasonalNaiveForecaster().fit(values).label == "Naive"
+    with pytest.raises(ValueError):
+        SeasonalNaiveForecaster(season_length=4).fit(values[:4])
+
+
+def test_holt_winters_tracks_trend_and_season():
+    values = seasonal_series(n=108)
+    model = HoltWintersForecaster(season_length=12).fit(values[:96])
+    mean, lower, upper = model.forecast(12)
+
+    assert np.max(np.abs(mean - values[96:])) < 0.6
+    assert np.all(lower < mean) and np.all(mean < upper)
+    assert np.all(np.diff(upper - lower) >= -1e-12)
+    assert 0 < model.alpha < 1 and model.beta <= model.alpha and model.gamma <= 1 - model.alpha
+
+
+def test_holt_winters_needs_two_seasons():
+    with pytest.raises(ValueError):
+        HoltWintersForecaster(season_length=12).fit(seasonal_series(n=20))
+
+
+def test_auto_selection_prefers_the_lowest_score():
+    model, details = fit_fast_model("fast", seasonal_series())
+
+    assert details["season_length"] == 12
+    assert set(details["scores"]) == {"holt_winters", "seasonal_naive", "linear_trend"}
+    assert model.name != "linear_trend"
+    assert details["scores"][model.name] == min(score for score in details["scores"].values() if score is not None)
+
+
+def test_requested_model_falls_back_to_its_non_seasonal_variant():
+    model, details = fit_fast_model("holt_winters", seasonal_series(n=20), season_length=12)
+    assert model.m == 1
+    assert list(details["scores"]) == ["holt_winters"]
+
+
+def test_too_short_series_is_rejected():
+    with pytest.raises(ValueError, match="Could not fit"):
+        fit_fast_model("fast", np.array([1.0]))
@@ -0,0 +1,151 @@
+"""Tests for the MOD13Q1 vegetation index engine, using in-memory tiles instead of HDF4 files."""
+
+import numpy as np
+import pytest
+
+from data_loaders import vegetation_index
+from data_loaders.hdf4_reader import encoding_mismatches
+from data_loaders.vegetation_index import VegetationIndexEngine
+
+
+class InMemoryTileReader:
+    """Stands in for Hdf4TileReader with layers held as arrays and optional per-layer attributes."""
+
+    backend = "memory"
+    layers = {}
+    layer_attributes = {}
+
+    def __init__(self, hdf_file):
+        self.hdf_file = hdf_file
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        pass
+
+    def available_layers(self):
+        return list(self.layers)
+
+    def shape(self, layer):
+        return list(self.layers[layer].shape)
+
+    def check_encoding(self, layer):
+        return encoding_mismatches(layer, self.layer_attributes.get(layer, {}))
+
+    def read_rows(self, layer, row_start, row_stop):
+        return self.layers[layer][row_start:row_stop]
+
+
+@pytest.fixture
+def tile(monkeypatch):
+    """Install InMemoryTileReader in the engine; tests fill in its layers."""
+    monkeypatch.setattr(InMemoryTileReader, "layers", {})
+    monkeypatch.setattr(InMemoryTileReader, "layer_attributes", {})
+    monkeypatch.setattr(vegetation_index, "Hdf4TileReader", InMemoryTileReader)
+    return InMemoryTileReader
+
+
+def test_modis_scale_divisor_and_product_fill_values_match():
+    assert encoding_mismatches("NDVI", {"scale_factor": 10000.0, "_FillValue": -3000}) == []
+    assert encoding_mismatches("NDVI", {"scale_factor": "0.0001", "_FillValue": "-3000"}) == []
+    assert encoding_mismatches("VI_Quality", {"scale_factor": 1.0, "_FillValue": 65535}) == []
+    assert encoding_mismatches("Red", {}) == []
+
+
+def test_other_encodings_are_reported():
+    mismatches = encoding_mismatches("EVI", {"scale_factor": 1000.0, "_FillValue": -32768})
+    assert len(mismatches) == 2
+    assert "scale_factor" in mismatches[0] and "_FillValue" in mismatches[1]
+
+
+def test_file_with_unexpected_encoding_is_rejected(tile, tmp_path):
+    tile.layers = {"NDVI": np.full((2, 2), 5000, dtype=np.int16)}
+    tile.layer_attributes = {"NDVI": {"scale_factor": 10000.0, "_FillValue": -32768}}
+
+    with pytest.raises(ValueError, match="_FillValue"):
+        VegetationIndexEngine().process_file(tmp_path / "tile.hdf")
+
+
+def test_file_with_product_encoding_is_processed(tile, tmp_path):
+    tile.layers = {"NDVI": np.array([[5000, -3000], [2500, 7500]], dtype=np.int16)}
+    tile.layer_attributes = {"NDVI": {"scale_factor": 10000.0, "_FillValue": -3000}}
+
+    ndvi = VegetationIndexEngine().process_file(tmp_path / "tile.hdf")["vegetation_indices"]["NDVI"]
+    assert ndvi["valid_pixels"] == 3
+    assert ndvi["masked_pixels"]["fill"] == 1
+    assert ndvi["mean_value"] == pytest.approx(0.5)
+
+
+def vi_quality(modland=0, usefulness=0, mixed_clouds=False, snow_ice=False, shadow=False):
+    """Build a VI_Quality word from its bit fields."""
+    return modland | (usefulness << 2) | (mixed_clouds << 10) | (snow_ice << 14) | (shadow << 15)
+
+
+def rejected_counters():
+    return {"modland_qa": 0, "vi_usefulness_flags": 0, "pixel_reliability": 0}
+
+
+def test_quality_mask_decodes_vi_quality_bits():
+    words = np.array([
+        vi_quality(),                           # good
+        vi_quality(modland=1, usefulness=12),   # check other QA, still usable
+        vi_quality(modland=1, usefulness=13),   # usefulness past the limit
+        vi_quality(modland=2),                  # cloudy
+        vi_quality(modland=3, shadow=True),     # not produced; counted once, under MODLAND
+        vi_quality(mixed_clouds=True),
+        vi_quality(snow_ice=True),
+        vi_quality(shadow=True),
+    ], dtype=np.uint16)
+    rejected = rejected_counters()
+
+    mask = VegetationIndexEngine().quality_mask(words, None, rejected)
+
+    assert mask.tolist() == [True, True, False, False, False, False, False, False]
+    assert rejected == {"modland_qa": 2, "vi_usefulness_flags": 4, "pixel_reliability": 0}
+
+
+def test_quality_mask_flag_filters_can_be_disabled():
+    words = np.array([vi_quality(mixed_clouds=True), vi_quality(snow_ice=True), vi_quality(shadow=True)],
+                     dtype=np.uint16)
+    engine = VegetationIndexEngine(exclude_mixed_clouds=False, exclude_snow_ice=False, exclude_shadow=True)
+
+    assert engine.quality_mask(words, None, rejected_counters()).tolist() == [True, True, False]
+
+
+def test_quality_mask_combines_pixel_reliability():
+    words = np.array([vi_quality()] * 4 + [vi_quality(modland=2)], dtype=np.uint16)
+    reliability = np.array([0, 1, 2, -1, 3], dtype=np.int8)
+    rejected = rejected_counters()
+
+    mask = VegetationIndexEngine().quality_mask(words, reliability, rejected)
+
+    assert mask.tolist() == [True, True, False, False, False]
+    # The cloudy pixel was already rejected by MODLAND QA
+    assert rejected == {"modland_qa": 1, "vi_usefulness_flags": 0, "pixel_reliability": 2}
+
+
+def test_tile_statistics_use_only_pixels_passing_qa(tile, tmp_path):
+    tile.layers = {
+        "NDVI": np.array([[1000, 2000, 3000], [4000, -3000, 9000]], dtype=np.int16),
+        "VI_Quality": np.array([[vi_quality(), vi_quality(modland=1), vi_quality()],
+                                [vi_quality(), vi_quality(), vi_quality(mixed_clouds=True)]], dtype=np.uint16),
+        "pixel_reliability": np.array([[0, 0, 3], [1, -1, 0]], dtype=np.int8),
+    }
+
+    # One-row strips exercise accumulation across strips
+    result = VegetationIndexEngine(memory_budget_bytes=1).process_file(tmp_path / "tile.hdf")
+    ndvi = result["vegetation_indices"]["NDVI"]
+
+    assert result["strip_rows"] == 1
+    assert ndvi["valid_pixels"] == 3
+    assert ndvi["min_value"] == pytest.approx(0.1)
+    assert ndvi["max_value"] == pytest.approx(0.4)
+    assert ndvi["mean_value"] == pytest.approx(np.mean([0.1, 0.2, 0.4]))
+    assert ndvi["std_value"] == pytest.approx(np.std([0.1, 0.2, 0.4]))
+    assert ndvi["percentiles"]["p50"] == pytest.approx(0.2)
+    assert sum(ndvi["histogram"]["counts"]) == 3
+    assert ndvi["masked_pixels"]["fill"] == 1
+    assert result["quality_layers"]["VI_Quality"]["value_counts"] == {0: 5, 1: 1}
+    assert result["quality_layers"]["pixel_reliability"]["value_counts"] == \
+        {"fill": 1, "good": 3, "marginal": 1, "cloudy": 1}